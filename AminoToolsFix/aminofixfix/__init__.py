@@ -9,7 +9,7 @@ from .lib import exceptions, helpers, objects, headers
 from threading import Thread
 def work():
     try:
-        from json import loads
+        from .lib.jsonlib import loads
         from urllib.request import urlopen
         from pkg_resources import parse_version as version
 
@@ -1,13 +1,15 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
-from json import dumps
+from .lib.jsonlib import dumps
 from typing import BinaryIO
 
 from .client import Client
 from .lib.helpers import inttime
+from .lib.schema import follow_client_settings
 from .lib import exceptions, headers, objects
 
+@follow_client_settings
 class ACM(Client):
     """
     ACM is community manager.
@@ -16,7 +18,8 @@ class ACM(Client):
     """
     def __init__(
             self, mainClient: Client,
-            comId: str = None, aminoId: str = None, **kwargs
+            comId: str = None, aminoId: str = None,
+            share_session: bool = True, **kwargs
         ):
         """
         Init subclient.
@@ -27,6 +30,9 @@ class ACM(Client):
         - aminoId: str | None
             - you can pass only one thing
             - comId will be taken first
+        - share_session: bool = True
+            - should ACM send requests through connection pool of main client?
+            - False to make own pool (own TCP/TLS connections)
 
     
         
@@ -38,9 +44,19 @@ class ACM(Client):
             self, deviceId=mainClient.device_id, proxies=mainClient.proxies,
             autoDevice=mainClient.autoDevice, userAgent=mainClient.user_agent,
             http2_enabled=mainClient.http2_enabled,
+            max_concurrent_streams=mainClient.max_concurrent_streams,
             own_timeout=mainClient.timeout_settings,
             socket_enabled=False,
-            api_library=mainClient.api_library or objects.APILibraries.HTTPX
+            api_library=mainClient.api_library or objects.APILibraries.HTTPX,
+            retry_policy=mainClient.retry_policy,
+            rate_limit=mainClient.rate_limit,
+            singleflight=mainClient.singleflight,
+            cache=mainClient.cache,
+            entity_store=mainClient.entity_store,
+            retain_raw=mainClient.retain_raw,
+            identity_map=mainClient.identity_map,
+            session=mainClient.session if share_session else None,
+            api=mainClient.api
         )
 
         self.profile = mainClient.profile
@@ -1,13 +1,15 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
-from json import dumps
+from ..lib.jsonlib import dumps
 from typing import BinaryIO
 
 from . import client
 from ..lib.helpers import inttime
+from ..lib.schema import follow_client_settings
 from ..lib import exceptions, headers, objects
 
+@follow_client_settings
 class ACM(client.Client):
     def __init__(self, profile: objects.UserProfile, comId: str = None, proxies: dict = None):
         client.Client.__init__(self)
@@ -1,23 +1,31 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
-from time import sleep
-from json import dumps
+from asyncio import sleep, create_task
+from ..lib.jsonlib import dumps
 from typing import BinaryIO
-from threading import Thread
 from httpx import Timeout as TimeoutConfig
 
 from .socket import Callbacks, SocketHandler
-from ..lib import exceptions, headers, objects, helpers
+from ..lib import exceptions, headers, objects, helpers, timeouts
+from ..lib.retry import RetryPolicy
+from ..lib.ratelimit import RateLimit
+from ..lib.singleflight import Singleflight
+from ..lib.cache import ResponseCache
+from ..lib.entity_store import EntityStore
+from ..lib.schema import follow_client_settings
+from ..lib.identity_map import IdentityMap
 from ..lib.facades import AiohttpClient, AiohttpResponse, AsyncHttpxClient
 from ..lib.helpers import gen_deviceId, inttime, clientrefid, str_uuid4, bytes_to_b64, LOCAL_TIMEZONE
 
+@follow_client_settings
 class Client(Callbacks, SocketHandler):
     def __init__(
         self,
         deviceId: str = None, userAgent: str = None, proxies: dict = None,
         socket_trace = False, socketDebugging = False, socket_enabled = True,
         autoDevice = False, http2_enabled: bool = True,
+        max_concurrent_streams: int | None = None,
         
         disable_timeout: bool = False,
         default_timeout: int | None = 30, own_timeout: TimeoutConfig | None = None,
@@ -25,14 +33,37 @@ class Client(Callbacks, SocketHandler):
         connect_timeout: int | None = None, pool_timeout: int | None = None,
         read_timeout: int | None = None, write_timeout: int | None= None,
 
-        api_library: objects.APILibraries = objects.APILibraries.HTTPX
+        api_library: objects.APILibraries = objects.APILibraries.HTTPX,
+
+        # only for aiohttp
+        connection_limit: int = 100, connection_limit_per_host: int = 0,
+        dns_cache_ttl: int | None = 300, keepalive_timeout: float = 30,
+
+        retry_policy: RetryPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        singleflight: Singleflight | bool | None = None,
+        cache: ResponseCache | bool | None = None,
+        entity_store: EntityStore | str | None = None,
+        retain_raw: bool | None = None,
+        identity_map: IdentityMap | bool = False,
+        session: AsyncHttpxClient | AiohttpClient | None = None,
+        api: str | None = None
     ):
-        self.api = "https://service.aminoapps.com/api/v1"
+        self.api = api or "https://service.aminoapps.com/api/v1"
         self.proxies = proxies
         self.configured = False
         self.authenticated = False
         self.autoDevice = autoDevice
         self.api_library = api_library
+        self.http2_enabled = http2_enabled
+        self.max_concurrent_streams = max_concurrent_streams
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.rate_limit = rate_limit
+        self.singleflight = Singleflight() if singleflight is True else singleflight or None
+        self.cache = ResponseCache() if cache is True else cache or None
+        self.entity_store = EntityStore(entity_store) if isinstance(entity_store, str) else entity_store
+        self.retain_raw = retain_raw
+        self.identity_map = IdentityMap() if identity_map is True else identity_map or None
         self.socket_enabled = socket_enabled
         self.device_id = deviceId if deviceId else gen_deviceId()
         self.user_agent = userAgent if userAgent else helpers.gen_userAgent()
@@ -53,21 +84,39 @@ class Client(Callbacks, SocketHandler):
         
         if self.api_library == objects.APILibraries.REQUESTS:
             raise Exception("You cant use requests in async client. Requests is sync library.")
+        elif session is not None:
+            self.session = session
         elif self.api_library == objects.APILibraries.AIOHTTP:
             self.session = AiohttpClient(
                 headers=headers.BASIC_HEADERS,
-                http2=http2_enabled,
+                http2_enabled=http2_enabled,
+                max_concurrent_streams=max_concurrent_streams,
                 base_url=self.api,
                 proxies=proxies,
-                timeout=self.timeout_settings
+                timeout=self.timeout_settings,
+                retry_policy=self.retry_policy,
+                rate_limit=self.rate_limit,
+                singleflight=self.singleflight,
+                cache=self.cache,
+                entity_store=self.entity_store,
+                connection_limit=connection_limit,
+                connection_limit_per_host=connection_limit_per_host,
+                dns_cache_ttl=dns_cache_ttl,
+                keepalive_timeout=keepalive_timeout
             )
         else:
             self.session = AsyncHttpxClient(
                 headers=headers.BASIC_HEADERS,
-                http2=http2_enabled,
+                http2_enabled=http2_enabled,
+                max_concurrent_streams=max_concurrent_streams,
                 base_url=self.api,
                 proxies=proxies,
-                timeout=self.timeout_settings
+                timeout=self.timeout_settings,
+                retry_policy=self.retry_policy,
+                rate_limit=self.rate_limit,
+                singleflight=self.singleflight,
+                cache=self.cache,
+                entity_store=self.entity_store
             )
             
         if self.socket_enabled:
@@ -82,6 +131,7 @@ class Client(Callbacks, SocketHandler):
 
         self.stop_loop = False
         self.active_live_chats = []
+        self.vc_tasks = set()
 
     def additional_headers(self, data: str = None, content_type: str = None):
         return headers.additionals(
@@ -93,6 +143,19 @@ class Client(Callbacks, SocketHandler):
             deviceId=gen_deviceId() if self.autoDevice else self.device_id
         )
 
+    def deadline(self, seconds: float | None):
+        """
+        Deadline for all requests inside `with` block (retries and waiting for rate limit included).
+
+        ```python
+        with client.deadline(5):
+            await client.get_user_info(userId)
+        ```
+
+        Tasks made inside block inherit the deadline too.
+        """
+        return timeouts.deadline(seconds)
+
     async def activity_status(self, status: str):
         if "on" in status.lower(): status = 1
         elif "off" in status.lower(): status = 2
@@ -129,7 +192,7 @@ class Client(Callbacks, SocketHandler):
             "t": 112
         }
         data = dumps(data)
-        self.send(data)
+        await self.send(data)
 
     async def join_video_chat(self, comId: str, chatId: str, joinType: int = 1):
         """
@@ -152,7 +215,7 @@ class Client(Callbacks, SocketHandler):
             "t": 108
         }
         data = dumps(data)
-        self.send(data)
+        await self.send(data)
 
     async def join_video_chat_as_viewer(self, comId: str, chatId: str):
         data = {
@@ -166,7 +229,7 @@ class Client(Callbacks, SocketHandler):
             "t": 112
         }
         data = dumps(data)
-        self.send(data)
+        await self.send(data)
     
     # Fixed by vedansh#4039
     async def leave_from_live_chat(self, chatId: str):
@@ -185,8 +248,8 @@ class Client(Callbacks, SocketHandler):
                 "t": 112
             }
             data = dumps(data)
-            self.send(data)
-            sleep(60)
+            await self.send(data)
+            await sleep(60)
             if self.stop_loop:
                 break
 
@@ -201,7 +264,7 @@ class Client(Callbacks, SocketHandler):
             "t": 112
         }
         data = dumps(data)
-        self.send(data)
+        await self.send(data)
         data = {
             "o": {
                 "ndcId": int(comId),
@@ -212,9 +275,11 @@ class Client(Callbacks, SocketHandler):
             "t": 108
         }
         data = dumps(data)
-        self.send(data)
+        await self.send(data)
         self.active_live_chats.append(chatId)
-        Thread(target=lambda: self.run_vc(comId, chatId, joinType)).start()
+        task = create_task(self.run_vc(comId, chatId, joinType))
+        self.vc_tasks.add(task)
+        task.add_done_callback(self.vc_tasks.discard)
 
     async def end_vc(self, comId: str, chatId: str, joinType: int = 2):
         self.leave_from_live_chat(chatId)
@@ -228,7 +293,7 @@ class Client(Callbacks, SocketHandler):
             "t": 112
         }
         data = dumps(data)
-        self.send(data)
+        await self.send(data)
         self.active_live_chats.remove(chatId)
         self.stop_loop = True
 
@@ -248,7 +313,7 @@ class Client(Callbacks, SocketHandler):
         self.profile: objects.UserProfile = await self.get_user_info(uId)
 
         if self.socket_enabled:
-            self.run_amino_socket()
+            await self.run_amino_socket()
 
     async def login(self, email: str, password: str, client_type: int = 100):
         """
@@ -287,7 +352,7 @@ class Client(Callbacks, SocketHandler):
             self.secret = self.json.get("secret")
 
             if self.socket_enabled:
-                self.run_amino_socket()
+                await self.run_amino_socket()
 
             return response.json()
 
@@ -316,7 +381,7 @@ class Client(Callbacks, SocketHandler):
         })
 
         response = await self.session.post(f"/g/s/auth/login", headers=self.additional_headers(data=data), data=data)
-        self.run_amino_socket()
+        await self.run_amino_socket()
         if response.status_code != 200: exceptions.CheckException(response)
 
         else:
@@ -330,7 +395,7 @@ class Client(Callbacks, SocketHandler):
             self.secret = self.json["secret"]
 
             if self.socket_enabled:
-                self.run_amino_socket()
+                await self.run_amino_socket()
 
             return response.json()
 
@@ -356,7 +421,7 @@ class Client(Callbacks, SocketHandler):
         })
 
         response = await self.session.post(f"/g/s/auth/login", headers=self.additional_headers(data=data), data=data)
-        self.run_amino_socket()
+        await self.run_amino_socket()
         if response.status_code != 200: exceptions.CheckException(response)
 
         else:
@@ -369,7 +434,7 @@ class Client(Callbacks, SocketHandler):
             self.profile: objects.UserProfile = objects.UserProfile(self.json["userProfile"]).UserProfile
 
             if self.socket_enabled:
-                self.run_amino_socket()
+                await self.run_amino_socket()
 
             return response.json()
 
@@ -477,7 +542,7 @@ class Client(Callbacks, SocketHandler):
             self.profile: None
 
             if self.socket_enabled:
-                self.close()
+                await self.close()
 
             return response.status_code
 
@@ -845,11 +910,18 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <aminofixfix.lib.exceptions>`
         """
+        if self.entity_store:
+            stored = await self.entity_store.get_async("user", userId, viewer=self.userId)
+            if stored is not None:
+                return objects.shared_profile(stored)
+
         response = await self.session.get(f"/g/s/user-profile/{userId}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfile(response.json()["userProfile"]).UserProfile
+            if self.entity_store:
+                await self.entity_store.put_async("user", userId, response.json()["userProfile"], viewer=self.userId)
+            return objects.shared_profile(response.json()["userProfile"])
 
     async def watch_ad(self, userId: str = None):
         data = headers.Tapjoy.Data(userId or self.userId)
@@ -1018,7 +1090,7 @@ class Client(Callbacks, SocketHandler):
         else:
             return response.status_code
 
-    async def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None):
+    async def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None, fields: list[str] | None = None):
         """
         List of Messages from an Chat.
 
@@ -1027,6 +1099,7 @@ class Client(Callbacks, SocketHandler):
             - *size* : Size of the list.
             - *size* : Size of the list.
             - *pageToken* : Next Page Token.
+            - *fields* : Only these fields of messages are parsed (like ["messageId", "content"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`Message List <aminofixfix.lib.objects.MessageList>`
@@ -1040,7 +1113,7 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.GetMessages(response.json()).GetMessages
+            return objects.GetMessages(response.json(), fields).GetMessages
 
     async def get_message_info(self, chatId: str, messageId: str):
         """
@@ -1073,10 +1146,17 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <aminofixfix.lib.exceptions>`
         """
+        if self.entity_store:
+            stored = await self.entity_store.get_async("community", comId, viewer=self.userId)
+            if stored is not None:
+                return objects.Community(stored).Community
+
         response = await self.session.get(f"/g/s-x{comId}/community/info?withInfluencerList=1&withTopicList=true&influencerListOrderStrategy=fansCount", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
+            if self.entity_store:
+                await self.entity_store.put_async("community", comId, response.json()["community"], viewer=self.userId)
             return objects.Community(response.json()["community"]).Community
 
     async def search_community(self, aminoId: str):
@@ -1100,7 +1180,7 @@ class Client(Callbacks, SocketHandler):
             if len(response) == 0: raise exceptions.CommunityNotFound(aminoId)
             else: return objects.CommunityList([com["refObject"] for com in response]).CommunityList
 
-    async def get_user_following(self, userId: str, start: int = 0, size: int = 25):
+    async def get_user_following(self, userId: str, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         List of Users that the User is Following.
 
@@ -1108,6 +1188,7 @@ class Client(Callbacks, SocketHandler):
             - **userId** : ID of the User.
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User List <aminofixfix.lib.objects.UserProfileList>`
@@ -1118,9 +1199,9 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfileList(response.json()["userProfileList"]).UserProfileList
+            return objects.UserProfileList(response.json()["userProfileList"], fields).UserProfileList
 
-    async def get_user_followers(self, userId: str, start: int = 0, size: int = 25):
+    async def get_user_followers(self, userId: str, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         List of Users that are Following the User.
 
@@ -1128,6 +1209,7 @@ class Client(Callbacks, SocketHandler):
             - **userId** : ID of the User.
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User List <aminofixfix.lib.objects.UserProfileList>`
@@ -1138,7 +1220,7 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfileList(response.json()["userProfileList"]).UserProfileList
+            return objects.UserProfileList(response.json()["userProfileList"], fields).UserProfileList
 
     async def get_user_visitors(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -2358,10 +2440,17 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <aminofixfix.lib.exceptions>`
         """
+        if self.entity_store:
+            stored = await self.entity_store.get_async("link", code, viewer=self.userId)
+            if stored is not None:
+                return objects.FromCode(stored).FromCode
+
         response = await self.session.get(f"/g/s/link-resolution?q={code}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
+            if self.entity_store:
+                await self.entity_store.put_async("link", code, response.json()["linkInfoV2"], viewer=self.userId)
             return objects.FromCode(response.json()["linkInfoV2"]).FromCode
 
     async def get_from_id(self, objectId: str, objectType: int, comId: str = None):
@@ -2447,13 +2536,14 @@ class Client(Callbacks, SocketHandler):
         else:
             return response.json()["storeSubscriptionItemList"]
 
-    async def get_all_users(self, start: int = 0, size: int = 25):
+    async def get_all_users(self, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         Get list of users of Amino.
 
         **Parameters**
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User Profile Count List Object <aminofixfix.lib.objects.UserProfileCountList>`
@@ -2464,7 +2554,7 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfileCountList(response.json()).UserProfileCountList
+            return objects.UserProfileCountList(response.json(), fields).UserProfileCountList
 
     async def accept_host(self, chatId: str, requestId: str):
         data = dumps({})
@@ -1,36 +1,65 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
-import ssl
-import websocket
-from time import sleep
-from random import randint
-from json import loads, dumps
+from time import monotonic
+from random import randint, random
 from datetime import datetime as dt
+from inspect import isawaitable
+from asyncio import Task, Lock, sleep, wait_for, create_task, ensure_future, current_task, CancelledError
 
-from threading import Thread
-from sys import _getframe as getframe
 
 from ..lib import objects, helpers
+from ..lib.jsonlib import loads, dumps
 from ..lib.helpers import gen_deviceId, inttime
+from ..lib.schema import parse_settings, client_settings
+from ..lib.facades.unsuccessful_import import AIOHTTP_TEXT
+
+# same payload as official app sends in pings
+PING_PAYLOAD = dumps({"t": 116, "o": {"threadChannelUserInfoList": []}})
 
 class SocketHandler:
+    '''
+        Socket of Amino on asyncio (aiohttp websocket).
+
+        Everything runs in event loop of client: frames are read by one task,
+        pings and reconnects are tasks too, `send` and `close` are awaitable.
+
+        Connection is supervised: every `reconnectTime` seconds or when connection is lost,
+        new connection is opened first, sending is switched to it once it is live,
+        and only after `drainTime` old one is closed.
+        Messages that came by both connections in this time are handled once, other frames are taken from new one.
+        Failed connects are retried with exponential backoff (up to `backoffMax` seconds).
+        Set `pongTimeout` (seconds) to reconnect also when pong wasn't received for so long,
+        it is off by default, as not every server (or proxy) answers pings.
+    '''
     def __init__(self, client, socket_trace: bool = False, debug: bool = False):
         self.socket_url = f"wss://ws{randint(1,4)}.aminoapps.com"
         self.debug = debug
+        self.socket_trace = socket_trace
         self.socket = None
         self.active = False
         self.headers = None
         self.proxies = None
         self.client = client
         self.reconnectTime = 180
-        self.socket_thread = None
-
-        if self.socket_enabled:
-            self.reconnect_thread = Thread(target=self.reconnect_handler)
-            self.reconnect_thread.start()
-
-        websocket.enableTrace(socket_trace)
+        self.pongTimeout: float | None = None
+        self.connectTimeout = 10
+        self.drainTime = 2
+        self.backoffMax = 60
+        self.pingInterval = 10
+        self.socket_session = None
+        self.socket_task: Task | None = None
+        self.ping_task: Task | None = None
+        self.reconnect_task: Task | None = None
+        self.reconnect_lock: Lock | None = None
+        self.connected_at = 0.0
+        self.last_pong = 0.0
+        self.failures = 0
+        # while old and new connections are both open: IDs of messages that were already handled
+        # and connection that is replaced
+        self.handover = False
+        self.handover_seen = {}
+        self.handover_from = None
 
     def new_socket_url(self):
         self.socket_url = f"wss://ws{randint(1,4)}.aminoapps.com"
@@ -39,38 +68,134 @@ class SocketHandler:
         if self.debug is True:
             print("[SOCKET: {}] ({})".format(status, dt.now().strftime('%Y-%m-%d %H:%M:%S')), text)
 
-    def reconnect_handler(self):
+    def reconnect_reason(self) -> str | None:
+        if self.socket is None or self.socket.closed or self.socket_task is None or self.socket_task.done():
+            return "connection is lost"
+        now = monotonic()
+        if self.pongTimeout and now - self.last_pong > self.pongTimeout:
+            return f"no pong for {self.pongTimeout}s"
+        if now - self.connected_at > self.reconnectTime:
+            return "reconnect time"
+        return None
+
+    async def reconnect_handler(self):
         # Made by enchart#3410 thx
         # Fixed by The_Phoenix#3967
         while True:
-            sleep(self.reconnectTime)
-
-            if self.active:
-                self.close()
-                self.socket_log("Reconnecting...")
-                
-                self.run_amino_socket()
-
-    def ws_run_forever(self):
-        self.socket.run_forever(
-            sslopt={"cert_reqs": ssl.CERT_NONE},
-            skip_utf8_validation=True,
-            ping_interval=10,
-            ping_payload=dumps({"t": 116, "o": {"threadChannelUserInfoList": []}})
-        )
+            await sleep(1)
+            if not self.active:
+                continue
+            reason = self.reconnect_reason()
+            if reason is None:
+                continue
+
+            self.socket_log(f"Reconnecting ({reason})...")
+            if not await self.reconnect(only_if_needed=True):
+                # 1, 2, 4... seconds, with jitter so clients don't reconnect all at once
+                delay = min(self.backoffMax, 2 ** min(self.failures - 1, 16)) * (0.5 + random() / 2)
+                self.socket_log(f"Reconnect failed {self.failures} times, next try in {delay:.1f}s", "WARNING")
+                await sleep(delay)
+
+    async def reconnect(self, only_if_needed: bool = False) -> bool:
+        '''
+            Make-before-break: open new connection, switch to it, then drain and close old one.
+
+            Args:
+            - only_if_needed: bool = False
+                - do nothing (and return True) if connection is healthy once lock is taken
+                - used by `reconnect_handler`, when other reconnect already replaced connection it saw
+        '''
+        if self.reconnect_lock is None:
+            self.reconnect_lock = Lock()
+        async with self.reconnect_lock:
+            # socket was closed (`close`) or other reconnect already replaced connection
+            if not self.active or only_if_needed and self.reconnect_reason() is None:
+                return True
+            old = (self.socket, self.socket_task, self.ping_task)
+            self.handover = True
+            self.handover_seen = {}
+            self.handover_from = old[0]
+            try:
+                if not await self.connect():
+                    return False
+                if old[0] is not None and not old[0].closed:
+                    # old connection still delivers frames that were sent before new one was open
+                    await sleep(self.drainTime)
+                await self.close_socket(*old)
+                return True
+            finally:
+                self.handover = False
+                self.handover_seen = {}
+                self.handover_from = None
+
+    async def ping_handler(self, socket):
+        while True:
+            await sleep(self.pingInterval)
+            if socket.closed:
+                return
+            try:
+                await socket.ping(PING_PAYLOAD.encode("utf-8"))
+            except ConnectionError:
+                return
+
+    async def receive_handler(self, socket):
+        from aiohttp import WSMsgType
+
+        try:
+            async for message in socket:
+                if self.socket_trace:
+                    print(f"[SOCKET: TRACE] {message.type.name}: {message.data}")
+                if message.type == WSMsgType.TEXT:
+                    try:
+                        self.handle_message(socket, message.data)
+                    except Exception as e:
+                        # error in one frame (or handler) doesn't stop reading
+                        self.handle_error(socket, e)
+                elif message.type == WSMsgType.PING:
+                    await socket.pong(message.data)
+                elif message.type == WSMsgType.PONG:
+                    if socket is self.socket:
+                        self.last_pong = monotonic()
+                elif message.type == WSMsgType.ERROR:
+                    self.handle_error(socket, socket.exception())
+        except CancelledError:
+            raise
+        except Exception as e:
+            self.handle_error(socket, e)
+        self.handle_close(socket, socket.close_code, None)
 
     def handle_message(self, ws, data):
+        if self.handover:
+            frame = loads(data)
+            if self.handled_before(ws, frame):
+                return
+            self.client.resolve_frame(frame)
+            return
+
         self.client.handle_socket_message(data)
         return
 
-    def send(self, data):
+    def handled_before(self, ws, frame: dict) -> bool:
+        # same message from old and new connection
+        message = frame["o"].get("chatMessage") if frame.get("t") == 1000 else None
+        key = message.get("messageId") if isinstance(message, dict) else None
+        if key is None:
+            # frames without ID can really repeat (typing and other actions), so they are not compared:
+            # once new connection is live, they are taken only from it
+            return ws is self.handover_from and ws is not self.socket
+        if key in self.handover_seen:
+            return True
+        self.handover_seen[key] = True
+        return False
+
+    async def send(self, data):
         self.socket_log(f"Sending data: {data}")
-        
-        if not self.socket_thread:
-            self.run_amino_socket()
-            sleep(5)
 
-        self.socket.send(data)
+        if self.socket is None or self.socket.closed:
+            await self.run_amino_socket()
+
+        await self.socket.send_str(data)
+
     def handle_error(self, ws, err):
         self.socket_log(
             "Critical error in socket/lib/your code: {} | Socket URL: {}".format(
@@ -78,7 +203,7 @@ class SocketHandler:
             ),
             "ERROR"
         )
-                
+
     def handle_close(self, ws, close_code, close_msg):
         self.socket_log(
             "Socket {} closed: '{} = {}'!".format(
@@ -87,50 +212,81 @@ class SocketHandler:
             "WARNING"
         )
 
-    def run_amino_socket(self):
-        try:
-            if self.client.sid is None:
-                return
+    async def connect(self) -> bool:
+        '''
+            Open new connection and switch to it once it is live. Old one (if any) is not closed.
+        '''
+        from aiohttp import ClientSession
 
-            device = gen_deviceId() if self.client.autoDevice else self.client.device_id
+        if self.client.sid is None:
+            return False
 
-            final = f"{device}|{inttime()}"
+        device = gen_deviceId() if self.client.autoDevice else self.client.device_id
 
-            self.headers = {
-                "Accept-Encoding": "gzip, deflate, br",
-                "Connection": "Upgrade",
-                "AUID": self.client.userId,
-                "NDCAUTH": f"sid={self.client.sid}",
-                "NDCLANG": "en",
-                "NDCDEVICEID": device,
-                "NDC-MSG-SIG": helpers.signature(final)
-            }
+        final = f"{device}|{inttime()}"
 
-            self.new_socket_url()
-            self.socket = websocket.WebSocketApp(
+        self.headers = {
+            "Accept-Encoding": "gzip, deflate, br",
+            "Connection": "Upgrade",
+            "AUID": self.client.userId,
+            "NDCAUTH": f"sid={self.client.sid}",
+            "NDCLANG": "en",
+            "NDCDEVICEID": device,
+            "NDC-MSG-SIG": helpers.signature(final)
+        }
+
+        self.new_socket_url()
+        if self.socket_session is None or self.socket_session.closed:
+            self.socket_session = ClientSession()
+        try:
+            socket = await wait_for(self.socket_session.ws_connect(
                 f"{self.socket_url}/?signbody={final.replace('|', '%7C')}",
-                on_message = self.handle_message,
-                header = self.headers,
-                on_error = self.handle_error,
-                on_close = self.handle_close
-            )
+                headers=self.headers,
+                ssl=False,
+                # pongs are read by `receive_handler`, to know that connection is alive
+                autoping=False,
+                max_msg_size=0
+            ), self.connectTimeout)
+        except Exception as e:
+            self.failures += 1
+            self.handle_error(None, e)
+            return False
+
+        self.socket = socket
+        self.socket_task = create_task(self.receive_handler(socket))
+        self.ping_task = create_task(self.ping_handler(socket))
+        self.connected_at = self.last_pong = monotonic()
+        self.failures = 0
+        self.socket_log(f"Connected to {self.socket_url}")
+        return True
+
+    async def run_amino_socket(self):
+        try:
+            from aiohttp import ClientSession
+        except ImportError:
+            raise Exception(AIOHTTP_TEXT) from None
+
+        try:
+            if self.client.sid is None:
+                return
+
+            if self.reconnect_task is None or self.reconnect_task.done():
+                self.reconnect_task = create_task(self.reconnect_handler())
 
+            # if it fails, `reconnect_handler` tries again
             self.active = True
-            self.socket_thread = Thread(target=self.ws_run_forever)
-            self.socket_thread.start()
-
-            if self.reconnect_thread is None:
-                self.reconnect_thread = Thread(target=self.reconnect_handler)
-                self.reconnect_thread.start()
-            
-            self.socket_log(f"Connected to {self.socket_url}")
+            await self.reconnect()
         except Exception as e:
             print(e)
 
-    def close(self):
-        self.active = False
+    async def close_socket(self, socket, socket_task: Task | None = None, ping_task: Task | None = None):
+        for task in (ping_task, socket_task):
+            if task is not None and task is not current_task():
+                task.cancel()
+        if socket is None:
+            return
         try:
-            self.socket.close()
+            await socket.close()
             self.socket_log(f"Closed {self.socket_url}")
         except Exception as closeError:
             self.socket_log(
@@ -138,98 +294,169 @@ class SocketHandler:
                 "ERROR"
             )
 
+    async def close(self):
+        self.active = False
+        if self.reconnect_lock is None:
+            self.reconnect_lock = Lock()
+        # after reconnect that is in progress, so connection it opens is closed too
+        async with self.reconnect_lock:
+            # supervisor and running async handlers are stopped too, so nothing keeps using closed client
+            tasks = (self.reconnect_task, *getattr(self.client, "handler_tasks", ()))
+            for task in tasks:
+                if task is not None and task is not current_task():
+                    task.cancel()
+            self.reconnect_task = None
+            await self.close_socket(self.socket, self.socket_task, self.ping_task)
+        if self.socket_session is None:
+            return
+        try:
+            await self.socket_session.close()
+        except Exception as closeError:
+            self.socket_log(
+                "Can't close connection to {}: {}".format( self.socket_url, str(closeError).replace("\n", " ") ),
+                "ERROR"
+            )
+
         return
 
+def make_event(data: dict) -> objects.Event:
+    # `message` and its author are parsed only when handler reads them
+    return objects.Event(data).Event
+
+# key of frame -> event: (t, type, mediaType) for chat messages, (t, actions) for chat actions
+EVENTS = {
+    (1000, 0, 0): "on_text_message",
+    (1000, 0, 100): "on_image_message",
+    (1000, 0, 103): "on_youtube_message",
+    (1000, 1, 0): "on_strike_message",
+    (1000, 2, 110): "on_voice_message",
+    (1000, 3, 113): "on_sticker_message",
+    (1000, 52, 0): "on_voice_chat_not_answered",
+    (1000, 53, 0): "on_voice_chat_not_cancelled",
+    (1000, 54, 0): "on_voice_chat_not_declined",
+    (1000, 55, 0): "on_video_chat_not_answered",
+    (1000, 56, 0): "on_video_chat_not_cancelled",
+    (1000, 57, 0): "on_video_chat_not_declined",
+    (1000, 58, 0): "on_avatar_chat_not_answered",
+    (1000, 59, 0): "on_avatar_chat_not_cancelled",
+    (1000, 60, 0): "on_avatar_chat_not_declined",
+    (1000, 100, 0): "on_delete_message",
+    (1000, 101, 0): "on_group_member_join",
+    (1000, 102, 0): "on_group_member_leave",
+    (1000, 103, 0): "on_chat_invite",
+    (1000, 104, 0): "on_chat_background_changed",
+    (1000, 105, 0): "on_chat_title_changed",
+    (1000, 106, 0): "on_chat_icon_changed",
+    (1000, 107, 0): "on_voice_chat_start",
+    (1000, 108, 0): "on_video_chat_start",
+    (1000, 109, 0): "on_avatar_chat_start",
+    (1000, 110, 0): "on_voice_chat_end",
+    (1000, 111, 0): "on_video_chat_end",
+    (1000, 112, 0): "on_avatar_chat_end",
+    (1000, 113, 0): "on_chat_content_changed",
+    (1000, 114, 0): "on_screen_room_start",
+    (1000, 115, 0): "on_screen_room_end",
+    (1000, 116, 0): "on_chat_host_transfered",
+    (1000, 117, 0): "on_text_message_force_removed",
+    (1000, 118, 0): "on_chat_removed_message",
+    (1000, 119, 0): "on_text_message_removed_by_admin",
+    (1000, 120, 0): "on_chat_tip",
+    (1000, 121, 0): "on_chat_pin_announcement",
+    (1000, 122, 0): "on_voice_chat_permission_open_to_everyone",
+    (1000, 123, 0): "on_voice_chat_permission_invited_and_requested",
+    (1000, 124, 0): "on_voice_chat_permission_invite_only",
+    (1000, 125, 0): "on_chat_view_only_enabled",
+    (1000, 126, 0): "on_chat_view_only_disabled",
+    (1000, 127, 0): "on_chat_unpin_announcement",
+    (1000, 128, 0): "on_chat_tipping_enabled",
+    (1000, 129, 0): "on_chat_tipping_disabled",
+    (1000, 65281, 0): "on_timestamp_message",
+    (1000, 65282, 0): "on_welcome_message",
+    (1000, 65283, 0): "on_invite_message",
+    (304, "Typing"): "on_user_typing_start",
+    (306, "Typing"): "on_user_typing_end"
+}
+
 class Callbacks:
     def __init__(self, client):
         self.client = client
         self.handlers = {}
-
-        self.methods = {
-            304: self._resolve_chat_action_start,
-            306: self._resolve_chat_action_end,
-            1000: self._resolve_chat_message
-        }
-
-        self.chat_methods = {
-            "0:0": self.on_text_message,
-            "0:100": self.on_image_message,
-            "0:103": self.on_youtube_message,
-            "1:0": self.on_strike_message,
-            "2:110": self.on_voice_message,
-            "3:113": self.on_sticker_message,
-            "52:0": self.on_voice_chat_not_answered,
-            "53:0": self.on_voice_chat_not_cancelled,
-            "54:0": self.on_voice_chat_not_declined,
-            "55:0": self.on_video_chat_not_answered,
-            "56:0": self.on_video_chat_not_cancelled,
-            "57:0": self.on_video_chat_not_declined,
-            "58:0": self.on_avatar_chat_not_answered,
-            "59:0": self.on_avatar_chat_not_cancelled,
-            "60:0": self.on_avatar_chat_not_declined,
-            "100:0": self.on_delete_message,
-            "101:0": self.on_group_member_join,
-            "102:0": self.on_group_member_leave,
-            "103:0": self.on_chat_invite,
-            "104:0": self.on_chat_background_changed,
-            "105:0": self.on_chat_title_changed,
-            "106:0": self.on_chat_icon_changed,
-            "107:0": self.on_voice_chat_start,
-            "108:0": self.on_video_chat_start,
-            "109:0": self.on_avatar_chat_start,
-            "110:0": self.on_voice_chat_end,
-            "111:0": self.on_video_chat_end,
-            "112:0": self.on_avatar_chat_end,
-            "113:0": self.on_chat_content_changed,
-            "114:0": self.on_screen_room_start,
-            "115:0": self.on_screen_room_end,
-            "116:0": self.on_chat_host_transfered,
-            "117:0": self.on_text_message_force_removed,
-            "118:0": self.on_chat_removed_message,
-            "119:0": self.on_text_message_removed_by_admin,
-            "120:0": self.on_chat_tip,
-            "121:0": self.on_chat_pin_announcement,
-            "122:0": self.on_voice_chat_permission_open_to_everyone,
-            "123:0": self.on_voice_chat_permission_invited_and_requested,
-            "124:0": self.on_voice_chat_permission_invite_only,
-            "125:0": self.on_chat_view_only_enabled,
-            "126:0": self.on_chat_view_only_disabled,
-            "127:0": self.on_chat_unpin_announcement,
-            "128:0": self.on_chat_tipping_enabled,
-            "129:0": self.on_chat_tipping_disabled,
-            "65281:0": self.on_timestamp_message,
-            "65282:0": self.on_welcome_message,
-            "65283:0": self.on_invite_message
-        }
-
-        self.chat_actions_start = {
-            "Typing": self.on_user_typing_start,
-        }
-
-        self.chat_actions_end = {
-            "Typing": self.on_user_typing_end,
-        }
-
-    def _resolve_chat_message(self, data):
-        key = f"{data['o']['chatMessage']['type']}:{data['o']['chatMessage'].get('mediaType', 0)}"
-        return self.chat_methods.get(key, self.default)(data)
-
-    def _resolve_chat_action_start(self, data):
-        key = data['o'].get('actions', 0)
-        return self.chat_actions_start.get(key, self.default)(data)
-
-    def _resolve_chat_action_end(self, data):
-        key = data['o'].get('actions', 0)
-        return self.chat_actions_end.get(key, self.default)(data)
+        # running async handlers (event loop keeps only weak references to tasks)
+        self.handler_tasks = set()
+        # key of frame -> (make, handlers), only for events that have handlers
+        self.dispatch = {}
+        self.default_handlers = ()
+        self.rebuild_dispatch()
+
+    def rebuild_dispatch(self):
+        '''
+            Make table of events that have handlers. It is done on registration, not on every frame.
+            Call it if you changed `handlers` by hand.
+        '''
+        dispatch = {}
+        for key, name in EVENTS.items():
+            if getattr(type(self), name) is not getattr(Callbacks, name):
+                # on_* of subclass gets whole frame, like before
+                dispatch[key] = (None, (getattr(self, name),))
+            elif self.handlers.get(name):
+                dispatch[key] = (make_event, tuple(self.handlers[name]))
+        self.dispatch = dispatch
+
+        if type(self).default is not Callbacks.default:
+            self.default_handlers = (self.default,)
+        else:
+            self.default_handlers = tuple(self.handlers.get("default", ()))
 
     def resolve(self, data):
-        data = loads(data)
-        return self.methods.get(data["t"], self.default)(data)
-
-    def call(self, type, data):
-        if type in self.handlers:
-            for handler in self.handlers[type]:
-                handler(data)
+        self.resolve_frame(loads(data))
+
+    def resolve_frame(self, data: dict):
+        t = data["t"]
+        if t == 1000:
+            message = data["o"]["chatMessage"]
+            key = (1000, message["type"], message.get("mediaType", 0))
+        elif t == 304 or t == 306:
+            key = (t, data["o"].get("actions", 0))
+        else:
+            key = None
+
+        entry = self.dispatch.get(key)
+        if entry is not None:
+            make, handlers = entry
+        elif key not in EVENTS and self.default_handlers:
+            make, handlers = None, self.default_handlers
+        else:
+            return
+        self.handle_event(make, handlers, data)
+
+    def handle_event(self, make, handlers, data):
+        # events (and objects that handlers make, tasks of async handlers too) follow settings of client
+        with parse_settings(*client_settings(self.client)):
+            # event is made only if someone listens for it
+            self.run_handlers(handlers, data if make is None else make(data["o"]))
+
+    def run_handlers(self, handlers, data):
+        for handler in handlers:
+            result = handler(data)
+            # async handlers run as tasks, so next frames are not waiting for them
+            if isawaitable(result):
+                task = ensure_future(result)
+                self.handler_tasks.add(task)
+                task.add_done_callback(self.handler_done)
+
+    def handler_done(self, task):
+        self.handler_tasks.discard(task)
+        # error of async handler is reported like one of sync handler, not lost with task
+        if not task.cancelled() and task.exception() is not None:
+            self.client.handle_error(None, task.exception())
+
+    def call(self, type, data, make=None):
+        handlers = self.handlers.get(type)
+        if not handlers:
+            return
+        if make is not None:
+            data = make(data)
+        self.run_handlers(handlers, data)
 
     def event(self, type):
         def registerHandler(handler):
@@ -237,60 +464,61 @@ class Callbacks:
                 self.handlers[type].append(handler)
             else:
                 self.handlers[type] = [handler]
+            self.rebuild_dispatch()
             return handler
 
         return registerHandler
 
-    def on_text_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_image_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_youtube_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_strike_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_sticker_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_delete_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_group_member_join(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_group_member_leave(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_invite(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_background_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_title_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_icon_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_video_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_avatar_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_content_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_screen_room_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_screen_room_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_host_transfered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_text_message_force_removed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_removed_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_text_message_removed_by_admin(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_tip(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_pin_announcement(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_permission_open_to_everyone(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_permission_invited_and_requested(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_voice_chat_permission_invite_only(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_view_only_enabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_view_only_disabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_unpin_announcement(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_tipping_enabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_chat_tipping_disabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_timestamp_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_welcome_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_invite_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-
-    def on_user_typing_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-    def on_user_typing_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-
-    def default(self, data): self.call(getframe(0).f_code.co_name, data)
+    def on_text_message(self, data): self.call("on_text_message", data["o"], make_event)
+    def on_image_message(self, data): self.call("on_image_message", data["o"], make_event)
+    def on_youtube_message(self, data): self.call("on_youtube_message", data["o"], make_event)
+    def on_strike_message(self, data): self.call("on_strike_message", data["o"], make_event)
+    def on_voice_message(self, data): self.call("on_voice_message", data["o"], make_event)
+    def on_sticker_message(self, data): self.call("on_sticker_message", data["o"], make_event)
+    def on_voice_chat_not_answered(self, data): self.call("on_voice_chat_not_answered", data["o"], make_event)
+    def on_voice_chat_not_cancelled(self, data): self.call("on_voice_chat_not_cancelled", data["o"], make_event)
+    def on_voice_chat_not_declined(self, data): self.call("on_voice_chat_not_declined", data["o"], make_event)
+    def on_video_chat_not_answered(self, data): self.call("on_video_chat_not_answered", data["o"], make_event)
+    def on_video_chat_not_cancelled(self, data): self.call("on_video_chat_not_cancelled", data["o"], make_event)
+    def on_video_chat_not_declined(self, data): self.call("on_video_chat_not_declined", data["o"], make_event)
+    def on_avatar_chat_not_answered(self, data): self.call("on_avatar_chat_not_answered", data["o"], make_event)
+    def on_avatar_chat_not_cancelled(self, data): self.call("on_avatar_chat_not_cancelled", data["o"], make_event)
+    def on_avatar_chat_not_declined(self, data): self.call("on_avatar_chat_not_declined", data["o"], make_event)
+    def on_delete_message(self, data): self.call("on_delete_message", data["o"], make_event)
+    def on_group_member_join(self, data): self.call("on_group_member_join", data["o"], make_event)
+    def on_group_member_leave(self, data): self.call("on_group_member_leave", data["o"], make_event)
+    def on_chat_invite(self, data): self.call("on_chat_invite", data["o"], make_event)
+    def on_chat_background_changed(self, data): self.call("on_chat_background_changed", data["o"], make_event)
+    def on_chat_title_changed(self, data): self.call("on_chat_title_changed", data["o"], make_event)
+    def on_chat_icon_changed(self, data): self.call("on_chat_icon_changed", data["o"], make_event)
+    def on_voice_chat_start(self, data): self.call("on_voice_chat_start", data["o"], make_event)
+    def on_video_chat_start(self, data): self.call("on_video_chat_start", data["o"], make_event)
+    def on_avatar_chat_start(self, data): self.call("on_avatar_chat_start", data["o"], make_event)
+    def on_voice_chat_end(self, data): self.call("on_voice_chat_end", data["o"], make_event)
+    def on_video_chat_end(self, data): self.call("on_video_chat_end", data["o"], make_event)
+    def on_avatar_chat_end(self, data): self.call("on_avatar_chat_end", data["o"], make_event)
+    def on_chat_content_changed(self, data): self.call("on_chat_content_changed", data["o"], make_event)
+    def on_screen_room_start(self, data): self.call("on_screen_room_start", data["o"], make_event)
+    def on_screen_room_end(self, data): self.call("on_screen_room_end", data["o"], make_event)
+    def on_chat_host_transfered(self, data): self.call("on_chat_host_transfered", data["o"], make_event)
+    def on_text_message_force_removed(self, data): self.call("on_text_message_force_removed", data["o"], make_event)
+    def on_chat_removed_message(self, data): self.call("on_chat_removed_message", data["o"], make_event)
+    def on_text_message_removed_by_admin(self, data): self.call("on_text_message_removed_by_admin", data["o"], make_event)
+    def on_chat_tip(self, data): self.call("on_chat_tip", data["o"], make_event)
+    def on_chat_pin_announcement(self, data): self.call("on_chat_pin_announcement", data["o"], make_event)
+    def on_voice_chat_permission_open_to_everyone(self, data): self.call("on_voice_chat_permission_open_to_everyone", data["o"], make_event)
+    def on_voice_chat_permission_invited_and_requested(self, data): self.call("on_voice_chat_permission_invited_and_requested", data["o"], make_event)
+    def on_voice_chat_permission_invite_only(self, data): self.call("on_voice_chat_permission_invite_only", data["o"], make_event)
+    def on_chat_view_only_enabled(self, data): self.call("on_chat_view_only_enabled", data["o"], make_event)
+    def on_chat_view_only_disabled(self, data): self.call("on_chat_view_only_disabled", data["o"], make_event)
+    def on_chat_unpin_announcement(self, data): self.call("on_chat_unpin_announcement", data["o"], make_event)
+    def on_chat_tipping_enabled(self, data): self.call("on_chat_tipping_enabled", data["o"], make_event)
+    def on_chat_tipping_disabled(self, data): self.call("on_chat_tipping_disabled", data["o"], make_event)
+    def on_timestamp_message(self, data): self.call("on_timestamp_message", data["o"], make_event)
+    def on_welcome_message(self, data): self.call("on_welcome_message", data["o"], make_event)
+    def on_invite_message(self, data): self.call("on_invite_message", data["o"], make_event)
+
+    def on_user_typing_start(self, data): self.call("on_user_typing_start", data["o"], make_event)
+    def on_user_typing_end(self, data): self.call("on_user_typing_end", data["o"], make_event)
+
+    def default(self, data): self.call("default", data)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
-from json import dumps
+from ..lib.jsonlib import dumps
 from typing import BinaryIO
 
 from .client import Client
 from ..lib import exceptions, headers, objects
 from ..lib.helpers import gen_deviceId, json_minify, str_uuid4, inttime, clientrefid, bytes_to_b64, LOCAL_TIMEZONE, should_be_thing
+from ..lib.schema import follow_client_settings
 
+@follow_client_settings
 class SubClient(Client):
     """
         Client to work with community in Amino.
@@ -19,6 +21,7 @@ class SubClient(Client):
         
         get_community: bool = False,
         get_profile: bool = False,
+        share_session: bool = True,
         **kwargs
     ):
         """
@@ -36,6 +39,9 @@ class SubClient(Client):
         - get_profile: bool = False
             - should subclient get info about your profile in community you passed?
             - False for no (default), True for yes
+        - share_session: bool = True
+            - should subclient send requests through connection pool of main client?
+            - True for yes (default, one keep-alive pool per account), False for own pool
     
         
         \- imperialwool, where is another fields of subclient??? ;-;
@@ -46,9 +52,19 @@ class SubClient(Client):
             self, deviceId=mainClient.device_id, proxies=mainClient.proxies,
             autoDevice=mainClient.autoDevice, userAgent=mainClient.user_agent,
             http2_enabled=mainClient.http2_enabled,
+            max_concurrent_streams=mainClient.max_concurrent_streams,
             own_timeout=mainClient.timeout_settings,
             socket_enabled=False,
-            api_library=mainClient.api_library or objects.APILibraries.HTTPX
+            api_library=mainClient.api_library or objects.APILibraries.HTTPX,
+            retry_policy=mainClient.retry_policy,
+            rate_limit=mainClient.rate_limit,
+            singleflight=mainClient.singleflight,
+            cache=mainClient.cache,
+            entity_store=mainClient.entity_store,
+            retain_raw=mainClient.retain_raw,
+            identity_map=mainClient.identity_map,
+            session=mainClient.session if share_session else None,
+            api=mainClient.api
         )
         self.vc_connect: bool = False
         self.sid: str = mainClient.sid
@@ -315,7 +331,8 @@ class SubClient(Client):
         response = await self.session.post(f"/x{self.comId}/s/user-profile/{self.profile.userId}", headers=self.additional_headers(data=data), data=data)
         if response.status_code != 200: 
             return exceptions.CheckException(response)
-        else: return response.status_code
+        else:
+            return response.status_code
 
     async def vote_poll(self, blogId: str, optionId: str) -> int:
         data = dumps({
@@ -791,7 +808,7 @@ class SubClient(Client):
             stickerId: str = None,
         
             embedId: str = None, embedObjectType: int = None, embedLink: str = None, embedTitle: str = None, embedContent: str = None, embedImage: BinaryIO = None,
-            embedType: objects.EmbedTypes = objects.EmbedTypes.LINK_SNIPPET
+            embedType: objects.EmbedTypes = None
         ):
         """
         Send a Message to a Chat.
@@ -1282,7 +1299,7 @@ class SubClient(Client):
             return exceptions.CheckException(response)
         else: return objects.VcReputation(response.json()).VcReputation
 
-    async def get_all_users(self, type: str = "recent", start: int = 0, size: int = 25):
+    async def get_all_users(self, type: str = "recent", start: int = 0, size: int = 25, fields: list[str] | None = None):
         if type == "recent": response = await self.session.get(f"/x{self.comId}/s/user-profile?type=recent&start={start}&size={size}", headers=self.additional_headers())
         elif type == "banned": response = await self.session.get(f"/x{self.comId}/s/user-profile?type=banned&start={start}&size={size}", headers=self.additional_headers())
         elif type == "featured": response = await self.session.get(f"/x{self.comId}/s/user-profile?type=featured&start={start}&size={size}", headers=self.additional_headers())
@@ -1292,13 +1309,13 @@ class SubClient(Client):
 
         if response.status_code != 200: 
             return exceptions.CheckException(response)
-        else: return objects.UserProfileCountList(response.json()).UserProfileCountList
+        else: return objects.UserProfileCountList(response.json(), fields).UserProfileCountList
 
-    async def get_online_users(self, start: int = 0, size: int = 25):
+    async def get_online_users(self, start: int = 0, size: int = 25, fields: list[str] | None = None):
         response = await self.session.get(f"/x{self.comId}/s/live-layer?topic=ndtopic:x{self.comId}:online-members&start={start}&size={size}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
-        else: return objects.UserProfileCountList(response.json()).UserProfileCountList
+        else: return objects.UserProfileCountList(response.json(), fields).UserProfileCountList
 
     async def get_online_favorite_users(self, start: int = 0, size: int = 25):
         response = await self.session.get(f"/x{self.comId}/s/user-group/quick-access?type=online&start={start}&size={size}", headers=self.additional_headers())
@@ -1318,12 +1335,20 @@ class SubClient(Client):
 
             - **Fail** : :meth:`Exceptions <aminofixfix.lib.exceptions>`
         """
+        if self.entity_store:
+            stored = await self.entity_store.get_async("user", userId, self.comId, viewer=self.userId)
+            if stored is not None:
+                return objects.shared_profile(stored)
+
         response = await self.session.get(f"/x{self.comId}/s/user-profile/{userId}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
-        else: return objects.UserProfile(response.json()["userProfile"]).UserProfile
+        else:
+            if self.entity_store:
+                await self.entity_store.put_async("user", userId, response.json()["userProfile"], self.comId, viewer=self.userId)
+            return objects.shared_profile(response.json()["userProfile"])
 
-    async def get_user_following(self, userId: str, start: int = 0, size: int = 25):
+    async def get_user_following(self, userId: str, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         List of Users that the User is Following.
 
@@ -1331,6 +1356,7 @@ class SubClient(Client):
             - **userId** : ID of the User.
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User List <aminofixfix.lib.objects.UserProfileList>`
@@ -1340,9 +1366,9 @@ class SubClient(Client):
         response = await self.session.get(f"/x{self.comId}/s/user-profile/{userId}/joined?start={start}&size={size}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
-        else: return objects.UserProfileList(response.json()["userProfileList"]).UserProfileList
+        else: return objects.UserProfileList(response.json()["userProfileList"], fields).UserProfileList
 
-    async def get_user_followers(self, userId: str, start: int = 0, size: int = 25):
+    async def get_user_followers(self, userId: str, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         List of Users that are Following the User.
 
@@ -1350,6 +1376,7 @@ class SubClient(Client):
             - **userId** : ID of the User.
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User List <aminofixfix.lib.objects.UserProfileList>`
@@ -1359,7 +1386,7 @@ class SubClient(Client):
         response = await self.session.get(f"/x{self.comId}/s/user-profile/{userId}/member?start={start}&size={size}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
-        else: return objects.UserProfileList(response.json()["userProfileList"]).UserProfileList
+        else: return objects.UserProfileList(response.json()["userProfileList"], fields).UserProfileList
 
     async def get_user_visitors(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -1559,7 +1586,7 @@ class SubClient(Client):
             return exceptions.CheckException(response)
         else: return objects.Thread(response.json()["thread"]).Thread
 
-    async def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None):
+    async def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None, fields: list[str] | None = None):
         """
         List of Messages from an Chat.
 
@@ -1567,6 +1594,7 @@ class SubClient(Client):
             - **chatId** : ID of the Chat.
             - *size* : Size of the list.
             - *pageToken* : Next Page Token.
+            - *fields* : Only these fields of messages are parsed (like ["messageId", "content"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`Message List <aminofixfix.lib.objects.MessageList>`
@@ -1580,7 +1608,7 @@ class SubClient(Client):
         response = await self.session.get(url, headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
-        else: return objects.GetMessages(response.json()).GetMessages
+        else: return objects.GetMessages(response.json(), fields).GetMessages
 
     async def get_message_info(self, chatId: str, messageId: str):
         """
@@ -2134,7 +2162,7 @@ class SubClient(Client):
             if blogId is not None: data["params"]["blogType"] = 0
             if quizId is not None: data["params"]["blogType"] = 6
 
-        return self.send(dumps(data))
+        return await self.send(dumps(data))
 
     # Provided by "spectrum#4691"
     async def purchase(self, objectId: str, objectType: int, aminoPlus: bool = True, autoRenew: bool = False):
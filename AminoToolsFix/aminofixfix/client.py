@@ -2,16 +2,26 @@ from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
 from time import sleep
-from json import dumps
+from .lib.jsonlib import dumps
 from typing import BinaryIO
 from threading import Thread
 from httpx import Timeout as TimeoutConfig
 
 from .socket import Callbacks, SocketHandler
-from .lib import exceptions, headers, objects, helpers
+from .lib import exceptions, headers, objects, helpers, timeouts
+from .lib.retry import RetryPolicy
+from .lib.ratelimit import RateLimit
+from .lib.singleflight import Singleflight
+from .lib.cache import ResponseCache
+from .lib.entity_store import EntityStore
+from .lib.schema import follow_client_settings
+from .lib.identity_map import IdentityMap
+from .lib.handler_pool import HandlerPool
+from .lib.event_queue import EventQueue
 from .lib.facades import RequestsClient, SyncHttpxClient
 from .lib.helpers import gen_deviceId, inttime, clientrefid, str_uuid4, bytes_to_b64, LOCAL_TIMEZONE
 
+@follow_client_settings
 class Client(Callbacks, SocketHandler):
     """
         Client to work with global in Amino.
@@ -22,6 +32,7 @@ class Client(Callbacks, SocketHandler):
         deviceId: str = None, userAgent: str = None, proxies: str | dict = None,
         socket_trace: bool = False, socketDebugging: bool = False, socket_enabled: bool = True,
         autoDevice: bool = False, http2_enabled: bool = True,
+        max_concurrent_streams: int | None = None,
         
         disable_timeout: bool = False,
         default_timeout: int | None = 30, own_timeout: TimeoutConfig | None = None,
@@ -29,7 +40,18 @@ class Client(Callbacks, SocketHandler):
         connect_timeout: int | None = None, pool_timeout: int | None = None,
         read_timeout: int | None = None, write_timeout: int | None = None,
 
-        api_library: objects.APILibraries = objects.APILibraries.HTTPX
+        api_library: objects.APILibraries = objects.APILibraries.HTTPX,
+        retry_policy: RetryPolicy | None = None,
+        rate_limit: RateLimit | None = None,
+        singleflight: Singleflight | bool | None = None,
+        cache: ResponseCache | bool | None = None,
+        entity_store: EntityStore | str | None = None,
+        retain_raw: bool | None = None,
+        identity_map: IdentityMap | bool = False,
+        handler_pool: HandlerPool | int | bool | None = None,
+        event_queue: EventQueue | int | bool | None = None,
+        session: SyncHttpxClient | RequestsClient | None = None,
+        api: str | None = None
     ):
         """
         Init client.
@@ -51,28 +73,28 @@ class Client(Callbacks, SocketHandler):
             - *can* or *can not* help with "too many requests" bypass
         - http2_enabled: bool = True
             - only for HTTPX
-            - just in case if Amino servers will some day support it
+            - needs `h2` library (`pip install httpx[http2]`), without it HTTP/1.1 is used
+            - if server can't into HTTP/2, HTTP/1.1 is used
+        - max_concurrent_streams: int | None = None
+            - only for HTTPX
+            - how much requests can be in flight at once (HTTP/2 streams in one connection)
+            - None for no limit
         - disable_timeout: bool = False
-            - only for HTTPX (for now)
             - completely disable timeouts if true
             - **can cause issues!**
         - default_timeout: int | None = 30
-            - only for HTTPX (for now)
             - default timeout in seconds
         - own_timeout: TimeoutConfig | None = None
-            - only for HTTPX (for now)
             - own timeout configs
         - connect_timeout: int | None = None
-            - only for HTTPX (for now)
             - connect timeout (if you want configure timeout like this)
         - pool_timeout: int | None = None
-            - only for HTTPX (for now)
+            - not used by requests
             - pool timeout (if you want configure timeout like this)
         - read_timeout: int | None = None
-            - only for HTTPX (for now)
             - read timeout (if you want configure timeout like this)
         - write_timeout: int | None = None
-            - only for HTTPX (for now)
+            - only for HTTPX
             - write timeout (if you want configure timeout like this)
         - api_library: objects.APILibraries = objects.APILibraries.HTTPX
             - choicing library for API requests
@@ -80,8 +102,53 @@ class Client(Callbacks, SocketHandler):
             - *can* be not so stable as HTTPX
             - you can choice library like `aminofixfix.lib.objects.APILibraries.HTTPX`,
               but you probably want to import `objects` from `aminofixfix.lib`
-        """
-        self.api: str = "https://service.aminoapps.com/api/v1"
+        - retry_policy: RetryPolicy | None = None
+            - how to retry requests on 429 and network errors
+            - by default 5 attempts with exponential backoff
+            - you can import it like `aminofixfix.lib.RetryPolicy`
+            - `RetryPolicy.disabled()` to turn retries off
+        - rate_limit: RateLimit | None = None
+            - limit how fast your account sends requests (token bucket)
+            - limit is shared between all clients of same account in this process
+            - separate limits for reading (GET) and writing (POST, DELETE)
+            - you can import it like `aminofixfix.lib.RateLimit`
+        - singleflight: Singleflight | bool | None = None
+            - identical GET requests sent at same time (same path, same account) share one request
+            - True to make new one, or already made one to share it, None to send every request (default)
+            - `client.singleflight.deduplicated` shows how much requests were saved
+        - cache: ResponseCache | bool | None = None
+            - cache answers of lookups like `get_from_code`, `get_community_info` or `get_user_info`
+            - True for cache with default TTLs, or your own `aminofixfix.lib.ResponseCache`
+            - writes like `join_community` or `edit_profile` drop related answers
+            - `client.cache.stats()` shows hits and misses
+        - entity_store: EntityStore | str | None = None
+            - SQLite file (or `aminofixfix.lib.EntityStore`) to keep resolved links, communities and profiles
+            - it is checked before API by `get_from_code`, `get_community_info` and `get_user_info`
+            - survives restarts and can be shared by few processes
+            - writes like `follow`, `edit_profile` or `join_community` drop related entities
+        - retain_raw: bool | None = None
+            - keep JSON in objects made from answers (`obj.json`, `obj.raw()`) or drop it after parsing to save memory
+            - None to use global setting (`aminofixfix.lib.set_retain_raw`, keeps JSON by default)
+        - identity_map: IdentityMap | bool = False
+            - one `UserProfile` per user for authors of messages, events, threads and `get_user_info`
+            - repeated profiles are not parsed again, unused ones are collected (weak references)
+            - True for new map, or your own `aminofixfix.lib.IdentityMap` to share it between clients
+        - handler_pool: HandlerPool | int | bool | None = None
+            - run handlers of socket events in worker threads (number of workers, True for default one, or `aminofixfix.lib.HandlerPool`)
+            - events of one chat are handled in order, different chats in parallel
+            - None to run handlers in socket thread (default), `client.handler_pool.stats()` shows queues and latency
+        - event_queue: EventQueue | int | bool | None = None
+            - bounded queue between socket and handlers (size, True for default one, or `aminofixfix.lib.EventQueue` to choose policy)
+            - with burst of frames typing events are dropped first (by default), `client.event_queue.stats()` shows drops
+            - None to handle frames right in socket thread (default)
+        - session: SyncHttpxClient | RequestsClient | None = None
+            - already made facade (`aminofixfix.lib.facades`) to send requests through
+            - lets few clients use one connection pool (SubClient and ACM do this by default)
+        - api: str | None = None
+            - base URL of API, "https://service.aminoapps.com/api/v1" by default
+            - useful for mirrors and local tests
+        """
+        self.api: str = api or "https://service.aminoapps.com/api/v1"
 
         self.configured: bool = False
         self.authenticated: bool = False
@@ -89,8 +156,18 @@ class Client(Callbacks, SocketHandler):
         self.proxies: str | dict = proxies
         self.timeout_settings: TimeoutConfig
         self.http2_enabled: bool = http2_enabled
+        self.max_concurrent_streams: int | None = max_concurrent_streams
         self.socket_enabled: bool = socket_enabled
         self.api_library: objects.APILibraries = api_library
+        self.retry_policy: RetryPolicy = retry_policy or RetryPolicy()
+        self.rate_limit: RateLimit | None = rate_limit
+        self.singleflight: Singleflight | None = Singleflight() if singleflight is True else singleflight or None
+        self.cache: ResponseCache | None = ResponseCache() if cache is True else cache or None
+        self.entity_store: EntityStore | None = EntityStore(entity_store) if isinstance(entity_store, str) else entity_store
+        self.retain_raw: bool | None = retain_raw
+        self.identity_map: IdentityMap | None = IdentityMap() if identity_map is True else identity_map or None
+        self.handler_pool: HandlerPool | None = HandlerPool() if handler_pool is True else HandlerPool(handler_pool) if type(handler_pool) is int else handler_pool or None
+        self.event_queue: EventQueue | None = EventQueue() if event_queue is True else EventQueue(event_queue) if type(event_queue) is int else event_queue or None
         self.device_id: str = deviceId if deviceId else gen_deviceId()
         self.user_agent: str = userAgent if userAgent else helpers.gen_userAgent()
 
@@ -110,21 +187,35 @@ class Client(Callbacks, SocketHandler):
 
         if self.api_library == objects.APILibraries.AIOHTTP:
             raise Exception("You cant use aiohttp in sync client. Aiohttp is async library.")
+        elif session is not None:
+            self.session = session
         elif self.api_library == objects.APILibraries.REQUESTS:
             self.session = RequestsClient(
                 headers=headers.BASIC_HEADERS,
-                http2=http2_enabled,
+                http2_enabled=http2_enabled,
+                max_concurrent_streams=max_concurrent_streams,
                 base_url=self.api,
                 proxies=proxies,
-                timeout=self.timeout_settings
+                timeout=self.timeout_settings,
+                retry_policy=self.retry_policy,
+                rate_limit=self.rate_limit,
+                singleflight=self.singleflight,
+                cache=self.cache,
+                entity_store=self.entity_store
             )
         else:
             self.session = SyncHttpxClient(
                 headers=headers.BASIC_HEADERS,
-                http2=http2_enabled,
+                http2_enabled=http2_enabled,
+                max_concurrent_streams=max_concurrent_streams,
                 base_url=self.api,
                 proxies=proxies,
-                timeout=self.timeout_settings
+                timeout=self.timeout_settings,
+                retry_policy=self.retry_policy,
+                rate_limit=self.rate_limit,
+                singleflight=self.singleflight,
+                cache=self.cache,
+                entity_store=self.entity_store
             )
 
         if self.socket_enabled:
@@ -163,6 +254,26 @@ class Client(Callbacks, SocketHandler):
             deviceId=gen_deviceId() if self.autoDevice else self.device_id
         )
 
+    def deadline(self, seconds: float | None):
+        """
+        Deadline for all requests inside `with` block (retries and waiting for rate limit included).
+
+        ```python
+        with client.deadline(5):
+            client.get_user_info(userId)
+            client.get_wallet_info()
+        ```
+
+        Accepting:
+        - seconds: float | None
+            - None for no deadline
+
+        Recieving:
+        - context manager
+        - requests that didn't fit raise `aminofixfix.lib.exceptions.DeadlineExceeded`
+        """
+        return timeouts.deadline(seconds)
+
     def activity_status(self, status: str):
         """
         Sets your activity status to offline or online.
@@ -979,11 +1090,18 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <aminofixfix.lib.exceptions>`
         """
+        if self.entity_store:
+            stored = self.entity_store.get("user", userId, viewer=self.userId)
+            if stored is not None:
+                return objects.shared_profile(stored)
+
         response = self.session.get(f"/g/s/user-profile/{userId}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfile(response.json()["userProfile"]).UserProfile
+            if self.entity_store:
+                self.entity_store.put("user", userId, response.json()["userProfile"], viewer=self.userId)
+            return objects.shared_profile(response.json()["userProfile"])
 
     def watch_ad(self, userId: str = None):
         """
@@ -1183,7 +1301,7 @@ class Client(Callbacks, SocketHandler):
         else:
             return response.status_code
 
-    def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None):
+    def get_chat_messages(self, chatId: str, size: int = 25, pageToken: str = None, fields: list[str] | None = None):
         """
         List of Messages from an Chat.
 
@@ -1192,6 +1310,7 @@ class Client(Callbacks, SocketHandler):
             - *size* : Size of the list.
             - *size* : Size of the list.
             - *pageToken* : Next Page Token.
+            - *fields* : Only these fields of messages are parsed (like ["messageId", "content"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`Message List <aminofixfix.lib.objects.MessageList>`
@@ -1205,7 +1324,7 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.GetMessages(response.json()).GetMessages
+            return objects.GetMessages(response.json(), fields).GetMessages
 
     def get_message_info(self, chatId: str, messageId: str):
         """
@@ -1238,10 +1357,17 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <aminofixfix.lib.exceptions>`
         """
+        if self.entity_store:
+            stored = self.entity_store.get("community", comId, viewer=self.userId)
+            if stored is not None:
+                return objects.Community(stored).Community
+
         response = self.session.get(f"/g/s-x{comId}/community/info?withInfluencerList=1&withTopicList=true&influencerListOrderStrategy=fansCount", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
+            if self.entity_store:
+                self.entity_store.put("community", comId, response.json()["community"], viewer=self.userId)
             return objects.Community(response.json()["community"]).Community
 
     def search_community(self, aminoId: str):
@@ -1265,7 +1391,7 @@ class Client(Callbacks, SocketHandler):
             if len(response) == 0: raise exceptions.CommunityNotFound(aminoId)
             else: return objects.CommunityList([com["refObject"] for com in response]).CommunityList
 
-    def get_user_following(self, userId: str, start: int = 0, size: int = 25):
+    def get_user_following(self, userId: str, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         List of Users that the User is Following.
 
@@ -1273,6 +1399,7 @@ class Client(Callbacks, SocketHandler):
             - **userId** : ID of the User.
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User List <aminofixfix.lib.objects.UserProfileList>`
@@ -1283,9 +1410,9 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfileList(response.json()["userProfileList"]).UserProfileList
+            return objects.UserProfileList(response.json()["userProfileList"], fields).UserProfileList
 
-    def get_user_followers(self, userId: str, start: int = 0, size: int = 25):
+    def get_user_followers(self, userId: str, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         List of Users that are Following the User.
 
@@ -1293,6 +1420,7 @@ class Client(Callbacks, SocketHandler):
             - **userId** : ID of the User.
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User List <aminofixfix.lib.objects.UserProfileList>`
@@ -1303,7 +1431,7 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfileList(response.json()["userProfileList"]).UserProfileList
+            return objects.UserProfileList(response.json()["userProfileList"], fields).UserProfileList
 
     def get_user_visitors(self, userId: str, start: int = 0, size: int = 25):
         """
@@ -2577,10 +2705,17 @@ class Client(Callbacks, SocketHandler):
 
             - **Fail** : :meth:`Exceptions <aminofixfix.lib.exceptions>`
         """
+        if self.entity_store:
+            stored = self.entity_store.get("link", code, viewer=self.userId)
+            if stored is not None:
+                return objects.FromCode(stored).FromCode
+
         response = self.session.get(f"/g/s/link-resolution?q={code}", headers=self.additional_headers())
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
+            if self.entity_store:
+                self.entity_store.put("link", code, response.json()["linkInfoV2"], viewer=self.userId)
             return objects.FromCode(response.json()["linkInfoV2"]).FromCode
 
     def get_from_id(self, objectId: str, objectType: int, comId: str = None):
@@ -2666,13 +2801,14 @@ class Client(Callbacks, SocketHandler):
         else:
             return response.json()["storeSubscriptionItemList"]
 
-    def get_all_users(self, start: int = 0, size: int = 25):
+    def get_all_users(self, start: int = 0, size: int = 25, fields: list[str] | None = None):
         """
         Get list of users of Amino.
 
         **Parameters**
             - *start* : Where to start the list.
             - *size* : Size of the list.
+            - *fields* : Only these fields of users are parsed (like ["userId", "nickname"]), other fields can't be read.
 
         **Returns**
             - **Success** : :meth:`User Profile Count List Object <aminofixfix.lib.objects.UserProfileCountList>`
@@ -2683,7 +2819,7 @@ class Client(Callbacks, SocketHandler):
         if response.status_code != 200: 
             return exceptions.CheckException(response)
         else:
-            return objects.UserProfileCountList(response.json()).UserProfileCountList
+            return objects.UserProfileCountList(response.json(), fields).UserProfileCountList
 
     def accept_host(self, chatId: str, requestId: str):
         """
@@ -2,3 +2,13 @@ from .objects import *
 from .exceptions import *
 from .helpers import *
 from .headers import *
+from .retry import *
+from .ratelimit import *
+from .singleflight import *
+from .cache import *
+from .entity_store import EntityStore
+from .schema import set_retain_raw, set_intern_strings
+from .identity_map import IdentityMap
+from .handler_pool import HandlerPool
+from .event_queue import EventQueue
+from .jsonlib import set_json_backend, json_backend
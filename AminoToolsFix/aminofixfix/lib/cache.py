@@ -0,0 +1,161 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import re
+from typing import Any
+from time import monotonic
+from threading import Lock
+from collections import OrderedDict
+
+from .singleflight import request_key, share_json
+
+# how long (seconds) answers of GET endpoints can be reused, first match wins
+DEFAULT_TTLS: dict[str, float] = {
+    r"/link-resolution$": 3600,                           # get_from_code
+    r"/community-collection/supported-languages$": 86400, # get_supported_languages
+    r"^/g/s-x\d+/community/info$": 300,                   # get_community_info
+    r"^/g/s/community/joined$": 60,                       # sub_clients, sub_clients_profile
+    r"/sticker-collection$": 300,                         # SubClient.get_sticker_packs
+    r"/user-profile/[^/]+$": 60,                          # get_user_info
+    r"/chat/thread/[^/]+$": 30,                           # get_chat_thread
+}
+
+# writes that make cached answers outdated: write path -> read paths to drop
+# (`{name}` is replaced with group of write path)
+INVALIDATIONS: dict[str, list[str]] = {
+    # join_community, leave_community, request_join_community
+    r"^/x(?P<comId>\d+)/s/community/(join|leave|membership-request)": [
+        r"^/g/s/community/joined$",
+        r"^/g/s-x{comId}/community/info$",
+        r"^/x{comId}/s/user-profile/"
+    ],
+    # edit_profile, follow, unfollow, set_privacy_status and others
+    r"^/(?P<scope>g/s|x\d+/s)/user-profile/": [
+        r"^/{scope}/user-profile/"
+    ],
+    # edit_chat, delete_chat, join_chat, leave_chat and others
+    r"^/(?P<scope>g/s|x\d+/s)/chat/thread/(?P<chatId>[^/?]+)": [
+        r"^/{scope}/chat/thread/{chatId}"
+    ]
+}
+
+class ResponseCache:
+    '''
+        In-memory cache of GET answers with TTL per endpoint and LRU eviction.
+
+        Answers are cached per account (same as `Singleflight`), only with status 200.
+        Writes from `INVALIDATIONS` drop related answers of all accounts.
+        Thread-safe, can be shared by sync and async clients.
+    '''
+    def __init__(
+            self,
+            max_size: int = 1024,
+            ttls: dict[str, float] | None = None,
+            default_ttl: float = 0
+        ):
+        '''
+            Init of response cache.
+
+            Args:
+            - max_size: int = 1024
+                - max cached answers, least recently used are dropped first
+            - ttls: dict[str, float] | None = None
+                - {regex of path: seconds}, added to `DEFAULT_TTLS` (and checked before them)
+                - 0 to not cache endpoint
+            - default_ttl: float = 0
+                - TTL for endpoints that are not in table, 0 to not cache them
+        '''
+        self.max_size = max_size
+        self.default_ttl = default_ttl
+        table = dict(ttls or {})
+        for pattern, ttl in DEFAULT_TTLS.items():
+            table.setdefault(pattern, ttl)
+        self.__ttls = [(re.compile(pattern), ttl) for pattern, ttl in table.items()]
+        self.__invalidations = [
+            (re.compile(pattern), targets) for pattern, targets in INVALIDATIONS.items()
+        ]
+        self.__entries: OrderedDict[tuple, tuple[float, str, Any]] = OrderedDict()
+        self.__lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidated = 0
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidated": self.invalidated,
+            "size": len(self.__entries)
+        }
+
+    def ttl(self, path: str) -> float:
+        '''
+            TTL of endpoint (path without query).
+        '''
+        path = path.split("?", 1)[0]
+        for pattern, ttl in self.__ttls:
+            if pattern.search(path):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, url: str, path: str, headers: dict) -> Any | None:
+        '''
+            Get cached answer, None if there is no fresh one.
+        '''
+        if not self.ttl(path):
+            return None
+
+        key = request_key(url, headers)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None or entry[0] < monotonic():
+                if entry is not None:
+                    del self.__entries[key]
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            self.hits += 1
+            return entry[2]
+
+    def store(self, url: str, path: str, headers: dict, response: Any):
+        '''
+            Save answer, if its endpoint is cacheable.
+        '''
+        ttl = self.ttl(path)
+        if not ttl or getattr(response, "status_code", None) != 200:
+            return
+
+        key = request_key(url, headers)
+        share_json(response)
+        with self.__lock:
+            self.__entries[key] = (monotonic() + ttl, path.split("?", 1)[0], response)
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, path: str):
+        '''
+            Drop answers made outdated by write request to `path`.
+        '''
+        path = path.split("?", 1)[0]
+        targets = []
+        for pattern, templates in self.__invalidations:
+            match = pattern.search(path)
+            if match:
+                groups = {name: re.escape(value) for name, value in match.groupdict().items()}
+                targets.extend(re.compile(template.format(**groups)) for template in templates)
+        if not targets:
+            return
+
+        with self.__lock:
+            for key in [key for key, (_, cached, _) in self.__entries.items() if any(t.search(cached) for t in targets)]:
+                del self.__entries[key]
+                self.invalidated += 1
+
+    def clear(self):
+        with self.__lock:
+            self.__entries.clear()
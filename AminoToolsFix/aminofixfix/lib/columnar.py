@@ -0,0 +1,110 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from .jsonlib import dumps
+from typing import Any, Iterable
+
+from .exceptions import WrongType
+
+# NumPy, pandas and pyarrow are optional, they are imported only when you export something
+NUMPY_TEXT = "You need to install NumPy to use to_numpy().\nType this command:\npip install numpy"
+PANDAS_TEXT = "You need to install pandas to use to_pandas().\nType this command:\npip install pandas"
+ARROW_TEXT = "You need to install pyarrow to use to_arrow().\nType this command:\npip install pyarrow"
+
+def require(module: str, text: str):
+    try:
+        return __import__(module)
+    except ImportError:
+        raise ImportError(text) from None
+
+def columns(lst, fields: Iterable[str] | None) -> dict[str, list]:
+    '''
+        {field: column} of list object.
+
+        By default all fields that are not nested objects (or all requested ones, if list has `fields`).
+    '''
+    schema = lst.schema()
+    if fields is None:
+        names = [name for name in lst.available_fields() if name not in schema.nested]
+    else:
+        names = schema.check(fields)
+        nested = [name for name in names if name in schema.nested]
+        if nested:
+            raise WrongType(f"nested fields can't be exported: {', '.join(nested)}")
+    return {name: getattr(lst, name) for name in names}
+
+def numpy_column(numpy, values: list, kind: str | None) -> Any:
+    '''
+        NumPy array with dtype of `kind` ("int", "float", "bool", "datetime" or None for object).
+
+        Columns with missing values: int -> float64 with NaN, bool -> object, datetime -> NaT.
+    '''
+    complete = None not in values
+    if kind == "int":
+        return numpy.array(values, dtype=numpy.int64) if complete else numpy.array(
+            [numpy.nan if value is None else value for value in values], dtype=numpy.float64
+        )
+    if kind == "float":
+        return numpy.array([numpy.nan if value is None else value for value in values], dtype=numpy.float64)
+    if kind == "bool" and complete:
+        return numpy.array(values, dtype=numpy.bool_)
+    if kind == "datetime":
+        # "2024-01-01T00:00:00Z", numpy wants it without timezone (it is always UTC)
+        return numpy.array(
+            ["NaT" if value is None else value.removesuffix("Z") for value in values], dtype="datetime64[s]"
+        )
+    if all(value is None or isinstance(value, str) for value in values):
+        return numpy.array(values, dtype=object)
+
+    column = numpy.empty(len(values), dtype=object)
+    column[:] = values
+    return column
+
+def to_numpy(lst, fields: Iterable[str] | None = None) -> dict[str, Any]:
+    numpy = require("numpy", NUMPY_TEXT)
+    types = type(lst).TYPES
+    return {name: numpy_column(numpy, values, types.get(name)) for name, values in columns(lst, fields).items()}
+
+def to_pandas(lst, fields: Iterable[str] | None = None) -> Any:
+    pandas = require("pandas", PANDAS_TEXT)
+    numpy = require("numpy", NUMPY_TEXT)
+
+    types = type(lst).TYPES
+    data = {}
+    for name, values in columns(lst, fields).items():
+        kind = types.get(name)
+        if kind == "int":
+            data[name] = pandas.array(values, dtype="Int64")
+        elif kind == "bool":
+            data[name] = pandas.array(values, dtype="boolean")
+        elif kind == "datetime":
+            data[name] = pandas.to_datetime(numpy_column(numpy, values, kind), utc=True)
+        else:
+            data[name] = numpy_column(numpy, values, kind)
+    return pandas.DataFrame(data)
+
+def to_arrow(lst, fields: Iterable[str] | None = None) -> Any:
+    pyarrow = require("pyarrow", ARROW_TEXT)
+
+    kinds = {
+        "int": pyarrow.int64(),
+        "float": pyarrow.float64(),
+        "bool": pyarrow.bool_(),
+        "datetime": pyarrow.timestamp("s", tz="UTC")
+    }
+    types = type(lst).TYPES
+    data = {}
+    for name, values in columns(lst, fields).items():
+        kind = types.get(name)
+        if kind == "datetime":
+            numpy = require("numpy", NUMPY_TEXT)
+            data[name] = pyarrow.array(numpy_column(numpy, values, kind), type=kinds[kind], from_pandas=True)
+        elif kind is not None:
+            data[name] = pyarrow.array(values, type=kinds[kind])
+        else:
+            try:
+                data[name] = pyarrow.array(values)
+            except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+                # dicts and lists of different shapes, they stay as JSON text
+                data[name] = pyarrow.array([None if value is None else dumps(value) for value in values])
+    return pyarrow.table(data)
@@ -0,0 +1,242 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import re
+import sqlite3
+from time import time
+from functools import partial
+from threading import Lock
+from asyncio import get_running_loop
+from .jsonlib import dumps, loads
+
+# how long (seconds) entities are fresh
+ENTITY_TTLS: dict[str, float] = {
+    "link": 7 * 24 * 60 * 60,  # get_from_code, links almost never change
+    "community": 60 * 60,      # get_community_info
+    "user": 10 * 60            # get_user_info
+}
+
+# writes that make stored entities outdated: write path -> (kind, scope, key) to drop
+# (`{name}` is replaced with group of write path, missing group is "", key None drops whole scope)
+ENTITY_INVALIDATIONS: dict[str, list[tuple[str, str, str | None]]] = {
+    # join_community, leave_community, request_join_community, membership requests (ACM)
+    r"^/x(?P<comId>\d+)/s/community/(join|leave|membership-request)": [
+        ("community", "", "{comId}"),
+        ("user", "{comId}", None)
+    ],
+    # configuration, settings and guideline of community (ACM)
+    r"^/x(?P<comId>\d+)/s/community/(configuration|settings|guideline)": [
+        ("community", "", "{comId}")
+    ],
+    r"^/g/s-x(?P<comId>\d+)/community/": [
+        ("community", "", "{comId}")
+    ],
+    # edit_profile, follow, ban, admin actions, comments: profile in path
+    r"^/(g/s|x(?P<comId>\d+)/s)/user-profile/(?P<userId>[^/]+)": [
+        ("user", "{comId}", "{userId}")
+    ],
+    # unfollow: profile of one who unfollowed too
+    r"^/(g/s|x(?P<comId>\d+)/s)/user-profile/[^/]+/member/(?P<userId>[^/]+)": [
+        ("user", "{comId}", "{userId}")
+    ],
+    # follow: followed users are in body, not in path
+    r"^/(g/s|x(?P<comId>\d+)/s)/user-profile/[^/]+/joined$": [
+        ("user", "{comId}", None)
+    ],
+    # block, unblock
+    r"^/g/s/block/(?P<userId>[^/]+)": [
+        ("user", "", "{userId}")
+    ]
+}
+
+# expired and extra entities are removed every N writes
+PRUNE_EVERY = 100
+
+class EntityStore:
+    '''
+        Persistent cache of entities (user profiles, communities, resolved links) in SQLite.
+
+        Entities are keyed by kind ("link", "community", "user"), viewer (userId of account
+        that got it, as answers have fields like `followingStatus` or membership that depend on it),
+        scope (comId or "" for global) and key (link, comId or objectId). Database can be shared
+        by many processes and survives restarts, so repeated jobs don't resolve same things again.
+        Writes from `ENTITY_INVALIDATIONS` drop related entities of all viewers.
+
+        Database can be locked by other process for a while, so async clients use
+        `get_async` / `put_async` / `delete_async`, that run in thread and don't block event loop.
+    '''
+    def __init__(
+            self,
+            path: str = "aminofixfix.sqlite3",
+            ttls: dict[str, float] | None = None,
+            max_entries: int = 100_000
+        ):
+        '''
+            Init of entity store.
+
+            Args:
+            - path: str = "aminofixfix.sqlite3"
+                - file of database, ":memory:" for store that lives only in this process
+            - ttls: dict[str, float] | None = None
+                - {kind: seconds}, replaces values from `ENTITY_TTLS`
+                - 0 to not store kind
+            - max_entries: int = 100_000
+                - oldest entities are removed if there are more
+                - checked every `PRUNE_EVERY` writes, so store can be a bit bigger between checks
+        '''
+        self.path = path
+        self.ttls = ENTITY_TTLS | (ttls or {})
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.__lock = Lock()
+        self.__writes = 0
+        self.__invalidations = [
+            (re.compile(pattern), targets) for pattern, targets in ENTITY_INVALIDATIONS.items()
+        ]
+        # one connection guarded by lock, so ":memory:" works too
+        self.__db = self.__connect()
+
+    def __connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.path, timeout=10, isolation_level=None, check_same_thread=False)
+        if self.path != ":memory:":
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        columns = [row[1] for row in connection.execute("PRAGMA table_info(entities)")]
+        if columns and "viewer" not in columns:
+            # store of older version (without viewer), it is only cache
+            connection.execute("DROP TABLE entities")
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS entities ("
+            "kind TEXT NOT NULL, viewer TEXT NOT NULL, scope TEXT NOT NULL, key TEXT NOT NULL, "
+            "payload TEXT NOT NULL, expires REAL NOT NULL, updated REAL NOT NULL, "
+            "PRIMARY KEY (kind, viewer, scope, key))"
+        )
+        connection.execute("CREATE INDEX IF NOT EXISTS entities_updated ON entities (updated)")
+        return connection
+
+    def stats(self) -> dict[str, int]:
+        with self.__lock:
+            size = self.__db.execute("SELECT COUNT(*) FROM entities").fetchone()[0]
+        return {"hits": self.hits, "misses": self.misses, "size": size}
+
+    def get(self, kind: str, key: str | int, scope: str | int | None = None, viewer: str | None = None) -> dict | None:
+        '''
+            Get fresh entity that `viewer` (userId of account) got, None if there is no one.
+        '''
+        if not self.ttls.get(kind):
+            return None
+
+        with self.__lock:
+            row = self.__db.execute(
+                "SELECT payload FROM entities WHERE kind = ? AND viewer = ? AND scope = ? AND key = ? AND expires > ?",
+                (kind, viewer or "", str(scope or ""), str(key), time())
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return loads(row[0])
+
+    def put(self, kind: str, key: str | int, payload: dict, scope: str | int | None = None, viewer: str | None = None):
+        '''
+            Save entity (JSON from API) that `viewer` (userId of account) got.
+        '''
+        ttl = self.ttls.get(kind)
+        if not ttl:
+            return
+
+        now = time()
+        with self.__lock:
+            self.__db.execute(
+                "INSERT OR REPLACE INTO entities (kind, viewer, scope, key, payload, expires, updated) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (kind, viewer or "", str(scope or ""), str(key), dumps(payload), now + ttl, now)
+            )
+            self.__writes += 1
+            if self.__writes % PRUNE_EVERY == 0:
+                self.__prune(now)
+
+    def delete(self, kind: str, key: str | int, scope: str | int | None = None):
+        '''
+            Drop entity (after you changed it), for all viewers.
+        '''
+        with self.__lock:
+            self.__db.execute(
+                "DELETE FROM entities WHERE kind = ? AND scope = ? AND key = ?",
+                (kind, str(scope or ""), str(key))
+            )
+
+    def __targets(self, path: str) -> list[tuple[str, str, str | None]]:
+        path = path.split("?", 1)[0]
+        targets = []
+        for pattern, templates in self.__invalidations:
+            match = pattern.search(path)
+            if match:
+                groups = {name: value or "" for name, value in match.groupdict().items()}
+                targets.extend(
+                    (kind, scope.format(**groups), None if key is None else key.format(**groups))
+                    for kind, scope, key in templates
+                )
+        return targets
+
+    def __drop(self, targets: list[tuple[str, str, str | None]]):
+        with self.__lock:
+            for kind, scope, key in targets:
+                if key is None:
+                    self.__db.execute("DELETE FROM entities WHERE kind = ? AND scope = ?", (kind, scope))
+                else:
+                    self.__db.execute("DELETE FROM entities WHERE kind = ? AND scope = ? AND key = ?", (kind, scope, key))
+
+    def invalidate(self, path: str):
+        '''
+            Drop entities made outdated by write request to `path`.
+        '''
+        targets = self.__targets(path)
+        if targets:
+            self.__drop(targets)
+
+    async def get_async(self, kind: str, key: str | int, scope: str | int | None = None, viewer: str | None = None) -> dict | None:
+        '''
+            `get` in thread, for async clients.
+        '''
+        return await get_running_loop().run_in_executor(None, partial(self.get, kind, key, scope, viewer))
+
+    async def put_async(self, kind: str, key: str | int, payload: dict, scope: str | int | None = None, viewer: str | None = None):
+        '''
+            `put` in thread, for async clients.
+        '''
+        await get_running_loop().run_in_executor(None, partial(self.put, kind, key, payload, scope, viewer))
+
+    async def delete_async(self, kind: str, key: str | int, scope: str | int | None = None):
+        '''
+            `delete` in thread, for async clients.
+        '''
+        await get_running_loop().run_in_executor(None, partial(self.delete, kind, key, scope))
+
+    async def invalidate_async(self, path: str):
+        '''
+            `invalidate` in thread, for async clients (only if write made something outdated).
+        '''
+        targets = self.__targets(path)
+        if targets:
+            await get_running_loop().run_in_executor(None, partial(self.__drop, targets))
+
+    def prune(self):
+        '''
+            Remove expired entities and oldest ones above `max_entries`.
+        '''
+        with self.__lock:
+            self.__prune(time())
+
+    def __prune(self, now: float):
+        self.__db.execute("DELETE FROM entities WHERE expires <= ?", (now,))
+        extra = self.__db.execute("SELECT COUNT(*) FROM entities").fetchone()[0] - self.max_entries
+        if extra > 0:
+            self.__db.execute(
+                "DELETE FROM entities WHERE rowid IN (SELECT rowid FROM entities ORDER BY updated LIMIT ?)",
+                (extra,)
+            )
+
+    def clear(self):
+        with self.__lock:
+            self.__db.execute("DELETE FROM entities")
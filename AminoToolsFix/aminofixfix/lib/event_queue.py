@@ -0,0 +1,175 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from typing import Any
+from threading import Condition
+from collections import deque
+from time import monotonic
+
+POLICIES = ("block", "drop_oldest", "drop_typing", "priority")
+
+# typing, recording and other chat actions: they are outdated in few seconds anyway
+TYPING = {304: -1, 306: -1}
+
+class EventQueue:
+    '''
+        Bounded queue of socket frames between socket and handlers.
+
+        Socket thread only parses frame and puts it here, handlers are run from other
+        thread. When handlers can't keep up with frames, queue fills up and `policy` decides what happens:
+        - block: socket waits for room (nothing is lost, but bot falls behind and server may drop connection)
+        - drop_oldest: oldest frame is dropped
+        - drop_typing: oldest frame of lowest priority (typing and other chat actions by default) is dropped,
+        other frames are dropped (oldest first) only when there are no such frames
+        - priority: like drop_typing, but frames of higher priority are also handled first
+
+        Counters:
+        - received: int
+            - frames that came from socket
+        - handled: int
+            - frames that were taken by handlers
+        - dropped: int
+            - frames that were dropped, `dropped_types` has them by `t`
+        - delayed: int
+            - frames that had to wait for room (only with block)
+        - max_depth: int
+            - most frames in queue seen so far
+        - max_wait: float
+            - longest time (seconds) frame spent in queue
+    '''
+    def __init__(self, maxsize: int = 1000, policy: str = "drop_typing", priorities: dict[int, int] | None = None):
+        '''
+            Init of event queue.
+
+            Args:
+            - maxsize: int = 1000
+                - frames that can wait for handlers
+            - policy: str = "drop_typing"
+                - "block", "drop_oldest", "drop_typing" or "priority"
+            - priorities: dict[int, int] | None = None
+                - priority by `t` of frame, frames that are not here have 0
+                - higher is handled first (with priority) and dropped last
+                - typing and other chat actions (`t` 304 and 306) have -1 if None
+        '''
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown policy {policy!r}, use one of: {', '.join(POLICIES)}")
+        if maxsize < 1:
+            raise ValueError("EventQueue needs maxsize of at least 1")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.priorities: dict[int, int] = dict(TYPING if priorities is None else priorities)
+        # priority -> (number, time, frame), lowest priority first
+        self.__levels: dict[int, deque] = {}
+        self.__size = 0
+        self.__number = 0
+        self.__closed = False
+        self.__condition = Condition()
+
+        self.received = 0
+        self.handled = 0
+        self.dropped = 0
+        self.dropped_types: dict[Any, int] = {}
+        self.delayed = 0
+        self.max_depth = 0
+        self.max_wait = 0.0
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def __level(self, priority: int) -> deque:
+        level = self.__levels.get(priority)
+        if level is None:
+            level = self.__levels[priority] = deque()
+            self.__levels = dict(sorted(self.__levels.items()))
+        return level
+
+    def __drop(self, frame: dict):
+        self.dropped += 1
+        t = frame.get("t")
+        self.dropped_types[t] = self.dropped_types.get(t, 0) + 1
+
+    def __make_room(self, priority: int) -> bool:
+        # False if new frame itself should be dropped
+        if self.policy == "drop_oldest":
+            level = min((level for level in self.__levels.values() if level), key=lambda level: level[0][0])
+        else:
+            lowest, level = next((lowest, level) for lowest, level in self.__levels.items() if level)
+            if priority < lowest:
+                return False
+        self.__drop(level.popleft()[2])
+        self.__size -= 1
+        return True
+
+    def put(self, frame: dict):
+        '''
+            Add frame (parsed JSON) from socket. Blocks only with "block" policy.
+        '''
+        priority = self.priorities.get(frame.get("t"), 0)
+        with self.__condition:
+            self.received += 1
+            if self.__size >= self.maxsize:
+                if self.policy == "block":
+                    self.delayed += 1
+                    self.__condition.wait_for(lambda: self.__size < self.maxsize or self.__closed)
+                    if self.__closed:
+                        # woken up by `close`, queue is still full and nobody will take frame
+                        self.__drop(frame)
+                        return
+                elif not self.__make_room(priority):
+                    self.__drop(frame)
+                    return
+            self.__number += 1
+            self.__level(priority).append((self.__number, monotonic(), frame))
+            self.__size += 1
+            if self.__size > self.max_depth:
+                self.max_depth = self.__size
+            self.__condition.notify_all()
+
+    def get(self) -> dict | None:
+        '''
+            Next frame for handlers, waits until there is one. None if queue was closed.
+        '''
+        with self.__condition:
+            self.__condition.wait_for(lambda: self.__size or self.__closed)
+            if not self.__size:
+                return None
+            levels = [level for level in self.__levels.values() if level]
+            if self.policy == "priority":
+                level = levels[-1]
+            else:
+                level = min(levels, key=lambda level: level[0][0])
+            _, added, frame = level.popleft()
+            self.__size -= 1
+            self.handled += 1
+            wait = monotonic() - added
+            if wait > self.max_wait:
+                self.max_wait = wait
+            self.__condition.notify_all()
+            return frame
+
+    def close(self):
+        '''
+            Wake up everything that waits. `get` returns frames that are left, then None.
+        '''
+        with self.__condition:
+            self.__closed = True
+            self.__condition.notify_all()
+
+    def open(self):
+        '''
+            Allow waiting again after `close`.
+        '''
+        with self.__condition:
+            self.__closed = False
+
+    def stats(self) -> dict[str, Any]:
+        return {
+            "received": self.received,
+            "handled": self.handled,
+            "dropped": self.dropped,
+            "dropped_types": dict(self.dropped_types),
+            "delayed": self.delayed,
+            "queued": self.__size,
+            "max_depth": self.max_depth,
+            "max_wait": self.max_wait
+        }
@@ -1,7 +1,7 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
-from json import loads
+from .jsonlib import loads
 
 class UnsupportedService(Exception):
     """
@@ -727,6 +727,20 @@ class UnknownResponse(Exception):
     def __init__(*args, **kwargs):
         Exception.__init__(*args, **kwargs)
 
+class DeadlineExceeded(TimeoutError):
+    """
+    Raised when request didn't fit in deadline you set with `Client.deadline()` or `timeout`.
+    """
+    def __init__(*args, **kwargs):
+        TimeoutError.__init__(*args, **kwargs)
+
+class RawNotRetained(AttributeError):
+    """
+    Raised when you read JSON of object (`raw()` or `json`) that was dropped after parsing (`retain_raw=False`).
+    """
+    def __init__(*args, **kwargs):
+        AttributeError.__init__(*args, **kwargs)
+
 class NotLoggedIn(Exception):
     """
     Raised when you try to make an action but you aren't logged in.
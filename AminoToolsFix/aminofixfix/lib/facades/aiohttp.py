@@ -1,51 +1,243 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
-from json import loads
-from aiohttp import ClientSession, ClientResponse
+from ..jsonlib import loads
+from itertools import cycle
+from typing import TYPE_CHECKING
+from ssl import SSLContext, create_default_context
+from warnings import warn
+from asyncio import sleep, get_running_loop, run_coroutine_threadsafe, TimeoutError as AsyncTimeoutError
+from aiohttp import ClientSession, ClientResponse, ClientTimeout, TCPConnector
+from aiohttp import ClientConnectionError, ClientConnectorError
+
+from ..retry import RetryPolicy
+from ..ratelimit import RateLimit
+from ..singleflight import Singleflight, request_key
+from ..cache import ResponseCache
+from ..entity_store import EntityStore
+from ..helpers import join_url
+from ..exceptions import DeadlineExceeded
+from ..timeouts import remaining, capped_timeout_values
+
+if TYPE_CHECKING:
+    from httpx import Timeout as TimeoutConfig
+
+# one SSL context for all sessions, building it (loading CA bundle) is not cheap
+_ssl_context: SSLContext | None = None
+
+def shared_ssl_context() -> SSLContext:
+    '''
+        Default SSL context, made once per process.
+    '''
+    global _ssl_context
+    if _ssl_context is None:
+        _ssl_context = create_default_context()
+    return _ssl_context
+
+def proxy_list(proxies: dict | list | str | None) -> list[str]:
+    '''
+        Make list of proxies from anything you can pass as `proxies`.
+    '''
+    if not proxies:
+        return []
+    if isinstance(proxies, str):
+        return [proxies]
+    if isinstance(proxies, dict):
+        return list(proxies.values())
+    return list(proxies)
+
+def make_timeout(timeout: TimeoutConfig | float | None, limit: float | None) -> ClientTimeout:
+    '''
+        Map `TimeoutConfig` onto `aiohttp.ClientTimeout`, whole request can't be longer than `limit`.
+
+        - pool + connect -> connect (aiohttp counts waiting for free connection in it)
+        - connect -> sock_connect
+        - read -> sock_read
+        - write has no analog in aiohttp
+    '''
+    connect, read, write, pool = capped_timeout_values(timeout, limit)
+    return ClientTimeout(
+        total=limit,
+        connect=pool + connect if pool is not None and connect is not None else None,
+        sock_connect=connect,
+        sock_read=read
+    )
 
 class AiohttpClient:
     '''
         Facade for aiohttp library to be compactable with HTTPX client style.
-        Also made for escaping 429.
+        Also made for escaping 429, retries are controlled by `RetryPolicy`.
 
-        [TODO]: timeouts
+        Timeouts are mapped from `TimeoutConfig` onto `aiohttp.ClientTimeout` (see `make_timeout`).
+
+        Session is made on first request, inside of running event loop.
     '''
-    def __init__(self, headers: dict, base_url: str, proxies: dict | str | None = {}, **kwargs):
+    def __init__(
+            self,
+            headers: dict,
+            base_url: str,
+            proxies: dict | list | str | None = None,
+            timeout: TimeoutConfig | float | None = 30,
+            retry_policy: RetryPolicy | None = None,
+            rate_limit: RateLimit | None = None,
+            singleflight: Singleflight | None = None,
+            cache: ResponseCache | None = None,
+            entity_store: EntityStore | None = None,
+            connection_limit: int = 100,
+            connection_limit_per_host: int = 0,
+            dns_cache_ttl: int | None = 300,
+            keepalive_timeout: float = 30,
+            verify: bool = True,
+            **kwargs
+        ):
         '''
             Init of aiohttp Client.
 
-            If you pass dict as proxies, first proxy in dict will be chosen.
+            Args:
+            - proxies: dict | list | str | None = None
+                - if you pass many proxies (dict or list), they will be rotated every request
+            - connection_limit: int = 100
+                - max opened connections, 0 for no limit
+            - connection_limit_per_host: int = 0
+                - max opened connections to one host, 0 for no limit
+            - dns_cache_ttl: int | None = 300
+                - seconds to cache resolved hosts, None to cache forever
+            - keepalive_timeout: float = 30
+                - seconds to keep idle connection opened
+            - verify: bool = True
+                - verify SSL certificates (one SSL context is shared by all sessions)
         '''
-        self.__proxies = list(proxies.values())[0] if isinstance(proxies, dict) else proxies
+        self.__proxies = proxy_list(proxies)
+        self.__proxy_rotation = cycle(self.__proxies) if len(self.__proxies) > 1 else None
         self.__base_url = base_url
         self.__main_headers = headers
+        self.__retry_policy = retry_policy or RetryPolicy()
+        self.__rate_limit = rate_limit
+        self.__singleflight = singleflight
+        self.__cache = cache
+        self.__entity_store = entity_store
+        self.__timeout = timeout
+        self.__connector_settings = dict(
+            limit=connection_limit,
+            limit_per_host=connection_limit_per_host,
+            ttl_dns_cache=dns_cache_ttl,
+            use_dns_cache=True,
+            keepalive_timeout=keepalive_timeout,
+            ssl=shared_ssl_context() if verify else False
+        )
+
+        self.__client: ClientSession | None = None
+        self.__loop = None
+
+    def __session(self) -> ClientSession:
+        '''
+            Get session of running loop, make it if needed.
+        '''
+        loop = get_running_loop()
+        if self.__client is None or self.__client.closed or self.__loop is not loop:
+            # session of another (probably closed) loop can't be used here
+            if self.__client is not None and not self.__client.closed:
+                self.__retire(self.__client, self.__loop)
+            self.__client = ClientSession(
+                headers=self.__main_headers,
+                timeout=make_timeout(self.__timeout, None),
+                connector=TCPConnector(**self.__connector_settings)
+            )
+            self.__loop = loop
+        return self.__client
 
-        self.__client: ClientSession = ClientSession(
-            headers=self.__main_headers
+    def __retire(self, session: ClientSession, loop):
+        '''
+            Close session of another event loop.
+        '''
+        if loop is not None and loop.is_running():
+            # that loop still works (in other thread), so session is closed there
+            run_coroutine_threadsafe(session.close(), loop)
+            return
+        # loop is gone and its connections can't be closed anymore, so they are only dropped
+        session.detach()
+        warn(
+            "aiohttp session of event loop that is not running anymore was dropped, "
+            "call `close()` of client before its loop is closed",
+            ResourceWarning,
+            stacklevel=3
         )
 
+    def __next_proxy(self) -> str | None:
+        if self.__proxy_rotation is not None:
+            return next(self.__proxy_rotation)
+        return self.__proxies[0] if self.__proxies else None
+
+    async def close(self):
+        '''
+            Close session and all its connections.
+        '''
+        if self.__client is not None and not self.__client.closed:
+            await self.__client.close()
+        self.__client = None
+
     async def request(
         self,
         method: str,
         url: str,
         headers: dict = {},
         data: str | dict | bytes | None = None,
+        timeout: TimeoutConfig | float | None = None,
         **kwargs
     ) -> AiohttpResponse:
+        '''
+            Request.
+
+            Args: 
+            - method: str (GET, POST, DELETE, PUT)
+            - url: str
+            - headers: dict = {}
+            - data: str | dict | bytes | None = None
+            - timeout: TimeoutConfig | float | None = None
+                - number is deadline for whole request (retries included)
+                - TimeoutConfig replaces timeouts of client for this request
+
+            Returns:
+            - object `AiohttpResponse`
+        '''
+        retry = self.__retry_policy.start(remaining(timeout))
+        base_timeout = self.__timeout if timeout is None or isinstance(timeout, (int, float)) else timeout
         while True:
-            async with await self.__client.request(
-                method=method,
-                url=self.__base_url+url,
-                headers=headers,
-                data=data,
-                ssl=False,
-                proxy=self.__proxies
-            ) as resp:
-                if resp.status not in [429]:
-                    answer = AiohttpResponse(resp)
-                    await answer._init()
-                    return answer
+            proxy = self.__next_proxy()
+            if self.__rate_limit:
+                wait = self.__rate_limit.reserve(method, headers, proxy)
+                if wait:
+                    await sleep(wait)
+
+            left = retry.remaining()
+            if left == 0:
+                raise DeadlineExceeded()
+
+            try:
+                async with await self.__session().request(
+                    method=method,
+                    url=join_url(self.__base_url, url),
+                    headers=headers,
+                    data=data,
+                    proxy=proxy,
+                    timeout=make_timeout(base_timeout, left)
+                ) as resp:
+                    delay = None
+                    if self.__retry_policy.should_retry_status(resp.status):
+                        delay = retry.next_delay(resp.headers.get("Retry-After"))
+                    if delay is None:
+                        answer = AiohttpResponse(resp)
+                        await answer._init()
+                        return answer
+            except (ClientConnectionError, AsyncTimeoutError) as e:
+                if left is not None and retry.remaining() == 0:
+                    raise DeadlineExceeded() from e
+                if not self.__retry_policy.should_retry_error(method, isinstance(e, ClientConnectorError)):
+                    raise
+                delay = retry.next_delay()
+                if delay is None:
+                    raise
+            await sleep(delay)
     
     async def get(
         self,
@@ -64,7 +256,23 @@ class AiohttpClient:
             Returns:
             - object `AiohttpResponse`
         '''
-        return await self.request("GET", url, headers)  
+        full_url = join_url(self.__base_url, url)
+        if self.__cache is not None:
+            cached = self.__cache.lookup(full_url, url, headers)
+            if cached is not None:
+                return cached
+
+        if self.__singleflight is None or kwargs.get("timeout") is not None:
+            response = await self.request("GET", url, headers, timeout=kwargs.get("timeout"))
+        else:
+            response = await self.__singleflight.do_async(
+                request_key(full_url, headers),
+                lambda: self.request("GET", url, headers)
+            )
+
+        if self.__cache is not None:
+            self.__cache.store(full_url, url, headers, response)
+        return response
     
     async def post(self, url: str, headers: dict = {}, data: str | dict | bytes | None = None, **kwargs) -> AiohttpResponse:
         '''
@@ -79,7 +287,12 @@ class AiohttpClient:
             Returns:
             - object `AiohttpResponse`
         '''
-        return await self.request("POST", url, headers, data)  
+        response = await self.request("POST", url, headers, data, timeout=kwargs.get("timeout"))
+        if self.__cache is not None:
+            self.__cache.invalidate(url)
+        if self.__entity_store is not None:
+            await self.__entity_store.invalidate_async(url)
+        return response  
     
     async def delete(self, url: str, headers: dict = {}, data: str | dict | bytes | None = None, **kwargs) -> AiohttpResponse:
         '''
@@ -94,7 +307,12 @@ class AiohttpClient:
             Returns:
             - object `AiohttpResponse`
         '''
-        return await self.request("DELETE", url, headers, data)  
+        response = await self.request("DELETE", url, headers, data, timeout=kwargs.get("timeout"))
+        if self.__cache is not None:
+            self.__cache.invalidate(url)
+        if self.__entity_store is not None:
+            await self.__entity_store.invalidate_async(url)
+        return response  
     
 class AiohttpResponse:
     '''
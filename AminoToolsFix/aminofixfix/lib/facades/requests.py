@@ -1,20 +1,60 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
+from time import sleep
+from typing import TYPE_CHECKING
 from requests import Session, Response
+from requests.exceptions import ConnectionError, ConnectTimeout, Timeout
+from urllib3.exceptions import NewConnectionError
+
+from ..retry import RetryPolicy
+from ..ratelimit import RateLimit
+from ..singleflight import Singleflight, request_key
+from ..jsonlib import fast_json
+from ..cache import ResponseCache
+from ..entity_store import EntityStore
+from ..helpers import join_url
+from ..exceptions import DeadlineExceeded
+from ..timeouts import remaining, capped_timeout_values
+
+if TYPE_CHECKING:
+    from httpx import Timeout as TimeoutConfig
+
+def is_connect_error(error: Exception) -> bool:
+    '''
+        Check if error happened before request reached server.
+    '''
+    if isinstance(error, ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+def make_timeout(timeout: TimeoutConfig | float | None, limit: float | None) -> tuple[float | None, float | None]:
+    '''
+        (connect, read) timeouts for requests, no one can be longer than `limit`.
+        Requests has no write and pool timeouts.
+    '''
+    connect, read, write, pool = capped_timeout_values(timeout, limit)
+    return (connect, read)
 
 class RequestsClient:
     '''
         Facade for Requests library to be compactable with HTTPX client style.
-        Also made for escaping 429.
+        Also made for escaping 429, retries are controlled by `RetryPolicy`.
 
-        [TODO]: timeouts
+        Timeouts are taken from `TimeoutConfig` (only connect and read, requests has no others).
     '''
     def __init__(
             self,
             headers: dict,
             base_url: str,
             proxies: dict = {},
+            timeout: TimeoutConfig | float | None = 30,
+            retry_policy: RetryPolicy | None = None,
+            rate_limit: RateLimit | None = None,
+            singleflight: Singleflight | None = None,
+            cache: ResponseCache | None = None,
+            entity_store: EntityStore | None = None,
             **kwargs
         ):
         '''
@@ -23,14 +63,21 @@ class RequestsClient:
         self.__client: Session = Session()
         self.__base_url = base_url
         self.__proxies = proxies
+        self.__timeout = timeout
         self.__main_headers = headers
+        self.__retry_policy = retry_policy or RetryPolicy()
+        self.__rate_limit = rate_limit
+        self.__singleflight = singleflight
+        self.__cache = cache
+        self.__entity_store = entity_store
 
     def request(
             self,
             method: str,
             path: str,
             headers: dict = {},
-            data: str | bytes | dict | None = None
+            data: str | bytes | dict | None = None,
+            timeout: TimeoutConfig | float | None = None
         ) -> Response:
         '''
             Request.
@@ -39,21 +86,53 @@ class RequestsClient:
             - method: str (GET, POST, DELETE, PUT)
             - url: str
             - headers: dict = {}
+            - timeout: TimeoutConfig | float | None = None
+                - number is deadline for whole request (retries included)
+                - TimeoutConfig replaces timeouts of client for this request
             - etc. just for not breaking stuff
 
             Returns:
             - object `requests.Response`
         '''
+        headers = self.__main_headers | headers
+        retry = self.__retry_policy.start(remaining(timeout))
+        base_timeout = self.__timeout if timeout is None or isinstance(timeout, (int, float)) else timeout
         while True:
-            r = self.__client.request(
-                method=method,
-                url = self.__base_url + path,
-                headers=self.__main_headers | headers,
-                proxies=self.__proxies,
-                data=data
-            ) 
-            if r.status_code != 429:
-                return r
+            if self.__rate_limit:
+                wait = self.__rate_limit.reserve(method, headers, self.__proxies)
+                if wait:
+                    sleep(wait)
+
+            left = retry.remaining()
+            if left == 0:
+                raise DeadlineExceeded()
+
+            try:
+                r = self.__client.request(
+                    method=method,
+                    url=join_url(self.__base_url, path),
+                    headers=headers,
+                    proxies=self.__proxies,
+                    data=data,
+                    timeout=make_timeout(base_timeout, left)
+                )
+            except (ConnectionError, Timeout) as e:
+                if left is not None and retry.remaining() == 0:
+                    raise DeadlineExceeded() from e
+                if not self.__retry_policy.should_retry_error(method, is_connect_error(e)):
+                    raise
+                delay = retry.next_delay()
+                if delay is None:
+                    raise
+                sleep(delay)
+                continue
+
+            if not self.__retry_policy.should_retry_status(r.status_code):
+                return fast_json(r)
+            delay = retry.next_delay(r.headers.get("Retry-After"))
+            if delay is None:
+                return fast_json(r)
+            sleep(delay)
     
     def get(
             self,
@@ -72,7 +151,23 @@ class RequestsClient:
             Returns:
             - object `requests.Response`
         '''
-        return self.request("GET", path, headers)
+        full_url = join_url(self.__base_url, path)
+        if self.__cache is not None:
+            cached = self.__cache.lookup(full_url, path, headers)
+            if cached is not None:
+                return cached
+
+        if self.__singleflight is None or kwargs.get("timeout") is not None:
+            response = self.request("GET", path, headers, timeout=kwargs.get("timeout"))
+        else:
+            response = self.__singleflight.do(
+                request_key(full_url, headers),
+                lambda: self.request("GET", path, headers)
+            )
+
+        if self.__cache is not None:
+            self.__cache.store(full_url, path, headers, response)
+        return response
     
     def post(
             self,
@@ -93,7 +188,12 @@ class RequestsClient:
             Returns:
             - object `requests.Response`
         '''
-        return self.request("POST", path, headers, data)
+        response = self.request("POST", path, headers, data, timeout=kwargs.get("timeout"))
+        if self.__cache is not None:
+            self.__cache.invalidate(path)
+        if self.__entity_store is not None:
+            self.__entity_store.invalidate(path)
+        return response
     
     def delete(
             self,
@@ -114,4 +214,9 @@ class RequestsClient:
             Returns:
             - object `requests.Response`
         '''
-        return self.request("DELETE", path, headers, data)
\ No newline at end of file
+        response = self.request("DELETE", path, headers, data, timeout=kwargs.get("timeout"))
+        if self.__cache is not None:
+            self.__cache.invalidate(path)
+        if self.__entity_store is not None:
+            self.__entity_store.invalidate(path)
+        return response
\ No newline at end of file
@@ -1,13 +1,51 @@
 from __future__ import annotations
 # ^ this thing should fix problem for python3.9 and lower(?)
 
+from time import sleep
+from threading import BoundedSemaphore, Lock
 from httpx import Response
+from httpx import TransportError, LocalProtocolError, ConnectError, ConnectTimeout, PoolTimeout
 from httpx import Timeout as TimeoutConfig
 from httpx import Client as HTTPXSYNCCLIENT
 
+from ..retry import RetryPolicy
+from ..ratelimit import RateLimit
+from ..helpers import join_url
+from ..singleflight import Singleflight, request_key
+from ..jsonlib import fast_json
+from ..cache import ResponseCache
+from ..entity_store import EntityStore
+from ..exceptions import DeadlineExceeded
+from ..timeouts import remaining, capped_timeout_values
+
+# errors that happened before request reached server
+CONNECT_ERRORS = (ConnectError, ConnectTimeout, PoolTimeout)
+
+def make_timeout(timeout: TimeoutConfig | float | None, limit: float | None) -> TimeoutConfig:
+    '''
+        Timeout config for one attempt, no phase can be longer than `limit`.
+    '''
+    connect, read, write, pool = capped_timeout_values(timeout, limit)
+    return TimeoutConfig(connect=connect, read=read, write=write, pool=pool)
+
+def breaks_http2(error: Exception) -> bool:
+    '''
+        True if HTTP/2 itself failed (negotiation or framing),
+        not if server just closed connection (it happens with keep-alive).
+    '''
+    if isinstance(error, LocalProtocolError):
+        return True
+    cause = error.__cause__
+    while cause is not None:
+        if type(cause).__module__.startswith("h2."):
+            return True
+        cause = cause.__cause__
+    return False
+
 class SyncHttpxClient:
     '''
         Facade for HTTPX library. Made for escaping 429.
+        Retries are controlled by `RetryPolicy`.
     '''
     def __init__(
             self,
@@ -16,31 +54,97 @@ class SyncHttpxClient:
             proxies: dict = {},
             timeout: TimeoutConfig | int = 30,
             http2_enabled: bool = False,
+            max_concurrent_streams: int | None = None,
+            retry_policy: RetryPolicy | None = None,
+            rate_limit: RateLimit | None = None,
+            singleflight: Singleflight | None = None,
+            cache: ResponseCache | None = None,
+            entity_store: EntityStore | None = None,
             **kwargs
         ):
         '''
             Init of HTTPX Client.
+
+            If `http2_enabled` is True, HTTP/2 is negotiated with server (HTTP/1.1 is used if server can't),
+            so all requests can go through one connection.
+            `max_concurrent_streams` limits how much requests can be in flight at once.
         '''
         self.__proxies = proxies
         self.__timeout = timeout
         self.__base_url = base_url
         self.__main_headers = headers
         self.__http2_enabled = http2_enabled
-        self.__client: HTTPXSYNCCLIENT = HTTPXSYNCCLIENT(
-            base_url = self.__base_url,
-            proxies  = self.__proxies,
-            timeout  = self.__timeout,
-            headers  = self.__main_headers,
-            http2    = self.__http2_enabled,
-            follow_redirects = True
-        )
+        self.__retry_policy = retry_policy or RetryPolicy()
+        self.__rate_limit = rate_limit
+        self.__singleflight = singleflight
+        self.__cache = cache
+        self.__entity_store = entity_store
+        self.__streams = BoundedSemaphore(max_concurrent_streams) if max_concurrent_streams else None
+        # client -> requests that use it now, so replaced client is closed after them
+        self.__in_flight: dict[HTTPXSYNCCLIENT, int] = {}
+        self.__lock = Lock()
+        self.__client: HTTPXSYNCCLIENT = self.__make_client()
+
+    def __make_client(self) -> HTTPXSYNCCLIENT:
+        try:
+            return HTTPXSYNCCLIENT(
+                base_url = self.__base_url,
+                proxies  = self.__proxies,
+                timeout  = self.__timeout,
+                headers  = self.__main_headers,
+                http2    = self.__http2_enabled,
+                follow_redirects = True
+            )
+        except ImportError:
+            if not self.__http2_enabled:
+                raise
+            # `h2` is not installed, so only HTTP/1.1 is available
+            self.__http2_enabled = False
+            return self.__make_client()
+
+    def __fallback_to_http1(self):
+        '''
+            Server or proxy breaks HTTP/2, so we are going back to HTTP/1.1.
+            Old client is closed when requests that already use it finish.
+        '''
+        with self.__lock:
+            if not self.__http2_enabled:
+                return
+            self.__http2_enabled = False
+            old, self.__client = self.__client, self.__make_client()
+            if old in self.__in_flight:
+                return
+        old.close()
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self.__http2_enabled
+
+    def __send(self, method: str, path: str, headers: dict, data: str | bytes | dict | None, timeout: TimeoutConfig) -> Response:
+        with self.__lock:
+            client = self.__client
+            self.__in_flight[client] = self.__in_flight.get(client, 0) + 1
+        try:
+            if self.__streams is None:
+                return client.request(method=method, url=path, headers=headers, data=data, timeout=timeout)
+            with self.__streams:
+                return client.request(method=method, url=path, headers=headers, data=data, timeout=timeout)
+        finally:
+            with self.__lock:
+                self.__in_flight[client] -= 1
+                done = not self.__in_flight[client]
+                if done:
+                    del self.__in_flight[client]
+            if done and client is not self.__client:
+                client.close()
 
     def request(
             self,
             method: str,
             path: str,
             headers: dict = {},
-            data: str | bytes | dict | None = None
+            data: str | bytes | dict | None = None,
+            timeout: TimeoutConfig | float | None = None
         ) -> Response:
         '''
             Request.
@@ -49,20 +153,48 @@ class SyncHttpxClient:
             - method: str (GET, POST, DELETE, PUT)
             - url: str
             - headers: dict = {}
+            - timeout: TimeoutConfig | float | None = None
+                - number is deadline for whole request (retries included)
+                - TimeoutConfig replaces timeouts of client for this request
             - etc. just for not breaking stuff
 
             Returns:
             - object `httpx.Response`
         '''
+        headers = self.__main_headers | headers
+        retry = self.__retry_policy.start(remaining(timeout))
+        base_timeout = timeout if isinstance(timeout, TimeoutConfig) else self.__timeout
         while True:
-            r = self.__client.request(
-                method  = method,
-                url     = path,
-                headers = self.__main_headers | headers,
-                data    = data
-            ) 
-            if r.status_code != 429:
-                return r
+            if self.__rate_limit:
+                wait = self.__rate_limit.reserve(method, headers, self.__proxies)
+                if wait:
+                    sleep(wait)
+
+            left = retry.remaining()
+            if left == 0:
+                raise DeadlineExceeded()
+
+            try:
+                r = self.__send(method, path, headers, data, make_timeout(base_timeout, left))
+            except TransportError as e:
+                if left is not None and retry.remaining() == 0:
+                    raise DeadlineExceeded() from e
+                if self.__http2_enabled and breaks_http2(e):
+                    self.__fallback_to_http1()
+                if not self.__retry_policy.should_retry_error(method, isinstance(e, CONNECT_ERRORS)):
+                    raise
+                delay = retry.next_delay()
+                if delay is None:
+                    raise
+                sleep(delay)
+                continue
+
+            if not self.__retry_policy.should_retry_status(r.status_code):
+                return fast_json(r)
+            delay = retry.next_delay(r.headers.get("Retry-After"))
+            if delay is None:
+                return fast_json(r)
+            sleep(delay)
     
     def get(
             self,
@@ -81,7 +213,23 @@ class SyncHttpxClient:
             Returns:
             - object `httpx.Response`
         '''
-        return self.request("GET", path, headers)
+        full_url = join_url(self.__base_url, path)
+        if self.__cache is not None:
+            cached = self.__cache.lookup(full_url, path, headers)
+            if cached is not None:
+                return cached
+
+        if self.__singleflight is None or kwargs.get("timeout") is not None:
+            response = self.request("GET", path, headers, timeout=kwargs.get("timeout"))
+        else:
+            response = self.__singleflight.do(
+                request_key(full_url, headers),
+                lambda: self.request("GET", path, headers)
+            )
+
+        if self.__cache is not None:
+            self.__cache.store(full_url, path, headers, response)
+        return response
     
     def post(
             self,
@@ -102,7 +250,12 @@ class SyncHttpxClient:
             Returns:
             - object `httpx.Response`
         '''
-        return self.request("POST", path, headers, data)
+        response = self.request("POST", path, headers, data, timeout=kwargs.get("timeout"))
+        if self.__cache is not None:
+            self.__cache.invalidate(path)
+        if self.__entity_store is not None:
+            self.__entity_store.invalidate(path)
+        return response
     
     def delete(
             self,
@@ -123,4 +276,9 @@ class SyncHttpxClient:
             Returns:
             - object `httpx.Response`
         '''
-        return self.request("DELETE", path, headers, data)
\ No newline at end of file
+        response = self.request("DELETE", path, headers, data, timeout=kwargs.get("timeout"))
+        if self.__cache is not None:
+            self.__cache.invalidate(path)
+        if self.__entity_store is not None:
+            self.__entity_store.invalidate(path)
+        return response
\ No newline at end of file
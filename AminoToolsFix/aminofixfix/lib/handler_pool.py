@@ -0,0 +1,125 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from typing import Any, Callable
+from queue import SimpleQueue
+from threading import Thread, Lock
+from collections import deque
+from time import perf_counter
+
+class HandlerPool:
+    '''
+        Worker threads for handlers of socket events.
+
+        Events are hashed by chat (`threadId`) onto queues of workers: events of one chat
+        are handled in order they came, different chats are handled in parallel.
+        Socket only puts events in queues, so slow handler stalls only its worker
+        (and chats that share it), not the whole stream.
+
+        Counters:
+        - handled: int
+            - how much events were handled
+        - errors: int
+            - how much handlers raised exception (it goes to `on_error` of `submit`, worker continues)
+        - max_depth: int
+            - longest queue of one worker seen so far
+    '''
+    def __init__(self, workers: int = 4, latency_window: int = 1024):
+        '''
+            Init of handler pool. Workers are started with first event.
+
+            Args:
+            - workers: int = 4
+                - threads (and queues), events of one chat always go to same one
+            - latency_window: int = 1024
+                - how much last latencies of handlers are kept for `stats()`
+        '''
+        if workers < 1:
+            raise ValueError("HandlerPool needs at least 1 worker")
+        self.workers = workers
+        self.__queues: list[SimpleQueue] = [SimpleQueue() for _ in range(workers)]
+        self.__threads: list[Thread] = []
+        self.__latencies: deque[float] = deque(maxlen=latency_window)
+        self.__lock = Lock()
+
+        self.handled = 0
+        self.errors = 0
+        self.max_depth = 0
+
+    def __start(self):
+        with self.__lock:
+            if self.__threads:
+                return
+            for index, queue in enumerate(self.__queues):
+                thread = Thread(target=self.__work, args=(queue,), name=f"aminofixfix-handlers-{index}", daemon=True)
+                thread.start()
+                self.__threads.append(thread)
+
+    def __work(self, queue: SimpleQueue):
+        while True:
+            task = queue.get()
+            if task is None:
+                return
+            function, args, on_error = task
+            started = perf_counter()
+            error = None
+            try:
+                function(*args)
+            except Exception as e:
+                error = e
+            latency = perf_counter() - started
+            with self.__lock:
+                self.__latencies.append(latency)
+                self.handled += 1
+                self.errors += error is not None
+            if error is not None and on_error is not None:
+                try:
+                    on_error(error)
+                except Exception:
+                    pass
+
+    def submit(self, key: Any, function: Callable[..., Any], *args, on_error: Callable[[Exception], Any] | None = None):
+        '''
+            Run `function(*args)` in worker of `key` (ID of chat), after earlier events of this key.
+            Exception of `function` is passed to `on_error` (socket reports it like other errors).
+        '''
+        if not self.__threads:
+            self.__start()
+        queue = self.__queues[hash(key) % self.workers]
+        queue.put((function, args, on_error))
+        depth = queue.qsize()
+        with self.__lock:
+            if depth > self.max_depth:
+                self.max_depth = depth
+
+    def depths(self) -> list[int]:
+        '''
+            Events waiting in queue of every worker.
+        '''
+        return [queue.qsize() for queue in self.__queues]
+
+    def stats(self) -> dict[str, float]:
+        latencies = sorted(self.__latencies)
+        count = len(latencies)
+        return {
+            "handled": self.handled,
+            "errors": self.errors,
+            "queued": sum(self.depths()),
+            "max_depth": self.max_depth,
+            "latency_avg": sum(latencies) / count if count else 0.0,
+            "latency_p50": latencies[count // 2] if count else 0.0,
+            "latency_p99": latencies[min(count - 1, count * 99 // 100)] if count else 0.0,
+            "latency_max": latencies[-1] if count else 0.0
+        }
+
+    def close(self, wait: bool = True):
+        '''
+            Stop workers after events that are already queued.
+        '''
+        for queue in self.__queues:
+            queue.put(None)
+        if wait:
+            for thread in self.__threads:
+                thread.join()
+        self.__threads = []
+        self.__queues = [SimpleQueue() for _ in range(self.workers)]
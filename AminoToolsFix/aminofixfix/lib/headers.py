@@ -1,4 +1,4 @@
-from .helpers import signature, str_uuid4
+from .helpers import signature, str_uuid4, body_length
 
 BASIC_HEADERS = {
     "Accept": "*/*",
@@ -27,7 +27,7 @@ def additionals(
     if deviceId:
         headers["NDCDEVICEID"] = deviceId
     if data:
-        headers["Content-Length"] = str(len(data))
+        headers["Content-Length"] = str(body_length(data))
         headers["NDC-MSG-SIG"] = signature(data)
     if sid:
         headers["NDCAUTH"] = f"sid={sid}"
@@ -132,5 +132,5 @@ def VCHeaders(data = None) -> dict:
         "Connection": "Keep-Alive",
         "Accept": "*/*"
     }
-    if data: headers["Content-Length"] = str(len(data))
+    if data: headers["Content-Length"] = str(body_length(data))
     return headers
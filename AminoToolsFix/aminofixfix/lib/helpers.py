@@ -8,7 +8,7 @@ from functools import reduce
 from random import choice
 from hashlib import sha1
 from os import urandom
-from json import loads
+from .jsonlib import loads
 from uuid import uuid4
 from hmac import new
 import re
@@ -63,6 +63,12 @@ def signature(data: str | bytes) -> str:
     data = data if isinstance(data, bytes) else data.encode("utf-8")
     return b64encode(PREFIX + new(SIG_KEY, data, sha1).digest()).decode("utf-8")
 
+def body_length(data: str | bytes) -> int:
+    # bytes that will be sent, JSON from fast backends is not ASCII-only
+    if isinstance(data, bytes) or data.isascii():
+        return len(data)
+    return len(data.encode("utf-8"))
+
 def update_deviceId(device: str) -> str:
     return gen_deviceId(bytes.fromhex(device[2:42]))
 
@@ -136,4 +142,12 @@ def json_minify(string, strip_space=True) -> str:
                 new_str.append(' ' * len(val))
 
     new_str.append(string[index:])
-    return ''.join(new_str)
\ No newline at end of file
+    return ''.join(new_str)
+
+def join_url(base_url: str, url: str) -> str:
+    """
+        Add base URL to path, absolute URLs (like `https://ads.tapdaq.com/...`) are left as is.
+    """
+    if url.startswith(("http://", "https://")):
+        return url
+    return base_url + url
@@ -0,0 +1,73 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from typing import Any, Callable
+from threading import Lock
+from weakref import WeakValueDictionary
+from contextvars import ContextVar
+
+# identity map of client that made current request (in this thread or task)
+current_identity_map: ContextVar[IdentityMap | None] = ContextVar("identity_map", default=None)
+
+class IdentityMap:
+    '''
+        One profile object per user (per community), shared by everything that
+        mentions this user: authors of messages, events, threads, blogs and answers of `get_user_info`.
+
+        Profile that is seen again is reused and not parsed again. If it came with
+        new or changed fields, canonical object is updated (fields are merged).
+        Profiles are kept by weak references, so ones that you don't use anymore are collected.
+        Thread-safe, can be shared by few clients.
+    '''
+    def __init__(self):
+        '''
+            Init of identity map.
+        '''
+        self.__objects: WeakValueDictionary[tuple, Any] = WeakValueDictionary()
+        self.__lock = Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.updates = 0
+
+    def __len__(self) -> int:
+        return len(self.__objects)
+
+    def stats(self) -> dict[str, int]:
+        return {"hits": self.hits, "misses": self.misses, "updates": self.updates, "size": len(self.__objects)}
+
+    def get(self, data: Any, make: Callable[[Any], Any]) -> Any:
+        '''
+            Canonical object for JSON of profile.
+
+            Args:
+            - data: Any
+                - JSON of profile, without "uid" it is not shared
+            - make: Callable[[Any], Any]
+                - makes object from JSON (like `lambda v: UserProfile(v).UserProfile`)
+        '''
+        try:
+            key = (data.get("ndcId"), data["uid"])
+        except (AttributeError, KeyError, TypeError):
+            return make(data)
+
+        with self.__lock:
+            obj = self.__objects.get(key)
+            if obj is None:
+                self.misses += 1
+                obj = self.__objects[key] = make(data)
+                return obj
+
+            known = obj.__dict__.get("json")
+            # same (or smaller) JSON as object already has, nothing to update
+            if isinstance(known, dict) and data.items() <= known.items():
+                self.hits += 1
+                return obj
+
+            self.updates += 1
+            obj.update(data)
+            return obj
+
+    def clear(self):
+        with self.__lock:
+            self.__objects.clear()
@@ -0,0 +1,118 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import json
+from typing import Any, Callable
+
+# first installed one is used, "json" (standart library) is always there
+BACKENDS = ("orjson", "ujson", "msgspec", "json")
+
+def make_orjson() -> tuple[Callable[[Any], str], Callable[[str | bytes], Any]]:
+    import orjson
+    option = orjson.OPT_NON_STR_KEYS
+
+    def dumps(data: Any) -> str:
+        return orjson.dumps(data, option=option).decode("utf-8")
+
+    return dumps, orjson.loads
+
+def make_ujson() -> tuple[Callable[[Any], str], Callable[[str | bytes], Any]]:
+    import ujson
+
+    def dumps(data: Any) -> str:
+        return ujson.dumps(data, ensure_ascii=False, escape_forward_slashes=False)
+
+    return dumps, ujson.loads
+
+def make_msgspec() -> tuple[Callable[[Any], str], Callable[[str | bytes], Any]]:
+    from msgspec import DecodeError
+    from msgspec.json import Encoder, Decoder
+    encode = Encoder().encode
+    decode = Decoder().decode
+
+    def dumps(data: Any) -> str:
+        return encode(data).decode("utf-8")
+
+    def loads(data: str | bytes) -> Any:
+        try:
+            return decode(data)
+        except DecodeError as e:
+            # same error as others give, so `except ValueError` keeps working
+            raise ValueError(str(e)) from None
+
+    return dumps, loads
+
+def make_json() -> tuple[Callable[[Any], str], Callable[[str | bytes], Any]]:
+    def dumps(data: Any) -> str:
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    return dumps, json.loads
+
+MAKERS = {
+    "orjson": make_orjson,
+    "ujson": make_ujson,
+    "msgspec": make_msgspec,
+    "json": make_json
+}
+
+def set_json_backend(name: str | None = None) -> str:
+    '''
+        Select library for encoding requests and decoding answers and socket messages.
+
+        Args:
+        - name: str | None = None
+            - "orjson", "ujson", "msgspec" or "json" (standart library)
+            - None to pick first installed one from `BACKENDS`
+
+        Returns:
+        - name of selected library
+
+        Raises ImportError if requested library is not installed.
+        Every backend writes compact JSON (no spaces after "," and ":") without escaping non-ASCII characters.
+    '''
+    global BACKEND, _dumps, _loads
+    if name is not None:
+        if name not in MAKERS:
+            raise ValueError(f"unknown JSON backend: {name} (available: {', '.join(BACKENDS)})")
+        _dumps, _loads = MAKERS[name]()
+        BACKEND = name
+        return name
+
+    for candidate in BACKENDS:
+        try:
+            _dumps, _loads = MAKERS[candidate]()
+        except ImportError:
+            continue
+        BACKEND = candidate
+        return candidate
+
+BACKEND: str
+_dumps: Callable[[Any], str]
+_loads: Callable[[str | bytes], Any]
+set_json_backend()
+
+def json_backend() -> str:
+    return BACKEND
+
+def dumps(data: Any) -> str:
+    '''
+        JSON text of `data`, non-ASCII characters are not escaped.
+    '''
+    try:
+        return _dumps(data)
+    except (TypeError, OverflowError):
+        # things fast libraries can't write (like int bigger than 64 bits), standart library can
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+def loads(data: str | bytes) -> Any:
+    return _loads(data)
+
+def fast_json(response: Any) -> Any:
+    '''
+        Make `response.json()` decode body with selected backend (HTTPX and Requests use standart library).
+    '''
+    def decode(**kwargs):
+        return _loads(response.content)
+
+    response.json = decode
+    return response
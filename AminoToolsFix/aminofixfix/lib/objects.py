@@ -2,6 +2,9 @@
 
 from enum import Enum
 
+from .schema import LazyObject, LazyList, Nested, retains_raw
+from .identity_map import current_identity_map
+
 class PostFeatureDays(Enum):
     """
     Enum, containing all possible day values for post featuring.
@@ -79,7 +82,7 @@ class Objects:
         team_amino = "000000000-0000-0000-0000-000000000000"
         news_feed = "000000000-0000-0000-0000-000000000001"
 
-class UserProfile:
+class UserProfile(LazyObject):
     '''
     User Profile object.
 
@@ -165,259 +168,104 @@ class UserProfile:
         - avgDailySpendTimeIn7Days
         - adminLogCountIn7Days
     '''
-    def __init__(self, data):
-        self.json = data
-
-        try: self.fanClub: FanClubList = FanClubList(data["fanClubList"]).FanClubList
-        except (KeyError, TypeError): self.fanClub: FanClubList = FanClubList([])
-
-        self.accountMembershipStatus = None
-        self.activation = None
-        self.activePublicLiveThreadId = None
-        self.age = None
-        self.aminoId = None
-        self.aminoIdEditable = None
-        self.appleId = None
-        self.avatarFrame = None
-        self.avatarFrameId = None
-        self.backgroundImage = None
-        self.backgroundColor = None
-        self.blogsCount = None
-        self.commentsCount = None
-        self.content = None
-        self.coverAnimation = None
-        self.createdTime = None
-        self.customTitles = None
-        self.dateOfBirth = None
-        self.defaultBubbleId = None
-        self.disabledLevel = None
-        self.disabledStatus = None
-        self.disabledTime = None
-        self.email = None
-        self.extensions = None
-        self.facebookId = None
-        self.fansCount = None
-        self.followersCount = None
-        self.followingCount = None
-        self.followingStatus = None
-        self.gender = None
-        self.globalStrikeCount = None
-        self.googleId = None
-        self.icon = None
-        self.influencerCreatedTime = None
-        self.influencerInfo = None
-        self.influencerMonthlyFee = None
-        self.influencerPinned = None
-        self.isGlobal = None
-        self.isMemberOfTeamAmino = None
-        self.isNicknameVerified = None
-        self.itemsCount = None
-        self.lastStrikeTime = None
-        self.lastWarningTime = None
-        self.level = None
-        self.mediaList = None
-        self.membershipStatus = None
-        self.modifiedTime = None
-        self.mood = None
-        self.moodSticker = None
-        self.nickname = None
-        self.notificationSubscriptionStatus = None
-        self.onlineStatus = None
-        self.onlineStatus2 = None
-        self.phoneNumber = None
-        self.postsCount = None
-        self.privilegeOfChatInviteRequest = None
-        self.privilegeOfCommentOnUserProfile = None
-        self.pushEnabled = None
-        self.race = None
-        self.reputation = None
-        self.role = None
-        self.securityLevel = None
-        self.staffInfo = None
-        self.status = None
-        self.storiesCount = None
-        self.strikeCount = None
-        self.tagList = None
-        self.twitterId = None
-        self.userId = None
-        self.verified = None
-        self.visitPrivacy = None
-        self.visitorsCount = None
-        self.warningCount = None
-        self.totalQuizHighestScore = None
-        self.totalQuizPlayedTimes = None
-        self.requestId = None
-        self.message = None
-        self.applicant = None
-        self.avgDailySpendTimeIn7Days = None
-        self.adminLogCountIn7Days = None
+    FIELDS = {
+        "fanClub": Nested("fanClubList", lambda v: FanClubList(v).FanClubList, lambda: FanClubList([])),
+        "accountMembershipStatus": "accountMembershipStatus",
+        "activation": "activation",
+        "activePublicLiveThreadId": "activePublicLiveThreadId",
+        "age": "age",
+        "aminoId": "aminoId",
+        "aminoIdEditable": "aminoIdEditable",
+        "appleId": "appleID",
+        "avatarFrame": "avatarFrame",
+        "avatarFrameId": "avatarFrameId",
+        "backgroundColor": "extensions.style.backgroundColor",
+        "backgroundImage": "extensions.style.backgroundMediaList.1",
+        "blogsCount": "blogsCount",
+        "commentsCount": "commentsCount",
+        "content": "content",
+        "coverAnimation": "extensions.coverAnimation",
+        "createdTime": "createdTime",
+        "customTitles": "extensions.customTitles",
+        "dateOfBirth": "dateOfBirth",
+        "defaultBubbleId": "extensions.defaultBubbleId",
+        "disabledLevel": "extensions.__disabledLevel__",
+        "disabledStatus": "extensions.__disabledStatus__",
+        "disabledTime": "extensions.__disabledTime__",
+        "email": "email",
+        "extensions": "extensions",
+        "facebookId": "facebookID",
+        "fansCount": "influencerInfo.fansCount",
+        "followersCount": "membersCount",
+        "followingCount": "joinedCount",
+        "followingStatus": "followingStatus",
+        "gender": "gender",
+        "globalStrikeCount": "adminInfo.globalStrikeCount",
+        "googleId": "googleID",
+        "icon": "icon",
+        "influencerCreatedTime": "influencerInfo.createdTime",
+        "influencerInfo": "influencerInfo",
+        "influencerMonthlyFee": "influencerInfo.monthlyFee",
+        "influencerPinned": "influencerInfo.pinned",
+        "isGlobal": "isGlobal",
+        "isMemberOfTeamAmino": "extensions.isMemberOfTeamAmino",
+        "isNicknameVerified": "isNicknameVerified",
+        "itemsCount": "itemsCount",
+        "lastStrikeTime": "adminInfo.lastStrikeTime",
+        "lastWarningTime": "adminInfo.lastWarningTime",
+        "level": "level",
+        "mediaList": "mediaList",
+        "membershipStatus": "membershipStatus",
+        "modifiedTime": "modifiedTime",
+        "mood": "mood",
+        "moodSticker": "moodSticker",
+        "nickname": "nickname",
+        "notificationSubscriptionStatus": "notificationSubscriptionStatus",
+        "onlineStatus": "onlineStatus",
+        "onlineStatus2": "settings.onlineStatus",
+        "phoneNumber": "phoneNumber",
+        "postsCount": "postsCount",
+        "privilegeOfChatInviteRequest": "extensions.privilegeOfChatInviteRequest",
+        "privilegeOfCommentOnUserProfile": "extensions.privilegeOfCommentOnUserProfile",
+        "pushEnabled": "pushEnabled",
+        "race": "race",
+        "reputation": "reputation",
+        "role": "role",
+        "securityLevel": "securityLevel",
+        "staffInfo": "adminInfo",
+        "status": "status",
+        "storiesCount": "storiesCount",
+        "strikeCount": "adminInfo.strikeCount",
+        "tagList": "tagList",
+        "twitterId": "twitterID",
+        "userId": "uid",
+        "verified": "verified",
+        "visitPrivacy": "visitPrivacy",
+        "visitorsCount": "visitorsCount",
+        "warningCount": "adminInfo.warningCount",
+        "totalQuizHighestScore": "totalQuizHighestScore",
+        "totalQuizPlayedTimes": "totalQuizPlayedTimes",
+        "requestId": "requestId",
+        "message": "message",
+        "applicant": "applicant",
+        "avgDailySpendTimeIn7Days": "avgDailySpendTimeIn7Days",
+        "adminLogCountIn7Days": "adminLogCountIn7Days"
+    }
 
     @property
     def UserProfile(self):
-        try: self.accountMembershipStatus = self.json["accountMembershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.activation = self.json["activation"]
-        except (KeyError, TypeError): pass
-        try: self.activePublicLiveThreadId = self.json["activePublicLiveThreadId"]
-        except (KeyError, TypeError): pass
-        try: self.age = self.json["age"]
-        except (KeyError, TypeError): pass
-        try: self.aminoId = self.json["aminoId"]
-        except (KeyError, TypeError): pass
-        try: self.aminoIdEditable = self.json["aminoIdEditable"]
-        except (KeyError, TypeError): pass
-        try: self.appleId = self.json["appleID"]
-        except (KeyError, TypeError): pass
-        try: self.avatarFrame = self.json["avatarFrame"]
-        except (KeyError, TypeError): pass
-        try: self.avatarFrameId = self.json["avatarFrameId"]
-        except (KeyError, TypeError): pass
-        try: self.backgroundColor = self.json["extensions"]["style"]["backgroundColor"]
-        except (KeyError, TypeError): pass
-        try: self.backgroundImage = self.json["extensions"]["style"]["backgroundMediaList"][1]
-        except (KeyError, TypeError, IndexError): pass
-        try: self.blogsCount = self.json["blogsCount"]
-        except (KeyError, TypeError): pass
-        try: self.commentsCount = self.json["commentsCount"]
-        except (KeyError, TypeError): pass
-        try: self.content = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.coverAnimation = self.json["extensions"]["coverAnimation"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.customTitles = self.json["extensions"]["customTitles"]
-        except (KeyError, TypeError): pass
-        try: self.dateOfBirth = self.json["dateOfBirth"]
-        except (KeyError, TypeError): pass
-        try: self.defaultBubbleId = self.json["extensions"]["defaultBubbleId"]
-        except (KeyError, TypeError): pass
-        try: self.disabledLevel = self.json["extensions"]["__disabledLevel__"]
-        except (KeyError, TypeError): pass
-        try: self.disabledStatus = self.json["extensions"]["__disabledStatus__"]
-        except (KeyError, TypeError): pass
-        try: self.disabledTime = self.json["extensions"]["__disabledTime__"]
-        except (KeyError, TypeError): pass
-        try: self.email = self.json["email"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.facebookId = self.json["facebookID"]
-        except (KeyError, TypeError): pass
-        try: self.fansCount = self.json["influencerInfo"]["fansCount"]
-        except (KeyError, TypeError): pass
-        try: self.followersCount = self.json["membersCount"]
-        except (KeyError, TypeError): pass
-        try: self.followingCount = self.json["joinedCount"]
-        except (KeyError, TypeError): pass
-        try: self.followingStatus = self.json["followingStatus"]
-        except (KeyError, TypeError): pass
-        try: self.gender = self.json["gender"]
-        except (KeyError, TypeError): pass
-        try: self.globalStrikeCount = self.json["adminInfo"]["globalStrikeCount"]
-        except (KeyError, TypeError): pass
-        try: self.googleId = self.json["googleID"]
-        except (KeyError, TypeError): pass
-        try: self.icon = self.json["icon"]
-        except (KeyError, TypeError): pass
-        try: self.influencerCreatedTime = self.json["influencerInfo"]["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.influencerInfo = self.json["influencerInfo"]
-        except (KeyError, TypeError): pass
-        try: self.influencerMonthlyFee = self.json["influencerInfo"]["monthlyFee"]
-        except (KeyError, TypeError): pass
-        try: self.influencerPinned = self.json["influencerInfo"]["pinned"]
-        except (KeyError, TypeError): pass
-        try: self.isGlobal = self.json["isGlobal"]
-        except (KeyError, TypeError): pass
-        try: self.isMemberOfTeamAmino = self.json["extensions"]["isMemberOfTeamAmino"]
-        except (KeyError, TypeError): pass
-        try: self.isNicknameVerified = self.json["isNicknameVerified"]
-        except (KeyError, TypeError): pass
-        try: self.itemsCount = self.json["itemsCount"]
-        except (KeyError, TypeError): pass
-        try: self.lastStrikeTime = self.json["adminInfo"]["lastStrikeTime"]
-        except (KeyError, TypeError): pass
-        try: self.lastWarningTime = self.json["adminInfo"]["lastWarningTime"]
-        except (KeyError, TypeError): pass
-        try: self.level = self.json["level"]
-        except (KeyError, TypeError): pass
-        try: self.mediaList = self.json["mediaList"]
-        except (KeyError, TypeError): pass
-        try: self.membershipStatus = self.json["membershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.modifiedTime = self.json["modifiedTime"]
-        except (KeyError, TypeError): pass
-        try: self.mood = self.json["mood"]
-        except (KeyError, TypeError): pass
-        try: self.moodSticker = self.json["moodSticker"]
-        except (KeyError, TypeError): pass
-        try: self.nickname = self.json["nickname"]
-        except (KeyError, TypeError): pass
-        try: self.notificationSubscriptionStatus = self.json["notificationSubscriptionStatus"]
-        except (KeyError, TypeError): pass
-        try: self.onlineStatus = self.json["onlineStatus"]
-        except (KeyError, TypeError): pass
-        try: self.onlineStatus2 = self.json["settings"]["onlineStatus"]
-        except (KeyError, TypeError): pass
-        try: self.phoneNumber = self.json["phoneNumber"]
-        except (KeyError, TypeError): pass
-        try: self.postsCount = self.json["postsCount"]
-        except (KeyError, TypeError): pass
-        try: self.privilegeOfChatInviteRequest = self.json["extensions"]["privilegeOfChatInviteRequest"]
-        except (KeyError, TypeError): pass
-        try: self.privilegeOfCommentOnUserProfile = self.json["extensions"]["privilegeOfCommentOnUserProfile"]
-        except (KeyError, TypeError): pass
-        try: self.pushEnabled = self.json["pushEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.race = self.json["race"]
-        except (KeyError, TypeError): pass
-        try: self.reputation = self.json["reputation"]
-        except (KeyError, TypeError): pass
-        try: self.role = self.json["role"]
-        except (KeyError, TypeError): pass
-        try: self.securityLevel = self.json["securityLevel"]
-        except (KeyError, TypeError): pass
-        try: self.staffInfo = self.json["adminInfo"]
-        except (KeyError, TypeError): pass
-        try: self.status = self.json["status"]
-        except (KeyError, TypeError): pass
-        try: self.storiesCount = self.json["storiesCount"]
-        except (KeyError, TypeError): pass
-        try: self.strikeCount = self.json["adminInfo"]["strikeCount"]
-        except (KeyError, TypeError): pass
-        try: self.tagList = self.json["tagList"]
-        except (KeyError, TypeError): pass
-        try: self.twitterId = self.json["twitterID"]
-        except (KeyError, TypeError): pass
-        try: self.userId = self.json["uid"]
-        except (KeyError, TypeError): pass
-        try: self.verified = self.json["verified"]
-        except (KeyError, TypeError): pass
-        try: self.visitPrivacy = self.json["visitPrivacy"]
-        except (KeyError, TypeError): pass
-        try: self.visitorsCount = self.json["visitorsCount"]
-        except (KeyError, TypeError): pass
-        try: self.warningCount = self.json["adminInfo"]["warningCount"]
-        except (KeyError, TypeError): pass
-        try: self.totalQuizHighestScore = self.json["totalQuizHighestScore"]
-        except (KeyError, TypeError): pass
-        try: self.totalQuizPlayedTimes = self.json["totalQuizPlayedTimes"]
-        except (KeyError, TypeError): pass
-        try: self.requestId = self.json["requestId"]
-        except (KeyError, TypeError): pass
-        try: self.message = self.json["message"]
-        except (KeyError, TypeError): pass
-        try: self.applicant = self.json["applicant"]
-        except (KeyError, TypeError): pass
-        try: self.avgDailySpendTimeIn7Days = self.json["avgDailySpendTimeIn7Days"]
-        except (KeyError, TypeError): pass
-        try: self.adminLogCountIn7Days = self.json["adminLogCountIn7Days"]
-        except (KeyError, TypeError): pass
-
         return self
 
-class UserProfileList:
+def shared_profile(data) -> UserProfile:
+    '''
+    User Profile from JSON, through identity map of client if it has one (same object for same user).
+    '''
+    identity_map = current_identity_map.get()
+    if identity_map is None:
+        return UserProfile(data).UserProfile
+    return identity_map.get(data, UserProfile)
+
+class UserProfileList(LazyList):
     '''
     List of User Profiles.
 
@@ -503,408 +351,88 @@ class UserProfileList:
         - avgDailySpendTimeIn7Days
         - adminLogCountIn7Days
     '''
-    def __init__(self, data):
-        _fanClub = []
-
-        self.json = data
-
-        for y in data:
-            try: _fanClub.append(FanClubList(y["fanClubList"]).FanClubList)
-            except (KeyError, TypeError): _fanClub.append(None)
-
-        self.accountMembershipStatus = []
-        self.activation = []
-        self.activePublicLiveThreadId = []
-        self.age = []
-        self.aminoId = []
-        self.aminoIdEditable = []
-        self.appleId = []
-        self.avatarFrame = []
-        self.avatarFrameId = []
-        self.backgroundColor = []
-        self.backgroundImage = []
-        self.blogsCount = []
-        self.commentsCount = []
-        self.content = []
-        self.coverAnimation = []
-        self.createdTime = []
-        self.customTitles = []
-        self.dateOfBirth = []
-        self.defaultBubbleId = []
-        self.disabledLevel = []
-        self.disabledStatus = []
-        self.disabledTime = []
-        self.email = []
-        self.extensions = []
-        self.facebookId = []
-        self.fansCount = []
-        self.fanClub = _fanClub
-        self.followersCount = []
-        self.followingCount = []
-        self.followingStatus = []
-        self.gender = []
-        self.globalStrikeCount = []
-        self.googleId = []
-        self.icon = []
-        self.influencerCreatedTime = []
-        self.influencerInfo = []
-        self.influencerMonthlyFee = []
-        self.influencerPinned = []
-        self.isGlobal = []
-        self.isMemberOfTeamAmino = []
-        self.isNicknameVerified = []
-        self.itemsCount = []
-        self.lastStrikeTime = []
-        self.lastWarningTime = []
-        self.level = []
-        self.mediaList = []
-        self.membershipStatus = []
-        self.modifiedTime = []
-        self.mood = []
-        self.moodSticker = []
-        self.nickname = []
-        self.notificationSubscriptionStatus = []
-        self.onlineStatus = []
-        self.onlineStatus2 = []
-        self.phoneNumber = []
-        self.postsCount = []
-        self.privilegeOfChatInviteRequest = []
-        self.privilegeOfCommentOnUserProfile = []
-        self.pushEnabled = []
-        self.race = []
-        self.reputation = []
-        self.role = []
-        self.securityLevel = []
-        self.staffInfo = []
-        self.status = []
-        self.storiesCount = []
-        self.strikeCount = []
-        self.tagList = []
-        self.twitterId = []
-        self.userId = []
-        self.verified = []
-        self.visitPrivacy = []
-        self.visitorsCount = []
-        self.warningCount = []
-        self.totalQuizPlayedTimes = []
-        self.totalQuizHighestScore = []
-        self.requestId = []
-        self.message = []
-        self.applicant = []
-        self.avgDailySpendTimeIn7Days = []
-        self.adminLogCountIn7Days = []
+    FIELDS = UserProfile.FIELDS
+    TYPES = {
+        "level": "int",
+        "reputation": "int",
+        "followersCount": "int",
+        "followingCount": "int",
+        "blogsCount": "int",
+        "postsCount": "int",
+        "commentsCount": "int",
+        "storiesCount": "int",
+        "itemsCount": "int",
+        "visitorsCount": "int",
+        "fansCount": "int",
+        "role": "int",
+        "status": "int",
+        "onlineStatus": "int",
+        "membershipStatus": "int",
+        "isGlobal": "bool",
+        "isNicknameVerified": "bool",
+        "createdTime": "datetime",
+        "modifiedTime": "datetime"
+    }
+    INTERNED = ("avatarFrameId", "defaultBubbleId", "backgroundColor", "backgroundImage", "coverAnimation")
 
     @property
     def UserProfileList(self):
-        for x in self.json:
-            try: self.accountMembershipStatus.append(x["accountMembershipStatus"])
-            except (KeyError, TypeError): self.accountMembershipStatus.append(None)
-            try: self.activation.append(x["activation"])
-            except (KeyError, TypeError): self.activation.append(None)
-            try: self.activePublicLiveThreadId.append(x["activePublicLiveThreadId"])
-            except (KeyError, TypeError): self.activePublicLiveThreadId.append(None)
-            try: self.age.append(x["age"])
-            except (KeyError, TypeError): self.age.append(None)
-            try: self.aminoId.append(x["aminoId"])
-            except (KeyError, TypeError): self.aminoId.append(None)
-            try: self.aminoIdEditable.append(x["aminoIdEditable"])
-            except (KeyError, TypeError): self.aminoIdEditable.append(None)
-            try: self.appleId.append(x["appleID"])
-            except (KeyError, TypeError): self.appleId.append(None)
-            try: self.avatarFrame.append(x["avatarFrame"])
-            except (KeyError, TypeError): self.avatarFrame.append(None)
-            try: self.avatarFrameId.append(x["avatarFrameId"])
-            except (KeyError, TypeError): self.avatarFrameId.append(None)
-            try: self.backgroundColor.append(x["extensions"]["style"]["backgroundColor"])
-            except (KeyError, TypeError): self.backgroundColor.append(None)
-            try: self.backgroundImage.append(x["extensions"]["style"]["backgroundMediaList"][1])
-            except (KeyError, TypeError, IndexError): self.backgroundImage.append(None)
-            try: self.blogsCount.append(x["blogsCount"])
-            except (KeyError, TypeError): self.blogsCount.append(None)
-            try: self.commentsCount.append(x["commentsCount"])
-            except (KeyError, TypeError): self.commentsCount.append(None)
-            try: self.content.append(x["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.coverAnimation.append(x["extensions"]["coverAnimation"])
-            except (KeyError, TypeError): self.coverAnimation.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.customTitles.append(x["extensions"]["customTitles"])
-            except (KeyError, TypeError): self.customTitles.append(None)
-            try: self.dateOfBirth.append(x["dateOfBirth"])
-            except (KeyError, TypeError): self.dateOfBirth.append(None)
-            try: self.defaultBubbleId.append(x["extensions"]["defaultBubbleId"])
-            except (KeyError, TypeError): self.defaultBubbleId.append(None)
-            try: self.disabledLevel.append(x["extensions"]["__disabledLevel__"])
-            except (KeyError, TypeError): self.disabledLevel.append(None)
-            try: self.disabledStatus.append(x["extensions"]["__disabledStatus__"])
-            except (KeyError, TypeError): self.disabledStatus.append(None)
-            try: self.disabledTime.append(x["extensions"]["__disabledTime__"])
-            except (KeyError, TypeError): self.disabledTime.append(None)
-            try: self.email.append(x["email"])
-            except (KeyError, TypeError): self.email.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.facebookId.append(x["facebookID"])
-            except (KeyError, TypeError): self.facebookId.append(None)
-            try: self.fansCount.append(x["influencerInfo"]["fansCount"])
-            except (KeyError, TypeError): self.fansCount.append(None)
-            try: self.followersCount.append(x["membersCount"])
-            except (KeyError, TypeError): self.followersCount.append(None)
-            try: self.followingCount.append(x["joinedCount"])
-            except (KeyError, TypeError): self.followingCount.append(None)
-            try: self.followingStatus.append(x["followingStatus"])
-            except (KeyError, TypeError): self.followingStatus.append(None)
-            try: self.gender.append(x["gender"])
-            except (KeyError, TypeError): self.gender.append(None)
-            try: self.globalStrikeCount.append(x["adminInfo"]["globalStrikeCount"])
-            except (KeyError, TypeError): self.globalStrikeCount.append(None)
-            try: self.googleId.append(x["googleID"])
-            except (KeyError, TypeError): self.googleId.append(None)
-            try: self.icon.append(x["icon"])
-            except (KeyError, TypeError): self.icon.append(None)
-            try: self.influencerCreatedTime.append(x["influencerInfo"]["createdTime"])
-            except (KeyError, TypeError): self.influencerCreatedTime.append(None)
-            try: self.influencerInfo.append(x["influencerInfo"])
-            except (KeyError, TypeError): self.influencerInfo.append(None)
-            try: self.influencerMonthlyFee.append(x["influencerInfo"]["monthlyFee"])
-            except (KeyError, TypeError): self.influencerMonthlyFee.append(None)
-            try: self.influencerPinned.append(x["influencerInfo"]["pinned"])
-            except (KeyError, TypeError): self.influencerPinned.append(None)
-            try: self.isGlobal.append(x["isGlobal"])
-            except (KeyError, TypeError): self.isGlobal.append(None)
-            try: self.isMemberOfTeamAmino.append(x["extensions"]["isMemberOfTeamAmino"])
-            except (KeyError, TypeError): self.isMemberOfTeamAmino.append(None)
-            try: self.isNicknameVerified.append(x["isNicknameVerified"])
-            except (KeyError, TypeError): self.isNicknameVerified.append(None)
-            try: self.itemsCount.append(x["itemsCount"])
-            except (KeyError, TypeError): self.itemsCount.append(None)
-            try: self.lastStrikeTime.append(x["adminInfo"]["lastStrikeTime"])
-            except (KeyError, TypeError): self.lastStrikeTime.append(None)
-            try: self.lastWarningTime.append(x["adminInfo"]["lastWarningTime"])
-            except (KeyError, TypeError): self.lastWarningTime.append(None)
-            try: self.level.append(x["level"])
-            except (KeyError, TypeError): self.level.append(None)
-            try: self.mediaList.append(x["mediaList"])
-            except (KeyError, TypeError): self.mediaList.append(None)
-            try: self.membershipStatus.append(x["membershipStatus"])
-            except (KeyError, TypeError): self.membershipStatus.append(None)
-            try: self.modifiedTime.append(x["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.mood.append(x["mood"])
-            except (KeyError, TypeError): self.mood.append(None)
-            try: self.moodSticker.append(x["moodSticker"])
-            except (KeyError, TypeError): self.moodSticker.append(None)
-            try: self.nickname.append(x["nickname"])
-            except (KeyError, TypeError): self.nickname.append(None)
-            try: self.notificationSubscriptionStatus.append(x["notificationSubscriptionStatus"])
-            except (KeyError, TypeError): self.notificationSubscriptionStatus.append(None)
-            try: self.onlineStatus.append(x["onlineStatus"])
-            except (KeyError, TypeError): self.onlineStatus.append(None)
-            try: self.onlineStatus2.append(x["settings"]["onlineStatus"])
-            except (KeyError, TypeError): self.onlineStatus2.append(None)
-            try: self.phoneNumber.append(x["phoneNumber"])
-            except (KeyError, TypeError): self.phoneNumber.append(None)
-            try: self.postsCount.append(x["postsCount"])
-            except (KeyError, TypeError): self.postsCount.append(None)
-            try: self.privilegeOfChatInviteRequest.append(x["extensions"]["privilegeOfChatInviteRequest"])
-            except (KeyError, TypeError): self.privilegeOfChatInviteRequest.append(None)
-            try: self.privilegeOfCommentOnUserProfile.append(x["extensions"]["privilegeOfCommentOnUserProfile"])
-            except (KeyError, TypeError): self.privilegeOfCommentOnUserProfile.append(None)
-            try: self.pushEnabled.append(x["pushEnabled"])
-            except (KeyError, TypeError): self.pushEnabled.append(None)
-            try: self.race.append(x["race"])
-            except (KeyError, TypeError): self.race.append(None)
-            try: self.reputation.append(x["reputation"])
-            except (KeyError, TypeError): self.reputation.append(None)
-            try: self.role.append(x["role"])
-            except (KeyError, TypeError): self.role.append(None)
-            try: self.securityLevel.append(x["securityLevel"])
-            except (KeyError, TypeError): self.securityLevel.append(None)
-            try: self.staffInfo.append(x["adminInfo"])
-            except (KeyError, TypeError): self.staffInfo.append(None)
-            try: self.status.append(x["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.storiesCount.append(x["storiesCount"])
-            except (KeyError, TypeError): self.storiesCount.append(None)
-            try: self.strikeCount.append(x["adminInfo"]["strikeCount"])
-            except (KeyError, TypeError): self.strikeCount.append(None)
-            try: self.tagList.append(x["tagList"])
-            except (KeyError, TypeError): self.tagList.append(None)
-            try: self.twitterId.append(x["twitterID"])
-            except (KeyError, TypeError): self.twitterId.append(None)
-            try: self.userId.append(x["uid"])
-            except (KeyError, TypeError): self.userId.append(None)
-            try: self.verified.append(x["verified"])
-            except (KeyError, TypeError): self.verified.append(None)
-            try: self.visitPrivacy.append(x["visitPrivacy"])
-            except (KeyError, TypeError): self.visitPrivacy.append(None)
-            try: self.visitorsCount.append(x["visitorsCount"])
-            except (KeyError, TypeError): self.visitorsCount.append(None)
-            try: self.warningCount.append(x["adminInfo"]["warningCount"])
-            except (KeyError, TypeError): self.warningCount.append(None)
-            try: self.totalQuizPlayedTimes.append(x["totalQuizPlayedTimes"])
-            except (KeyError, TypeError): self.totalQuizPlayedTimes.append(None)
-            try: self.totalQuizHighestScore.append(x["totalQuizHighestScore"])
-            except (KeyError, TypeError): self.totalQuizHighestScore.append(None)
-            try: self.requestId.append(x["requestId"])
-            except (KeyError, TypeError): self.requestId.append(None)
-            try: self.message.append(x["message"])
-            except (KeyError, TypeError): self.message.append(None)
-            try: self.applicant.append(x["applicant"])
-            except (KeyError, TypeError): self.applicant.append(None)
-            try: self.avgDailySpendTimeIn7Days.append(x["avgDailySpendTimeIn7Days"])
-            except (KeyError, TypeError): self.avgDailySpendTimeIn7Days.append(None)
-            try: self.adminLogCountIn7Days.append(x["adminLogCountIn7Days"])
-            except (KeyError, TypeError): self.adminLogCountIn7Days.append(None)
-
         return self
 
-class BlogList:
-    def __init__(self, data, nextPageToken = None, prevPageToken = None):
-        _author, _quizQuestionList = [], []
-
-        self.json = data
+class BlogList(LazyList):
+    FIELDS = {
+        "author": Nested("author", shared_profile, lambda: UserProfile([]), lambda v: UserProfileList(v).UserProfileList),
+        "quizQuestionList": Nested("quizQuestionList", lambda v: QuizQuestionList(v).QuizQuestionList),
+        "globalVotesCount": "globalVotesCount",
+        "globalVotedValue": "globalVotedValue",
+        "keywords": "keywords",
+        "mediaList": "mediaList",
+        "style": "style",
+        "totalQuizPlayCount": "totalQuizPlayCount",
+        "title": "title",
+        "tipInfo": "tipInfo",
+        "tippersCount": "tipInfo.tippersCount",
+        "tippable": "tipInfo.tippable",
+        "tippedCoins": "tipInfo.tippedCoins",
+        "contentRating": "contentRating",
+        "needHidden": "needHidden",
+        "guestVotesCount": "guestVotesCount",
+        "type": "type",
+        "status": "status",
+        "globalCommentsCount": "globalCommentsCount",
+        "modifiedTime": "modifiedTime",
+        "widgetDisplayInterval": "widgetDisplayInterval",
+        "totalPollVoteCount": "totalPollVoteCount",
+        "blogId": "blogId",
+        "viewCount": "viewCount",
+        "fansOnly": "extensions.fansOnly",
+        "backgroundColor": "extensions.style.backgroundColor",
+        "votesCount": "votesCount",
+        "endTime": "endTime",
+        "refObjectId": "refObjectId",
+        "refObject": "refObject",
+        "votedValue": "votedValue",
+        "content": "content",
+        "createdTime": "createdTime",
+        "extensions": "extensions",
+        "shareUrl": "shareURLFullPath",
+        "commentsCount": "commentsCount",
+        "featuredType": "extensions.featuredType",
+        "disabledTime": "extensions.__disabledTime__",
+        "quizPlayedTimes": "extensions.quizPlayedTimes",
+        "quizTotalQuestionCount": "extensions.quizTotalQuestionCount",
+        "quizTrendingTimes": "extensions.quizTrendingTimes",
+        "quizLastAddQuestionTime": "extensions.quizLastAddQuestionTime",
+        "isIntroPost": "extensions.isIntroPost"
+    }
+
+    def __init__(self, data, nextPageToken = None, prevPageToken = None, fields = None):
         self.nextPageToken = nextPageToken
         self.prevPageToken = prevPageToken
-
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
-            try: _quizQuestionList.append(QuizQuestionList(y["quizQuestionList"]).QuizQuestionList)
-            except (KeyError, TypeError): _quizQuestionList.append(None)
-
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
-        self.quizQuestionList = _quizQuestionList
-
-        self.createdTime = []
-        self.globalVotesCount = []
-        self.globalVotedValue = []
-        self.keywords = []
-        self.mediaList = []
-        self.style = []
-        self.totalQuizPlayCount = []
-        self.title = []
-        self.tipInfo = []
-        self.tippersCount = []
-        self.tippable = []
-        self.tippedCoins = []
-        self.contentRating = []
-        self.needHidden = []
-        self.guestVotesCount = []
-        self.type = []
-        self.status = []
-        self.globalCommentsCount = []
-        self.modifiedTime = []
-        self.widgetDisplayInterval = []
-        self.totalPollVoteCount = []
-        self.blogId = []
-        self.viewCount = []
-        self.fansOnly = []
-        self.backgroundColor = []
-        self.votesCount = []
-        self.endTime = []
-        self.refObjectId = []
-        self.refObject = []
-        self.votedValue = []
-        self.extensions = []
-        self.commentsCount = []
-        self.content = []
-        self.featuredType = []
-        self.shareUrl = []
-        self.disabledTime = []
-        self.quizPlayedTimes = []
-        self.quizTotalQuestionCount = []
-        self.quizTrendingTimes = []
-        self.quizLastAddQuestionTime = []
-        self.isIntroPost = []
+        super().__init__(data, fields)
 
     @property
     def BlogList(self):
-        for x in self.json:
-            try: self.globalVotesCount.append(x["globalVotesCount"])
-            except (KeyError, TypeError): self.globalVotesCount.append(None)
-            try: self.globalVotedValue.append(x["globalVotedValue"])
-            except (KeyError, TypeError): self.globalVotedValue.append(None)
-            try: self.keywords.append(x["keywords"])
-            except (KeyError, TypeError): self.keywords.append(None)
-            try: self.mediaList.append(x["mediaList"])
-            except (KeyError, TypeError): self.mediaList.append(None)
-            try: self.style.append(x["style"])
-            except (KeyError, TypeError): self.style.append(None)
-            try: self.totalQuizPlayCount.append(x["totalQuizPlayCount"])
-            except (KeyError, TypeError): self.totalQuizPlayCount.append(None)
-            try: self.title.append(x["title"])
-            except (KeyError, TypeError): self.title.append(None)
-            try: self.tipInfo.append(x["tipInfo"])
-            except (KeyError, TypeError): self.tipInfo.append(None)
-            try: self.tippersCount.append(x["tipInfo"]["tippersCount"])
-            except (KeyError, TypeError): self.tippersCount.append(None)
-            try: self.tippable.append(x["tipInfo"]["tippable"])
-            except (KeyError, TypeError): self.tippable.append(None)
-            try: self.tippedCoins.append(x["tipInfo"]["tippedCoins"])
-            except (KeyError, TypeError): self.tippedCoins.append(None)
-            try: self.contentRating.append(x["contentRating"])
-            except (KeyError, TypeError): self.contentRating.append(None)
-            try: self.needHidden.append(x["needHidden"])
-            except (KeyError, TypeError): self.needHidden.append(None)
-            try: self.guestVotesCount.append(x["guestVotesCount"])
-            except (KeyError, TypeError): self.guestVotesCount.append(None)
-            try: self.type.append(x["type"])
-            except (KeyError, TypeError): self.type.append(None)
-            try: self.status.append(x["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.globalCommentsCount.append(x["globalCommentsCount"])
-            except (KeyError, TypeError): self.globalCommentsCount.append(None)
-            try: self.modifiedTime.append(x["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.widgetDisplayInterval.append(x["widgetDisplayInterval"])
-            except (KeyError, TypeError): self.widgetDisplayInterval.append(None)
-            try: self.totalPollVoteCount.append(x["totalPollVoteCount"])
-            except (KeyError, TypeError): self.totalPollVoteCount.append(None)
-            try: self.blogId.append(x["blogId"])
-            except (KeyError, TypeError): self.blogId.append(None)
-            try: self.viewCount.append(x["viewCount"])
-            except (KeyError, TypeError): self.viewCount.append(None)
-            try: self.fansOnly.append(x["extensions"]["fansOnly"])
-            except (KeyError, TypeError): self.fansOnly.append(None)
-            try: self.backgroundColor.append(x["extensions"]["style"]["backgroundColor"])
-            except (KeyError, TypeError): self.backgroundColor.append(None)
-            try: self.votesCount.append(x["votesCount"])
-            except (KeyError, TypeError): self.votesCount.append(None)
-            try: self.endTime.append(x["endTime"])
-            except (KeyError, TypeError): self.endTime.append(None)
-            try: self.refObjectId.append(x["refObjectId"])
-            except (KeyError, TypeError): self.refObjectId.append(None)
-            try: self.refObject.append(x["refObject"])
-            except (KeyError, TypeError): self.refObject.append(None)
-            try: self.votedValue.append(x["votedValue"])
-            except (KeyError, TypeError): self.votedValue.append(None)
-            try: self.content.append(x["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.shareUrl.append(x["shareURLFullPath"])
-            except (KeyError, TypeError): self.shareUrl.append(None)
-            try: self.commentsCount.append(x["commentsCount"])
-            except (KeyError, TypeError): self.commentsCount.append(None)
-            try: self.featuredType.append(x["extensions"]["featuredType"])
-            except (KeyError, TypeError): self.featuredType.append(None)
-            try: self.disabledTime.append(x["extensions"]["__disabledTime__"])
-            except (KeyError, TypeError): self.disabledTime.append(None)
-            try: self.quizPlayedTimes.append(x["extensions"]["quizPlayedTimes"])
-            except (KeyError, TypeError): self.quizPlayedTimes.append(None)
-            try: self.quizTotalQuestionCount.append(x["extensions"]["quizTotalQuestionCount"])
-            except (KeyError, TypeError): self.quizTotalQuestionCount.append(None)
-            try: self.quizTrendingTimes.append(x["extensions"]["quizTrendingTimes"])
-            except (KeyError, TypeError): self.quizTrendingTimes.append(None)
-            try: self.quizLastAddQuestionTime.append(x["extensions"]["quizLastAddQuestionTime"])
-            except (KeyError, TypeError): self.quizLastAddQuestionTime.append(None)
-            try: self.isIntroPost.append(x["extensions"]["isIntroPost"])
-            except (KeyError, TypeError): self.isIntroPost.append(None)
-
         return self
 
 class RecentBlogs:
@@ -970,7 +498,7 @@ class Blog:
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
+        try: self.author: UserProfile = shared_profile(data["author"])
         except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
         try: self.quizQuestionList: QuizQuestionList = QuizQuestionList(data["quizQuestionList"]).QuizQuestionList
         except (KeyError, TypeError): self.quizQuestionList: QuizQuestionList = QuizQuestionList([])
@@ -1111,7 +639,7 @@ class Wiki:
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
+        try: self.author: UserProfile = shared_profile(data["author"])
         except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
         try: self.labels: WikiLabelList = WikiLabelList(data["extensions"]["props"]).WikiLabelList
         except (KeyError, TypeError): self.labels: WikiLabelList = WikiLabelList([])
@@ -1347,346 +875,84 @@ class RankingTableList:
 
         return self
 
-class Community:
-    def __init__(self, data):
-        self.json = data
-
-        try: self.agent: UserProfile = UserProfile(data["agent"]).UserProfile
-        except (KeyError, TypeError): self.agent: UserProfile = UserProfile([])
-        try: self.rankingTable: RankingTableList = RankingTableList(data["advancedSettings"]["rankingTable"]).RankingTableList
-        except (KeyError, TypeError): self.rankingTable: RankingTableList = RankingTableList([])
-
-        self.usersCount = None
-        self.createdTime = None
-        self.aminoId = None
-        self.icon = None
-        self.link = None
-        self.comId = None
-        self.modifiedTime = None
-        self.status = None
-        self.joinType = None
-        self.tagline = None
-        self.primaryLanguage = None
-        self.heat = None
-        self.themePack = None
-        self.probationStatus = None
-        self.listedStatus = None
-        self.userAddedTopicList = None
-        self.name = None
-        self.isStandaloneAppDeprecated = None
-        self.searchable = None
-        self.influencerList = None
-        self.keywords = None
-        self.mediaList = None
-        self.description = None
-        self.isStandaloneAppMonetizationEnabled = None
-        self.advancedSettings = None
-        self.activeInfo = None
-        self.configuration = None
-        self.extensions = None
-        self.nameAliases = None
-        self.templateId = None
-        self.promotionalMediaList = None
-        self.defaultRankingTypeInLeaderboard = None
-        self.joinedBaselineCollectionIdList = None
-        self.newsfeedPages = None
-        self.catalogEnabled = None
-        self.pollMinFullBarVoteCount = None
-        self.leaderboardStyle = None
-        self.facebookAppIdList = None
-        self.welcomeMessage = None
-        self.welcomeMessageEnabled = None
-        self.hasPendingReviewRequest = None
-        self.frontPageLayout = None
-        self.themeColor = None
-        self.themeHash = None
-        self.themeVersion = None
-        self.themeUrl = None
-        self.themeHomePageAppearance = None
-        self.themeLeftSidePanelTop = None
-        self.themeLeftSidePanelBottom = None
-        self.themeLeftSidePanelColor = None
-        self.customList = None
+class Community(LazyObject):
+    FIELDS = {
+        "agent": Nested("agent", shared_profile, lambda: UserProfile([]), lambda v: UserProfileList(v).UserProfileList),
+        "rankingTable": Nested("advancedSettings.rankingTable", lambda v: RankingTableList(v).RankingTableList, lambda: RankingTableList([])),
+        "name": "name",
+        "usersCount": "membersCount",
+        "createdTime": "createdTime",
+        "aminoId": "endpoint",
+        "icon": "icon",
+        "link": "link",
+        "comId": "ndcId",
+        "modifiedTime": "modifiedTime",
+        "status": "status",
+        "joinType": "joinType",
+        "primaryLanguage": "primaryLanguage",
+        "heat": "communityHeat",
+        "userAddedTopicList": "userAddedTopicList",
+        "probationStatus": "probationStatus",
+        "listedStatus": "listedStatus",
+        "themePack": "themePack",
+        "themeColor": "themePack.themeColor",
+        "themeHash": "themePack.themePackHash",
+        "themeVersion": "themePack.themePackRevision",
+        "themeUrl": "themePack.themePackUrl",
+        "themeHomePageAppearance": "configuration.appearance.homePage.navigation",
+        "themeLeftSidePanelTop": "configuration.appearance.leftSidePanel.navigation.level1",
+        "themeLeftSidePanelBottom": "configuration.appearance.leftSidePanel.navigation.level2",
+        "themeLeftSidePanelColor": "configuration.appearance.leftSidePanel.style.iconColor",
+        "customList": "configuration.page.customList",
+        "tagline": "tagline",
+        "searchable": "searchable",
+        "isStandaloneAppDeprecated": "isStandaloneAppDeprecated",
+        "influencerList": "influencerList",
+        "keywords": "keywords",
+        "mediaList": "mediaList",
+        "description": "content",
+        "isStandaloneAppMonetizationEnabled": "isStandaloneAppMonetizationEnabled",
+        "advancedSettings": "advancedSettings",
+        "defaultRankingTypeInLeaderboard": "advancedSettings.defaultRankingTypeInLeaderboard",
+        "frontPageLayout": "advancedSettings.frontPageLayout",
+        "hasPendingReviewRequest": "advancedSettings.hasPendingReviewRequest",
+        "welcomeMessageEnabled": "advancedSettings.welcomeMessageEnabled",
+        "welcomeMessage": "advancedSettings.welcomeMessageText",
+        "pollMinFullBarVoteCount": "advancedSettings.pollMinFullBarVoteCount",
+        "catalogEnabled": "advancedSettings.catalogEnabled",
+        "leaderboardStyle": "advancedSettings.leaderboardStyle",
+        "facebookAppIdList": "advancedSettings.facebookAppIdList",
+        "newsfeedPages": "advancedSettings.newsfeedPages",
+        "joinedBaselineCollectionIdList": "advancedSettings.joinedBaselineCollectionIdList",
+        "activeInfo": "activeInfo",
+        "configuration": "configuration",
+        "extensions": "extensions",
+        "nameAliases": "extensions.communityNameAliases",
+        "templateId": "templateId",
+        "promotionalMediaList": "promotionalMediaList"
+    }
 
     @property
     def Community(self):
-        try: self.name = self.json["name"]
-        except (KeyError, TypeError): pass
-        try: self.usersCount = self.json["membersCount"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.aminoId = self.json["endpoint"]
-        except (KeyError, TypeError): pass
-        try: self.icon = self.json["icon"]
-        except (KeyError, TypeError): pass
-        try: self.link = self.json["link"]
-        except (KeyError, TypeError): pass
-        try: self.comId = self.json["ndcId"]
-        except (KeyError, TypeError): pass
-        try: self.modifiedTime = self.json["modifiedTime"]
-        except (KeyError, TypeError): pass
-        try: self.status = self.json["status"]
-        except (KeyError, TypeError): pass
-        try: self.joinType = self.json["joinType"]
-        except (KeyError, TypeError): pass
-        try: self.primaryLanguage = self.json["primaryLanguage"]
-        except (KeyError, TypeError): pass
-        try: self.heat = self.json["communityHeat"]
-        except (KeyError, TypeError): pass
-        try: self.userAddedTopicList = self.json["userAddedTopicList"]
-        except (KeyError, TypeError): pass
-        try: self.probationStatus = self.json["probationStatus"]
-        except (KeyError, TypeError): pass
-        try: self.listedStatus = self.json["listedStatus"]
-        except (KeyError, TypeError): pass
-        try: self.themePack = self.json["themePack"]
-        except (KeyError, TypeError): pass
-        try: self.themeColor = self.json["themePack"]["themeColor"]
-        except (KeyError, TypeError): pass
-        try: self.themeHash = self.json["themePack"]["themePackHash"]
-        except (KeyError, TypeError): pass
-        try: self.themeVersion = self.json["themePack"]["themePackRevision"]
-        except (KeyError, TypeError): pass
-        try: self.themeUrl = self.json["themePack"]["themePackUrl"]
-        except (KeyError, TypeError): pass
-        try: self.themeHomePageAppearance = self.json["configuration"]["appearance"]["homePage"]["navigation"]
-        except (KeyError, TypeError): pass
-        try: self.themeLeftSidePanelTop = self.json["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level1"]
-        except (KeyError, TypeError): pass
-        try: self.themeLeftSidePanelBottom = self.json["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level2"]
-        except (KeyError, TypeError): pass
-        try: self.themeLeftSidePanelColor = self.json["configuration"]["appearance"]["leftSidePanel"]["style"]["iconColor"]
-        except (KeyError, TypeError): pass
-        try: self.customList = self.json["configuration"]["page"]["customList"]
-        except (KeyError, TypeError): pass
-        try: self.tagline = self.json["tagline"]
-        except (KeyError, TypeError): pass
-        try: self.searchable = self.json["searchable"]
-        except (KeyError, TypeError): pass
-        try: self.isStandaloneAppDeprecated = self.json["isStandaloneAppDeprecated"]
-        except (KeyError, TypeError): pass
-        try: self.influencerList = self.json["influencerList"]
-        except (KeyError, TypeError): pass
-        try: self.keywords = self.json["keywords"]
-        except (KeyError, TypeError): pass
-        try: self.mediaList = self.json["mediaList"]
-        except (KeyError, TypeError): pass
-        try: self.description = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.isStandaloneAppMonetizationEnabled = self.json["isStandaloneAppMonetizationEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.advancedSettings = self.json["advancedSettings"]
-        except (KeyError, TypeError): pass
-        try: self.defaultRankingTypeInLeaderboard = self.json["advancedSettings"]["defaultRankingTypeInLeaderboard"]
-        except (KeyError, TypeError): pass
-        try: self.frontPageLayout = self.json["advancedSettings"]["frontPageLayout"]
-        except (KeyError, TypeError): pass
-        try: self.hasPendingReviewRequest = self.json["advancedSettings"]["hasPendingReviewRequest"]
-        except (KeyError, TypeError): pass
-        try: self.welcomeMessageEnabled = self.json["advancedSettings"]["welcomeMessageEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.welcomeMessage = self.json["advancedSettings"]["welcomeMessageText"]
-        except (KeyError, TypeError): pass
-        try: self.pollMinFullBarVoteCount = self.json["advancedSettings"]["pollMinFullBarVoteCount"]
-        except (KeyError, TypeError): pass
-        try: self.catalogEnabled = self.json["advancedSettings"]["catalogEnabled"]
-        except (KeyError, TypeError): pass
-        try: self.leaderboardStyle = self.json["advancedSettings"]["leaderboardStyle"]
-        except (KeyError, TypeError): pass
-        try: self.facebookAppIdList = self.json["advancedSettings"]["facebookAppIdList"]
-        except (KeyError, TypeError): pass
-        try: self.newsfeedPages = self.json["advancedSettings"]["newsfeedPages"]
-        except (KeyError, TypeError): pass
-        try: self.joinedBaselineCollectionIdList = self.json["advancedSettings"]["joinedBaselineCollectionIdList"]
-        except (KeyError, TypeError): pass
-        try: self.activeInfo = self.json["activeInfo"]
-        except (KeyError, TypeError): pass
-        try: self.configuration = self.json["configuration"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.nameAliases = self.json["extensions"]["communityNameAliases"]
-        except (KeyError, TypeError): pass
-        try: self.templateId = self.json["templateId"]
-        except (KeyError, TypeError): pass
-        try: self.promotionalMediaList = self.json["promotionalMediaList"]
-        except (KeyError, TypeError): pass
-
         return self
 
-class CommunityList:
-    def __init__(self, data):
-        _agent, _rankingTable = [], []
-
-        self.json = data
-
-        for y in data:
-            try: _agent.append(y["agent"])
-            except (KeyError, TypeError): _agent.append(None)
-            try: _rankingTable.append(RankingTableList(y["advancedSettings"]["rankingTable"]).RankingTableList)
-            except (KeyError, TypeError): _rankingTable.append(None)
-
-        self.agent: UserProfileList = UserProfileList(_agent).UserProfileList
-        self.rankingTable = _rankingTable
-        self.usersCount = []
-        self.createdTime = []
-        self.aminoId = []
-        self.icon = []
-        self.link = []
-        self.comId = []
-        self.modifiedTime = []
-        self.status = []
-        self.joinType = []
-        self.tagline = []
-        self.primaryLanguage = []
-        self.heat = []
-        self.themePack = []
-        self.probationStatus = []
-        self.listedStatus = []
-        self.userAddedTopicList = []
-        self.name = []
-        self.isStandaloneAppDeprecated = []
-        self.searchable = []
-        self.influencerList = []
-        self.keywords = []
-        self.mediaList = []
-        self.description = []
-        self.isStandaloneAppMonetizationEnabled = []
-        self.advancedSettings = []
-        self.activeInfo = []
-        self.configuration = []
-        self.extensions = []
-        self.nameAliases = []
-        self.templateId = []
-        self.promotionalMediaList = []
-        self.defaultRankingTypeInLeaderboard = []
-        self.joinedBaselineCollectionIdList = []
-        self.newsfeedPages = []
-        self.catalogEnabled = []
-        self.pollMinFullBarVoteCount = []
-        self.leaderboardStyle = []
-        self.facebookAppIdList = []
-        self.welcomeMessage = []
-        self.welcomeMessageEnabled = []
-        self.hasPendingReviewRequest = []
-        self.frontPageLayout = []
-        self.themeColor = []
-        self.themeHash = []
-        self.themeVersion = []
-        self.themeUrl = []
-        self.themeHomePageAppearance = []
-        self.themeLeftSidePanelTop = []
-        self.themeLeftSidePanelBottom = []
-        self.themeLeftSidePanelColor = []
-        self.customList = []
+class CommunityList(LazyList):
+    FIELDS = Community.FIELDS
+    TYPES = {
+        "comId": "int",
+        "usersCount": "int",
+        "status": "int",
+        "joinType": "int",
+        "listedStatus": "int",
+        "probationStatus": "int",
+        "heat": "float",
+        "searchable": "bool",
+        "createdTime": "datetime",
+        "modifiedTime": "datetime"
+    }
 
     @property
     def CommunityList(self):
-        for x in self.json:
-            try: self.name.append(x["name"])
-            except (KeyError, TypeError): self.name.append(None)
-            try: self.usersCount.append(x["membersCount"])
-            except (KeyError, TypeError): self.usersCount.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.aminoId.append(x["endpoint"])
-            except (KeyError, TypeError): self.aminoId.append(None)
-            try: self.icon.append(x["icon"])
-            except (KeyError, TypeError): self.icon.append(None)
-            try: self.link.append(x["link"])
-            except (KeyError, TypeError): self.link.append(None)
-            try: self.comId.append(x["ndcId"])
-            except (KeyError, TypeError): self.comId.append(None)
-            try: self.modifiedTime.append(x["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.status.append(x["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.joinType.append(x["joinType"])
-            except (KeyError, TypeError): self.joinType.append(None)
-            try: self.primaryLanguage.append(x["primaryLanguage"])
-            except (KeyError, TypeError): self.primaryLanguage.append(None)
-            try: self.heat.append(x["communityHeat"])
-            except (KeyError, TypeError): self.heat.append(None)
-            try: self.userAddedTopicList.append(x["userAddedTopicList"])
-            except (KeyError, TypeError): self.userAddedTopicList.append(None)
-            try: self.probationStatus.append(x["probationStatus"])
-            except (KeyError, TypeError): self.probationStatus.append(None)
-            try: self.listedStatus.append(x["listedStatus"])
-            except (KeyError, TypeError): self.listedStatus.append(None)
-            try: self.themePack.append(x["themePack"])
-            except (KeyError, TypeError): self.themePack.append(None)
-            try: self.tagline.append(x["tagline"])
-            except (KeyError, TypeError): self.tagline.append(None)
-            try: self.searchable.append(x["searchable"])
-            except (KeyError, TypeError): self.searchable.append(None)
-            try: self.isStandaloneAppDeprecated.append(x["isStandaloneAppDeprecated"])
-            except (KeyError, TypeError): self.isStandaloneAppDeprecated.append(None)
-            try: self.influencerList.append(x["influencerList"])
-            except (KeyError, TypeError): self.influencerList.append(None)
-            try: self.keywords.append(x["keywords"])
-            except (KeyError, TypeError): self.keywords.append(None)
-            try: self.mediaList.append(x["mediaList"])
-            except (KeyError, TypeError): self.mediaList.append(None)
-            try: self.description.append(x["content"])
-            except (KeyError, TypeError): self.description.append(None)
-            try: self.isStandaloneAppMonetizationEnabled.append(x["isStandaloneAppMonetizationEnabled"])
-            except (KeyError, TypeError): self.isStandaloneAppMonetizationEnabled.append(None)
-            try: self.advancedSettings.append(x["advancedSettings"])
-            except (KeyError, TypeError): self.advancedSettings.append(None)
-            try: self.defaultRankingTypeInLeaderboard.append(x["advancedSettings"]["defaultRankingTypeInLeaderboard"])
-            except (KeyError, TypeError): self.defaultRankingTypeInLeaderboard.append(None)
-            try: self.frontPageLayout.append(x["advancedSettings"]["frontPageLayout"])
-            except (KeyError, TypeError): self.frontPageLayout.append(None)
-            try: self.hasPendingReviewRequest.append(x["advancedSettings"]["hasPendingReviewRequest"])
-            except (KeyError, TypeError): self.hasPendingReviewRequest.append(None)
-            try: self.welcomeMessageEnabled.append(x["advancedSettings"]["welcomeMessageEnabled"])
-            except (KeyError, TypeError): self.welcomeMessageEnabled.append(None)
-            try: self.welcomeMessage.append(x["advancedSettings"]["welcomeMessageText"])
-            except (KeyError, TypeError): self.welcomeMessage.append(None)
-            try: self.pollMinFullBarVoteCount.append(x["advancedSettings"]["pollMinFullBarVoteCount"])
-            except (KeyError, TypeError): self.pollMinFullBarVoteCount.append(None)
-            try: self.catalogEnabled.append(x["advancedSettings"]["catalogEnabled"])
-            except (KeyError, TypeError): self.catalogEnabled.append(None)
-            try: self.leaderboardStyle.append(x["advancedSettings"]["leaderboardStyle"])
-            except (KeyError, TypeError): self.leaderboardStyle.append(None)
-            try: self.facebookAppIdList.append(x["advancedSettings"]["facebookAppIdList"])
-            except (KeyError, TypeError): self.facebookAppIdList.append(None)
-            try: self.newsfeedPages.append(x["advancedSettings"]["newsfeedPages"])
-            except (KeyError, TypeError): self.newsfeedPages.append(None)
-            try: self.joinedBaselineCollectionIdList.append(x["advancedSettings"]["joinedBaselineCollectionIdList"])
-            except (KeyError, TypeError): self.joinedBaselineCollectionIdList.append(None)
-            try: self.activeInfo.append(x["activeInfo"])
-            except (KeyError, TypeError): self.activeInfo.append(None)
-            try: self.configuration.append(x["configuration"])
-            except (KeyError, TypeError): self.configuration.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.nameAliases.append(x["extensions"]["communityNameAliases"])
-            except (KeyError, TypeError): self.nameAliases.append(None)
-            try: self.templateId.append(x["templateId"])
-            except (KeyError, TypeError): self.templateId.append(None)
-            try: self.promotionalMediaList.append(x["promotionalMediaList"])
-            except (KeyError, TypeError): self.promotionalMediaList.append(None)
-            try: self.themeColor.append(x["themePack"]["themeColor"])
-            except (KeyError, TypeError): self.themeColor.append(None)
-            try: self.themeHash.append(x["themePack"]["themePackHash"])
-            except (KeyError, TypeError): self.themeHash.append(None)
-            try: self.themeVersion.append(x["themePack"]["themePackRevision"])
-            except (KeyError, TypeError): self.themeVersion.append(None)
-            try: self.themeUrl.append(x["themePack"]["themePackUrl"])
-            except (KeyError, TypeError): self.themeUrl.append(None)
-            try: self.themeHomePageAppearance.append(x["configuration"]["appearance"]["homePage"]["navigation"])
-            except (KeyError, TypeError): self.themeHomePageAppearance.append(None)
-            try: self.themeLeftSidePanelTop.append(x["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level1"])
-            except (KeyError, TypeError): self.themeLeftSidePanelTop.append(None)
-            try: self.themeLeftSidePanelBottom.append(x["configuration"]["appearance"]["leftSidePanel"]["navigation"]["level2"])
-            except (KeyError, TypeError): self.themeLeftSidePanelBottom.append(None)
-            try: self.themeLeftSidePanelColor.append(x["configuration"]["appearance"]["leftSidePanel"]["style"]["iconColor"])
-            except (KeyError, TypeError): self.themeLeftSidePanelColor.append(None)
-            try: self.customList.append(x["configuration"]["page"]["customList"])
-            except (KeyError, TypeError): self.customList.append(None)
-
         return self
 
 class VisitorsList:
@@ -1724,69 +990,32 @@ class VisitorsList:
             except (KeyError, TypeError): self.ownerPrivacyMode.append(None)
             try: self.visitorPrivacyMode.append(x["visitorPrivacyMode"])
             except (KeyError, TypeError): self.visitorPrivacyMode.append(None)
-            try: self.visitTime.append(x["visitTime"])
-            except (KeyError, TypeError): self.visitTime.append(None)
-
-        return self
-
-class CommentList:
-    def __init__(self, data):
-        _author = []
-
-        self.json = data
+            try: self.visitTime.append(x["visitTime"])
+            except (KeyError, TypeError): self.visitTime.append(None)
 
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
+        return self
 
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
-        self.votesSum = []
-        self.votedValue = []
-        self.mediaList = []
-        self.parentComId = []
-        self.parentId = []
-        self.parentType = []
-        self.content = []
-        self.extensions = []
-        self.comId = []
-        self.modifiedTime = []
-        self.createdTime = []
-        self.commentId = []
-        self.subcommentsCount = []
-        self.type = []
+class CommentList(LazyList):
+    FIELDS = {
+        "author": Nested("author", shared_profile, lambda: UserProfile([]), lambda v: UserProfileList(v).UserProfileList),
+        "votesSum": "votesSum",
+        "votedValue": "votedValue",
+        "mediaList": "mediaList",
+        "parentComId": "parentNdcId",
+        "parentId": "parentId",
+        "parentType": "parentType",
+        "content": "content",
+        "extensions": "extensions",
+        "comId": "ndcId",
+        "modifiedTime": "modifiedTime",
+        "createdTime": "createdTime",
+        "commentId": "commentId",
+        "subcommentsCount": "subcommentsCount",
+        "type": "type"
+    }
 
     @property
     def CommentList(self):
-        for x in self.json:
-            try: self.votesSum.append(x["votesSum"])
-            except (KeyError, TypeError): self.votesSum.append(None)
-            try: self.votedValue.append(x["votedValue"])
-            except (KeyError, TypeError): self.votedValue.append(None)
-            try: self.mediaList.append(x["mediaList"])
-            except (KeyError, TypeError): self.mediaList.append(None)
-            try: self.parentComId.append(x["parentNdcId"])
-            except (KeyError, TypeError): self.parentComId.append(None)
-            try: self.parentId.append(x["parentId"])
-            except (KeyError, TypeError): self.parentId.append(None)
-            try: self.parentType.append(x["parentType"])
-            except (KeyError, TypeError): self.parentType.append(None)
-            try: self.content.append(x["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.comId.append(x["ndcId"])
-            except (KeyError, TypeError): self.comId.append(None)
-            try: self.modifiedTime.append(x["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.commentId.append(x["commentId"])
-            except (KeyError, TypeError): self.commentId.append(None)
-            try: self.subcommentsCount.append(x["subcommentsCount"])
-            except (KeyError, TypeError): self.subcommentsCount.append(None)
-            try: self.type.append(x["type"])
-            except (KeyError, TypeError): self.type.append(None)
-
         return self
 
 class Membership:
@@ -1909,11 +1138,11 @@ class FromCode:
         return self
 
 class UserProfileCountList:
-    def __init__(self, data):
+    def __init__(self, data, fields = None):
         self.json = data
 
-        try: self.profile: UserProfileList = UserProfileList(data["userProfileList"]).UserProfileList
-        except (KeyError, TypeError): self.profile: UserProfileList = UserProfileList([])
+        try: self.profile: UserProfileList = UserProfileList(data["userProfileList"], fields).UserProfileList
+        except (KeyError, TypeError): self.profile: UserProfileList = UserProfileList([], fields)
 
         self.userProfileCount = None
 
@@ -1921,6 +1150,8 @@ class UserProfileCountList:
     def UserProfileCountList(self):
         try: self.userProfileCount = self.json["userProfileCount"]
         except (KeyError, TypeError): pass
+        if not retains_raw():
+            self.json = None
 
         return self
 
@@ -1975,74 +1206,47 @@ class WalletInfo:
 
         return self
 
-class WalletHistory:
-    def __init__(self, data):
-        self.json = data
-        self.taxCoins = []
-        self.bonusCoinsFloat = []
-        self.isPositive = []
-        self.bonusCoins = []
-        self.taxCoinsFloat = []
-        self.transanctionId = []
-        self.changedCoins = []
-        self.totalCoinsFloat = []
-        self.changedCoinsFloat = []
-        self.sourceType = []
-        self.createdTime = []
-        self.totalCoins = []
-        self.originCoinsFloat = []
-        self.originCoins = []
-        self.extData = []
-        self.title = []
-        self.description = []
-        self.icon = []
-        self.objectDeeplinkUrl = []
-        self.sourceIp = []
+class WalletHistory(LazyList):
+    FIELDS = {
+        "taxCoins": "taxCoins",
+        "bonusCoinsFloat": "bonusCoinsFloat",
+        "isPositive": "isPositive",
+        "bonusCoins": "bonusCoins",
+        "taxCoinsFloat": "taxCoinsFloat",
+        "transanctionId": "uid",
+        "changedCoins": "changedCoins",
+        "totalCoinsFloat": "totalCoinsFloat",
+        "changedCoinsFloat": "changedCoinsFloat",
+        "sourceType": "sourceType",
+        "createdTime": "createdTime",
+        "totalCoins": "totalCoins",
+        "originCoinsFloat": "originCoinsFloat",
+        "originCoins": "originCoins",
+        "extData": "extData",
+        "title": "extData.description",
+        "icon": "extData.icon",
+        "description": "extData.subtitle",
+        "objectDeeplinkUrl": "extData.objectDeeplinkUrl",
+        "sourceIp": "extData.sourceIp"
+    }
+    TYPES = {
+        "taxCoins": "int",
+        "bonusCoins": "int",
+        "changedCoins": "int",
+        "totalCoins": "int",
+        "originCoins": "int",
+        "taxCoinsFloat": "float",
+        "bonusCoinsFloat": "float",
+        "changedCoinsFloat": "float",
+        "totalCoinsFloat": "float",
+        "originCoinsFloat": "float",
+        "isPositive": "bool",
+        "sourceType": "int",
+        "createdTime": "datetime"
+    }
 
     @property
     def WalletHistory(self):
-        for x in self.json:
-            try: self.taxCoins.append(x["taxCoins"])
-            except (KeyError, TypeError): self.taxCoins.append(None)
-            try: self.bonusCoinsFloat.append(x["bonusCoinsFloat"])
-            except (KeyError, TypeError): self.bonusCoinsFloat.append(None)
-            try: self.isPositive.append(x["isPositive"])
-            except (KeyError, TypeError): self.isPositive.append(None)
-            try: self.bonusCoins.append(x["bonusCoins"])
-            except (KeyError, TypeError): self.bonusCoins.append(None)
-            try: self.taxCoinsFloat.append(x["taxCoinsFloat"])
-            except (KeyError, TypeError): self.taxCoinsFloat.append(None)
-            try: self.transanctionId.append(x["uid"])
-            except (KeyError, TypeError): self.transanctionId.append(None)
-            try: self.changedCoins.append(x["changedCoins"])
-            except (KeyError, TypeError): self.changedCoins.append(None)
-            try: self.totalCoinsFloat.append(x["totalCoinsFloat"])
-            except (KeyError, TypeError): self.totalCoinsFloat.append(None)
-            try: self.changedCoinsFloat.append(x["changedCoinsFloat"])
-            except (KeyError, TypeError): self.changedCoinsFloat.append(None)
-            try: self.sourceType.append(x["sourceType"])
-            except (KeyError, TypeError): self.sourceType.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.totalCoins.append(x["totalCoins"])
-            except (KeyError, TypeError): self.totalCoins.append(None)
-            try: self.originCoinsFloat.append(x["originCoinsFloat"])
-            except (KeyError, TypeError): self.originCoinsFloat.append(None)
-            try: self.originCoins.append(x["originCoins"])
-            except (KeyError, TypeError): self.originCoins.append(None)
-            try: self.extData.append(x["extData"])
-            except (KeyError, TypeError): self.extData.append(None)
-            try: self.title.append(x["extData"]["description"])
-            except (KeyError, TypeError): self.title.append(None)
-            try: self.icon.append(x["extData"]["icon"])
-            except (KeyError, TypeError): self.icon.append(None)
-            try: self.description.append(x["extData"]["subtitle"])
-            except (KeyError, TypeError): self.description.append(None)
-            try: self.objectDeeplinkUrl.append(x["extData"]["objectDeeplinkUrl"])
-            except (KeyError, TypeError): self.objectDeeplinkUrl.append(None)
-            try: self.sourceIp.append(x["extData"]["sourceIp"])
-            except (KeyError, TypeError): self.sourceIp.append(None)
-
         return self
 
 
@@ -2204,7 +1408,7 @@ class WikiCategory:
     def __init__(self, data):
         self.json = data
 
-        try: self.author = UserProfile(data["itemCategory"]["author"]).UserProfile
+        try: self.author = shared_profile(data["itemCategory"]["author"])
         except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
         try: self.subCategory = WikiCategoryList(data["childrenWrapper"]["itemCategoryList"]).WikiCategoryList
         except (KeyError, TypeError): self.subCategory: WikiCategoryList = WikiCategoryList([])
@@ -2290,293 +1494,74 @@ class TippedUsersSummary:
 
         return self
 
-class Thread:
-    def __init__(self, data):
-        self.json = data
-
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
-        except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
-        try: self.membersSummary: UserProfileList = UserProfileList(data["membersSummary"]).UserProfileList
-        except (KeyError, TypeError): self.membersSummary: UserProfileList = UserProfileList([])
-
-        self.userAddedTopicList = None
-        self.membersQuota = None
-        self.chatId = None
-        self.keywords = None
-        self.membersCount = None
-        self.isPinned = None
-        self.title = None
-        self.membershipStatus = None
-        self.content = None
-        self.needHidden = None
-        self.alertOption = None
-        self.lastReadTime = None
-        self.type = None
-        self.status = None
-        self.publishToGlobal = None
-        self.modifiedTime = None
-        self.condition = None
-        self.icon = None
-        self.latestActivityTime = None
-        self.extensions = None
-        self.viewOnly = None
-        self.coHosts = None
-        self.membersCanInvite = None
-        self.announcement = None
-        self.language = None
-        self.lastMembersSummaryUpdateTime = None
-        self.backgroundImage = None
-        self.channelType = None
-        self.comId = None
-        self.createdTime = None
-        self.creatorId = None
-        self.bannedUsers = None
-        self.tippingPermStatus = None
-        self.visibility = None
-        self.fansOnly = None
-        self.pinAnnouncement = None
-        self.vvChatJoinType = None
-        self.screeningRoomHostId = None
-        self.screeningRoomPermission = None
-        self.disabledTime = None
-        self.organizerTransferCreatedTime = None
-        self.organizerTransferId = None
+class Thread(LazyObject):
+    FIELDS = {
+        "author": Nested("author", shared_profile, lambda: UserProfile([]), lambda v: UserProfileList(v).UserProfileList),
+        "membersSummary": Nested("membersSummary", lambda v: UserProfileList(v).UserProfileList, lambda: UserProfileList([])),
+        "userAddedTopicList": "userAddedTopicList",
+        "membersQuota": "membersQuota",
+        "chatId": "threadId",
+        "keywords": "keywords",
+        "membersCount": "membersCount",
+        "isPinned": "isPinned",
+        "title": "title",
+        "membershipStatus": "membershipStatus",
+        "content": "content",
+        "needHidden": "needHidden",
+        "alertOption": "alertOption",
+        "lastReadTime": "lastReadTime",
+        "type": "type",
+        "status": "status",
+        "publishToGlobal": "publishToGlobal",
+        "modifiedTime": "modifiedTime",
+        "condition": "condition",
+        "icon": "icon",
+        "latestActivityTime": "latestActivityTime",
+        "comId": "ndcId",
+        "createdTime": "createdTime",
+        "extensions": "extensions",
+        "viewOnly": "extensions.viewOnly",
+        "coHosts": "extensions.coHost",
+        "membersCanInvite": "extensions.membersCanInvite",
+        "language": "extensions.language",
+        "announcement": "extensions.announcement",
+        "backgroundImage": "extensions.bm.1",
+        "lastMembersSummaryUpdateTime": "extensions.lastMembersSummaryUpdateTime",
+        "channelType": "extensions.channelType",
+        "creatorId": "extensions.creatorUid",
+        "bannedUsers": "extensions.bannedMemberUidList",
+        "visibility": "extensions.visibility",
+        "fansOnly": "extensions.fansOnly",
+        "pinAnnouncement": "extensions.pinAnnouncement",
+        "vvChatJoinType": "extensions.vvChatJoinType",
+        "disabledTime": "extensions.__disabledTime__",
+        "tippingPermStatus": "extensions.tippingPermStatus",
+        "screeningRoomHostId": "extensions.screeningRoomHostUid",
+        "screeningRoomPermission": "extensions.screeningRoomPermission.action",
+        "organizerTransferCreatedTime": "extensions.organizerTransferRequest.createdTime",
+        "organizerTransferId": "extensions.organizerTransferRequest.requestId"
+    }
 
     @property
     def Thread(self):
-        try: self.userAddedTopicList = self.json["userAddedTopicList"]
-        except (KeyError, TypeError): pass
-        try: self.membersQuota = self.json["membersQuota"]
-        except (KeyError, TypeError): pass
-        try: self.chatId = self.json["threadId"]
-        except (KeyError, TypeError): pass
-        try: self.keywords = self.json["keywords"]
-        except (KeyError, TypeError): pass
-        try: self.membersCount = self.json["membersCount"]
-        except (KeyError, TypeError): pass
-        try: self.isPinned = self.json["isPinned"]
-        except (KeyError, TypeError): pass
-        try: self.title = self.json["title"]
-        except (KeyError, TypeError): pass
-        try: self.membershipStatus = self.json["membershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.content = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.needHidden = self.json["needHidden"]
-        except (KeyError, TypeError): pass
-        try: self.alertOption = self.json["alertOption"]
-        except (KeyError, TypeError): pass
-        try: self.lastReadTime = self.json["lastReadTime"]
-        except (KeyError, TypeError): pass
-        try: self.type = self.json["type"]
-        except (KeyError, TypeError): pass
-        try: self.status = self.json["status"]
-        except (KeyError, TypeError): pass
-        try: self.publishToGlobal = self.json["publishToGlobal"]
-        except (KeyError, TypeError): pass
-        try: self.modifiedTime = self.json["modifiedTime"]
-        except (KeyError, TypeError): pass
-        try: self.condition = self.json["condition"]
-        except (KeyError, TypeError): pass
-        try: self.icon = self.json["icon"]
-        except (KeyError, TypeError): pass
-        try: self.latestActivityTime = self.json["latestActivityTime"]
-        except (KeyError, TypeError): pass
-        try: self.comId = self.json["ndcId"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.viewOnly = self.json["extensions"]["viewOnly"]
-        except (KeyError, TypeError): pass
-        try: self.coHosts = self.json["extensions"]["coHost"]
-        except (KeyError, TypeError): pass
-        try: self.membersCanInvite = self.json["extensions"]["membersCanInvite"]
-        except (KeyError, TypeError): pass
-        try: self.language = self.json["extensions"]["language"]
-        except (KeyError, TypeError): pass
-        try: self.announcement = self.json["extensions"]["announcement"]
-        except (KeyError, TypeError): pass
-        try: self.backgroundImage = self.json["extensions"]["bm"][1]
-        except (KeyError, TypeError, IndexError): pass
-        try: self.lastMembersSummaryUpdateTime = self.json["extensions"]["lastMembersSummaryUpdateTime"]
-        except (KeyError, TypeError): pass
-        try: self.channelType = self.json["extensions"]["channelType"]
-        except (KeyError, TypeError): pass
-        try: self.creatorId = self.json["extensions"]["creatorUid"]
-        except (KeyError, TypeError): pass
-        try: self.bannedUsers = self.json["extensions"]["bannedMemberUidList"]
-        except (KeyError, TypeError): pass
-        try: self.visibility = self.json["extensions"]["visibility"]
-        except (KeyError, TypeError): pass
-        try: self.fansOnly = self.json["extensions"]["fansOnly"]
-        except (KeyError, TypeError): pass
-        try: self.pinAnnouncement = self.json["extensions"]["pinAnnouncement"]
-        except (KeyError, TypeError): pass
-        try: self.vvChatJoinType = self.json["extensions"]["vvChatJoinType"]
-        except (KeyError, TypeError): pass
-        try: self.disabledTime = self.json["extensions"]["__disabledTime__"]
-        except (KeyError, TypeError): pass
-        try: self.tippingPermStatus = self.json["extensions"]["tippingPermStatus"]
-        except (KeyError, TypeError): pass
-        try: self.screeningRoomHostId = self.json["extensions"]["screeningRoomHostUid"]
-        except (KeyError, TypeError): pass
-        try: self.screeningRoomPermission = self.json["extensions"]["screeningRoomPermission"]["action"]
-        except (KeyError, TypeError): pass
-        try: self.organizerTransferCreatedTime = self.json["extensions"]["organizerTransferRequest"]["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.organizerTransferId = self.json["extensions"]["organizerTransferRequest"]["requestId"]
-        except (KeyError, TypeError): pass
-
         return self
 
-class ThreadList:
-    def __init__(self, data):
-        _author, _membersSummary = [], []
-
-        self.json = data
-
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
-
-            try: _membersSummary.append(UserProfileList(y["membersSummary"]).UserProfileList)
-            except (KeyError, TypeError): _membersSummary.append(None)
-
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
-        self.membersSummary = _membersSummary
-        self.userAddedTopicList = []
-        self.membersQuota = []
-        self.chatId = []
-        self.keywords = []
-        self.membersCount = []
-        self.isPinned = []
-        self.title = []
-        self.membershipStatus = []
-        self.content = []
-        self.needHidden = []
-        self.alertOption = []
-        self.lastReadTime = []
-        self.type = []
-        self.status = []
-        self.publishToGlobal = []
-        self.modifiedTime = []
-        self.condition = []
-        self.icon = []
-        self.latestActivityTime = []
-        self.extensions = []
-        self.viewOnly = []
-        self.coHosts = []
-        self.membersCanInvite = []
-        self.announcement = []
-        self.language = []
-        self.lastMembersSummaryUpdateTime = []
-        self.backgroundImage = []
-        self.channelType = []
-        self.comId = []
-        self.createdTime = []
-        self.creatorId = []
-        self.bannedUsers = []
-        self.tippingPermStatus = []
-        self.visibility = []
-        self.fansOnly = []
-        self.pinAnnouncement = []
-        self.vvChatJoinType = []
-        self.screeningRoomHostId = []
-        self.screeningRoomPermission = []
-        self.disabledTime = []
-        self.organizerTransferCreatedTime = []
-        self.organizerTransferId = []
+class ThreadList(LazyList):
+    FIELDS = Thread.FIELDS
+    TYPES = {
+        "comId": "int",
+        "membersCount": "int",
+        "membersQuota": "int",
+        "type": "int",
+        "status": "int",
+        "isPinned": "bool",
+        "createdTime": "datetime",
+        "modifiedTime": "datetime",
+        "latestActivityTime": "datetime"
+    }
 
     @property
     def ThreadList(self):
-        for chat in self.json:
-            try: self.userAddedTopicList.append(chat["userAddedTopicList"])
-            except (KeyError, TypeError): self.userAddedTopicList.append(None)
-            try: self.membersQuota.append(chat["membersQuota"])
-            except (KeyError, TypeError): self.membersQuota.append(None)
-            try: self.chatId.append(chat["threadId"])
-            except (KeyError, TypeError): self.chatId.append(None)
-            try: self.keywords.append(chat["keywords"])
-            except (KeyError, TypeError): self.keywords.append(None)
-            try: self.membersCount.append(chat["membersCount"])
-            except (KeyError, TypeError): self.membersCount.append(None)
-            try: self.isPinned.append(chat["isPinned"])
-            except (KeyError, TypeError): self.isPinned.append(None)
-            try: self.title.append(chat["title"])
-            except (KeyError, TypeError): self.title.append(None)
-            try: self.membershipStatus.append(chat["membershipStatus"])
-            except (KeyError, TypeError): self.membershipStatus.append(None)
-            try: self.content.append(chat["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.needHidden.append(chat["needHidden"])
-            except (KeyError, TypeError): self.needHidden.append(None)
-            try: self.alertOption.append(chat["alertOption"])
-            except (KeyError, TypeError): self.alertOption.append(None)
-            try: self.lastReadTime.append(chat["lastReadTime"])
-            except (KeyError, TypeError): self.lastReadTime.append(None)
-            try: self.type.append(chat["type"])
-            except (KeyError, TypeError): self.type.append(None)
-            try: self.status.append(chat["status"])
-            except (KeyError, TypeError): self.status.append(None)
-            try: self.publishToGlobal.append(chat["publishToGlobal"])
-            except (KeyError, TypeError): self.publishToGlobal.append(None)
-            try: self.modifiedTime.append(chat["modifiedTime"])
-            except (KeyError, TypeError): self.modifiedTime.append(None)
-            try: self.condition.append(chat["condition"])
-            except (KeyError, TypeError): self.condition.append(None)
-            try: self.icon.append(chat["icon"])
-            except (KeyError, TypeError): self.icon.append(None)
-            try: self.latestActivityTime.append(chat["latestActivityTime"])
-            except (KeyError, TypeError): self.latestActivityTime.append(None)
-            try: self.comId.append(chat["ndcId"])
-            except (KeyError, TypeError): self.comId.append(None)
-            try: self.createdTime.append(chat["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try:  self.extensions.append(chat["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try:  self.viewOnly.append(chat["extensions"]["viewOnly"])
-            except (KeyError, TypeError): self.viewOnly.append(None)
-            try:  self.coHosts.append(chat["extensions"]["coHost"])
-            except (KeyError, TypeError): self.coHosts.append(None)
-            try:  self.membersCanInvite.append(chat["extensions"]["membersCanInvite"])
-            except (KeyError, TypeError): self.membersCanInvite.append(None)
-            try:  self.language.append(chat["extensions"]["language"])
-            except (KeyError, TypeError): self.language.append(None)
-            try:  self.announcement.append(chat["extensions"]["announcement"])
-            except (KeyError, TypeError): self.announcement.append(None)
-            try:  self.backgroundImage.append(chat["extensions"]["bm"][1])
-            except (KeyError, TypeError, IndexError): self.backgroundImage.append(None)
-            try:  self.lastMembersSummaryUpdateTime.append(chat["extensions"]["lastMembersSummaryUpdateTime"])
-            except (KeyError, TypeError): self.lastMembersSummaryUpdateTime.append(None)
-            try:  self.channelType.append(chat["extensions"]["channelType"])
-            except (KeyError, TypeError): self.channelType.append(None)
-            try:  self.creatorId.append(chat["extensions"]["creatorUid"])
-            except (KeyError, TypeError): self.creatorId.append(None)
-            try:  self.bannedUsers.append(chat["extensions"]["bannedMemberUidList"])
-            except (KeyError, TypeError): self.bannedUsers.append(None)
-            try:  self.visibility.append(chat["extensions"]["visibility"])
-            except (KeyError, TypeError): self.visibility.append(None)
-            try:  self.fansOnly.append(chat["extensions"]["fansOnly"])
-            except (KeyError, TypeError): self.fansOnly.append(None)
-            try:  self.pinAnnouncement.append(chat["extensions"]["pinAnnouncement"])
-            except (KeyError, TypeError): self.pinAnnouncement.append(None)
-            try:  self.vvChatJoinType.append(chat["extensions"]["vvChatJoinType"])
-            except (KeyError, TypeError): self.vvChatJoinType.append(None)
-            try:  self.tippingPermStatus.append(chat["extensions"]["tippingPermStatus"])
-            except (KeyError, TypeError): self.tippingPermStatus.append(None)
-            try:  self.screeningRoomHostId.append(chat["extensions"]["screeningRoomHostUid"])
-            except (KeyError, TypeError): self.screeningRoomHostId.append(None)
-            try:  self.disabledTime.append(chat["extensions"]["__disabledTime__"])
-            except (KeyError, TypeError): self.disabledTime.append(None)
-            try:  self.screeningRoomPermission.append(chat["extensions"]["screeningRoomPermission"]["action"])
-            except (KeyError, TypeError): self.screeningRoomPermission.append(None)
-            try:  self.organizerTransferCreatedTime.append(chat["extensions"]["organizerTransferRequest"]["createdTime"])
-            except (KeyError, TypeError): self.organizerTransferCreatedTime.append(None)
-            try:  self.organizerTransferId.append(chat["extensions"]["organizerTransferRequest"]["requestId"])
-            except (KeyError, TypeError): self.organizerTransferId.append(None)
-
         return self
 
 class Sticker:
@@ -2692,9 +1677,9 @@ class StickerCollection:
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
+        try: self.author: UserProfile = shared_profile(data["author"])
         except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
-        try: self.originalAuthor: UserProfile = UserProfile(data["extensions"]["originalAuthor"]).UserProfile
+        try: self.originalAuthor: UserProfile = shared_profile(data["extensions"]["originalAuthor"])
         except (KeyError, TypeError): self.originalAuthor: UserProfile = UserProfile([])
         try: self.originalCommunity: Community = Community(data["extensions"]["originalCommunity"]).Community
         except (KeyError, TypeError): self.originalCommunity: Community = Community([])
@@ -2879,188 +1864,58 @@ class StickerCollectionList:
 
         return self
 
-class Message:
-    def __init__(self, data):
-        self.json = data
-
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
-        except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
-        try: self.sticker: Sticker = Sticker(data["extensions"]["sticker"]).Sticker
-        except (KeyError, TypeError): self.sticker: Sticker = Sticker([])
-
-        self.content = None
-        self.includedInSummary = None
-        self.isHidden = None
-        self.messageType = None
-        self.messageId = None
-        self.mediaType = None
-        self.mediaValue = None
-        self.chatBubbleId = None
-        self.clientRefId = None
-        self.chatId = None
-        self.createdTime = None
-        self.chatBubbleVersion = None
-        self.type = None
-        self.replyMessage = None
-        self.extensions = None
-        self.duration = None
-        self.originalStickerId = None
-        self.videoDuration = None
-        self.videoExtensions = None
-        self.videoHeight = None
-        self.videoCoverImage = None
-        self.videoWidth = None
-        self.mentionUserIds = None
-        self.tippingCoins = None
-
+class Message(LazyObject):
+    FIELDS = {
+        "author": Nested("author", shared_profile, lambda: UserProfile([]), lambda v: UserProfileList(v).UserProfileList),
+        "sticker": Nested("extensions.sticker", lambda v: Sticker(v).Sticker, lambda: Sticker([]), lambda v: StickerList(v).StickerList),
+        # mentions fixed by enchart
+        "mentionUserIds": Nested("extensions.mentionedArray", lambda v: [m["uid"] for m in v]),
+        "content": "content",
+        "includedInSummary": "includedInSummary",
+        "isHidden": "isHidden",
+        "messageId": "messageId",
+        "messageType": "messageType",
+        "mediaType": "mediaType",
+        "chatBubbleId": "chatBubbleId",
+        "clientRefId": "clientRefId",
+        "chatId": "threadId",
+        "createdTime": "createdTime",
+        "chatBubbleVersion": "chatBubbleVersion",
+        "type": "type",
+        "replyMessage": "extensions.replyMessage",
+        "mediaValue": "mediaValue",
+        "extensions": "extensions",
+        "duration": "extensions.duration",
+        "videoExtensions": "extensions.videoExtensions",
+        "videoDuration": "extensions.videoExtensions.duration",
+        "videoHeight": "extensions.videoExtensions.height",
+        "videoWidth": "extensions.videoExtensions.width",
+        "videoCoverImage": "extensions.videoExtensions.coverImage",
+        "originalStickerId": "extensions.originalStickerId",
+        "tippingCoins": "extensions.tippingCoins"
+    }
 
     @property
     def Message(self):
-        try: self.content = self.json["content"]
-        except (KeyError, TypeError): pass
-        try: self.includedInSummary = self.json["includedInSummary"]
-        except (KeyError, TypeError): pass
-        try: self.isHidden = self.json["isHidden"]
-        except (KeyError, TypeError): pass
-        try: self.messageId = self.json["messageId"]
-        except (KeyError, TypeError): pass
-        try: self.messageType = self.json["messageType"]
-        except (KeyError, TypeError): pass
-        try: self.mediaType = self.json["mediaType"]
-        except (KeyError, TypeError): pass
-        try: self.chatBubbleId = self.json["chatBubbleId"]
-        except (KeyError, TypeError): pass
-        try: self.clientRefId = self.json["clientRefId"]
-        except (KeyError, TypeError): pass
-        try: self.chatId = self.json["threadId"]
-        except (KeyError, TypeError): pass
-        try: self.createdTime = self.json["createdTime"]
-        except (KeyError, TypeError): pass
-        try: self.chatBubbleVersion = self.json["chatBubbleVersion"]
-        except (KeyError, TypeError): pass
-        try: self.type = self.json["type"]
-        except (KeyError, TypeError): pass
-        try: self.replyMessage = self.json["extensions"]["replyMessage"]
-        except (KeyError, TypeError): pass
-        try: self.mediaValue = self.json["mediaValue"]
-        except (KeyError, TypeError): pass
-        try: self.extensions = self.json["extensions"]
-        except (KeyError, TypeError): pass
-        try: self.duration = self.json["extensions"]["duration"]
-        except (KeyError, TypeError): pass
-        try: self.videoDuration = self.json["extensions"]["videoExtensions"]["duration"]
-        except (KeyError, TypeError): pass
-        try: self.videoHeight = self.json["extensions"]["videoExtensions"]["height"]
-        except (KeyError, TypeError): pass
-        try: self.videoWidth = self.json["extensions"]["videoExtensions"]["width"]
-        except (KeyError, TypeError): pass
-        try: self.videoCoverImage = self.json["extensions"]["videoExtensions"]["coverImage"]
-        except (KeyError, TypeError): pass
-        try: self.originalStickerId = self.json["extensions"]["originalStickerId"]
-        except (KeyError, TypeError): pass
-        # mentions fixed by enchart
-        try: self.mentionUserIds = [m["uid"] for m in self.json["extensions"]["mentionedArray"]]
-        except (KeyError, TypeError): pass
-        try: self.tippingCoins = self.json["extensions"]["tippingCoins"]
-        except (KeyError, TypeError): pass
-
         return self
 
-class MessageList:
-    def __init__(self, data, nextPageToken = None, prevPageToken = None):
-        _author, _sticker = [], []
+class MessageList(LazyList):
+    FIELDS = Message.FIELDS
+    INTERNED = ("chatId", "chatBubbleId", "originalStickerId")
 
-        self.json = data
+    def __init__(self, data, nextPageToken = None, prevPageToken = None, fields = None):
         self.nextPageToken = nextPageToken
         self.prevPageToken = prevPageToken
-
-        for y in data:
-            try: _author.append(y["author"])
-            except (KeyError, TypeError): _author.append(None)
-            try: _sticker.append(y["extensions"]["sticker"])
-            except (KeyError, TypeError): _sticker.append(None)
-
-        self.author: UserProfileList = UserProfileList(_author).UserProfileList
-        self.sticker: StickerList = StickerList(_sticker).StickerList
-        self.content = []
-        self.includedInSummary = []
-        self.isHidden = []
-        self.messageType = []
-        self.messageId = []
-        self.mediaType = []
-        self.mediaValue = []
-        self.chatBubbleId = []
-        self.clientRefId = []
-        self.chatId = []
-        self.createdTime = []
-        self.chatBubbleVersion = []
-        self.type = []
-        self.extensions = []
-        self.mentionUserIds = []
-        self.duration = []
-        self.originalStickerId = []
-        self.videoExtensions = []
-        self.videoDuration = []
-        self.videoHeight = []
-        self.videoWidth = []
-        self.videoCoverImage = []
-        self.tippingCoins = []
+        super().__init__(data, fields)
 
     @property
     def MessageList(self):
-        for x in self.json:
-            try: self.content.append(x["content"])
-            except (KeyError, TypeError): self.content.append(None)
-            try: self.includedInSummary.append(x["includedInSummary"])
-            except (KeyError, TypeError): self.includedInSummary.append(None)
-            try: self.isHidden.append(x["isHidden"])
-            except (KeyError, TypeError): self.isHidden.append(None)
-            try: self.messageId.append(x["messageId"])
-            except (KeyError, TypeError): self.messageId.append(None)
-            try: self.chatBubbleId.append(x["chatBubbleId"])
-            except (KeyError, TypeError): self.chatBubbleId.append(None)
-            try: self.clientRefId.append(x["clientRefId"])
-            except (KeyError, TypeError): self.clientRefId.append(None)
-            try: self.chatId.append(x["threadId"])
-            except (KeyError, TypeError): self.chatId.append(None)
-            try: self.messageType.append(x["messageType"])
-            except (KeyError, TypeError): self.messageType.append(None)
-            try: self.createdTime.append(x["createdTime"])
-            except (KeyError, TypeError): self.createdTime.append(None)
-            try: self.chatBubbleVersion.append(x["chatBubbleVersion"])
-            except (KeyError, TypeError): self.chatBubbleVersion.append(None)
-            try: self.type.append(x["type"])
-            except (KeyError, TypeError): self.type.append(None)
-            try: self.mediaValue.append(x["mediaValue"])
-            except (KeyError, TypeError): self.mediaValue.append(None)
-            try: self.mediaType.append(x["mediaType"])
-            except (KeyError, TypeError): self.mediaType.append(None)
-            try: self.extensions.append(x["extensions"])
-            except (KeyError, TypeError): self.extensions.append(None)
-            try: self.duration.append(x["extensions"]["duration"])
-            except (KeyError, TypeError): self.duration.append(None)
-            try: self.originalStickerId.append(x["extensions"]["originalStickerId"])
-            except (KeyError, TypeError): self.originalStickerId.append(None)
-            try: self.mentionUserIds.append([m["uid"] for m in x["extensions"]["mentionedArray"]])
-            except (KeyError, TypeError): self.mentionUserIds.append(None)
-            try: self.videoExtensions.append(x["extensions"]["videoExtensions"])
-            except (KeyError, TypeError): self.videoExtensions.append(None)
-            try: self.videoDuration.append(x["extensions"]["videoExtensions"]["duration"])
-            except (KeyError, TypeError): self.videoDuration.append(None)
-            try: self.videoHeight.append(x["extensions"]["videoExtensions"]["height"])
-            except (KeyError, TypeError): self.videoHeight.append(None)
-            try: self.videoWidth.append(x["extensions"]["videoExtensions"]["width"])
-            except (KeyError, TypeError): self.videoWidth.append(None)
-            try: self.videoCoverImage.append(x["extensions"]["videoExtensions"]["coverImage"])
-            except (KeyError, TypeError): self.videoCoverImage.append(None)
-            try: self.tippingCoins.append(x["extensions"]["tippingCoins"])
-            except (KeyError, TypeError): self.tippingCoins.append(None)
-
         return self
 
 class GetMessages:
-    def __init__(self, data):
+    def __init__(self, data, fields = None):
         self.json = data
+        self.fields = fields
 
         self.messageList = []
         self.nextPageToken = None
@@ -3075,7 +1930,7 @@ class GetMessages:
         try: self.messageList = self.json["messageList"]
         except (KeyError, TypeError): pass
 
-        return MessageList(self.messageList, self.nextPageToken, self.prevPageToken).MessageList
+        return MessageList(self.messageList, self.nextPageToken, self.prevPageToken, self.fields).MessageList
 
 class CommunityStickerCollection:
     def __init__(self, data):
@@ -3319,7 +2174,7 @@ class InfluencerFans:
     def __init__(self, data):
         self.json = data
 
-        try: self.influencerProfile: UserProfile = UserProfile(data["influencerUserProfile"]).UserProfile
+        try: self.influencerProfile: UserProfile = shared_profile(data["influencerUserProfile"])
         except (KeyError, TypeError): self.influencerProfile: UserProfile = UserProfile([])
         try: self.fanClubList: FanClubList = FanClubList(data["fanClubList"]).FanClubList
         except (KeyError, TypeError): self.fanClubList: FanClubList = FanClubList([])
@@ -3535,7 +2390,7 @@ class SharedFolderFile:
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
+        try: self.author: UserProfile = shared_profile(data["author"])
         except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
 
         self.votesCount = None
@@ -3658,43 +2513,22 @@ class SharedFolderFileList:
 
         return self
 
-class Event:
-    def __init__(self, data):
-        self.json = data
-        self.comId = None
-        self.alertOption = None
-        self.membershipStatus = None
-        self.actions = None
-        self.target = None
-        self.params = None
-        self.threadType = None
-        self.id = None
-        self.duration = None
-
-        try: self.message: Message = Message(data["chatMessage"]).Message
-        except (KeyError, TypeError): self.message: Message = Message([])
+class Event(LazyObject):
+    FIELDS = {
+        "message": Nested("chatMessage", lambda v: Message(v).Message, lambda: Message([])),
+        "comId": "ndcId",
+        "alertOption": "alertOption",
+        "membershipStatus": "membershipStatus",
+        "actions": "actions",
+        "target": "target",
+        "params": "params",
+        "threadType": "params.threadType",
+        "duration": "params.duration",
+        "id": "id"
+    }
 
     @property
     def Event(self):
-        try: self.comId = self.json["ndcId"]
-        except (KeyError, TypeError): pass
-        try: self.alertOption = self.json["alertOption"]
-        except (KeyError, TypeError): pass
-        try: self.membershipStatus = self.json["membershipStatus"]
-        except (KeyError, TypeError): pass
-        try: self.actions = self.json["actions"]
-        except (KeyError, TypeError): pass
-        try: self.target = self.json["target"]
-        except (KeyError, TypeError): pass
-        try: self.params = self.json["params"]
-        except (KeyError, TypeError): pass
-        try: self.threadType = self.json["params"]["threadType"]
-        except (KeyError, TypeError): pass
-        try: self.duration = self.json["params"]["duration"]
-        except (KeyError, TypeError): pass
-        try: self.id = self.json["id"]
-        except (KeyError, TypeError): pass
-
         return self
 
 class JoinRequest:
@@ -3749,7 +2583,7 @@ class InviteCode:
     def __init__(self, data):
         self.json = data
 
-        try: self.author: UserProfile = UserProfile(data["author"]).UserProfile
+        try: self.author: UserProfile = shared_profile(data["author"])
         except (KeyError, TypeError): self.author: UserProfile = UserProfile([])
 
         self.status = None
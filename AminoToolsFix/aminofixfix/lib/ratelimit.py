@@ -0,0 +1,145 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from time import monotonic
+from threading import Lock
+
+# if registry grows more than that, idle (full) buckets will be dropped
+MAX_IDLE_BUCKETS = 1024
+
+class TokenBucket:
+    '''
+        Token bucket. Thread-safe, works with sync and async code,
+        because it never sleeps by itself - it only says how long to wait.
+    '''
+    def __init__(self, rate: float, burst: int):
+        '''
+            Args:
+            - rate: float
+                - tokens per second
+            - burst: int
+                - max tokens that can be saved up
+        '''
+        self.rate = rate
+        self.burst = burst
+        self.__tokens = float(burst)
+        self.__updated = monotonic()
+        self.__lock = Lock()
+
+    def __refill(self, now: float):
+        self.__tokens = min(self.burst, self.__tokens + (now - self.__updated) * self.rate)
+        self.__updated = now
+
+    def reserve(self) -> float:
+        '''
+            Take one token. Token can be taken "in debt",
+            so waiters are served one by one with stable rate.
+
+            Returns seconds you should wait before sending request.
+        '''
+        with self.__lock:
+            self.__refill(monotonic())
+            self.__tokens -= 1
+            if self.__tokens >= 0:
+                return 0.0
+            return -self.__tokens / self.rate
+
+    def is_idle(self) -> bool:
+        '''
+            True if bucket is full, so it is same as brand new one.
+        '''
+        with self.__lock:
+            self.__refill(monotonic())
+            return self.__tokens >= self.burst
+
+class RateLimit:
+    '''
+        Rate limit config for facades.
+
+        Buckets are process-wide and keyed by account (sid, or deviceId if you are not logged in)
+        and optionally by proxy, so `Client`, all `SubClient`s and `ACM`s of one account
+        share same limit, even if they are using different sessions.
+
+        GET requests (`/s/user-profile`, `/s/live-layer`, ...) are going to "read" bucket,
+        everything else (`/message`, `/vote`, `/comment`, ...) to "write" bucket.
+
+        If two configs with different rates are used for same account, bucket is made by first one.
+    '''
+    def __init__(
+            self,
+            read_rate: float = 5,
+            read_burst: int = 10,
+            write_rate: float = 1,
+            write_burst: int = 3,
+            per_proxy: bool = False
+        ):
+        '''
+            Init of rate limit.
+
+            Args:
+            - read_rate: float = 5
+                - GET requests per second
+            - read_burst: int = 10
+                - how much GET requests can be sent at once after idle
+            - write_rate: float = 1
+                - POST/DELETE requests per second
+            - write_burst: int = 3
+                - how much POST/DELETE requests can be sent at once after idle
+            - per_proxy: bool = False
+                - separate buckets for every proxy
+        '''
+        self.read_rate = read_rate
+        self.read_burst = read_burst
+        self.write_rate = write_rate
+        self.write_burst = write_burst
+        self.per_proxy = per_proxy
+
+    @staticmethod
+    def bucket_kind(method: str) -> str:
+        return "read" if method.upper() == "GET" else "write"
+
+    @staticmethod
+    def account_key(headers: dict) -> str:
+        return headers.get("NDCAUTH") or headers.get("NDCDEVICEID") or "guest"
+
+    def reserve(self, method: str, headers: dict, proxy: str | dict | None = None) -> float:
+        '''
+            Take token for request.
+
+            Args:
+            - method: str
+            - headers: dict
+                - headers of request, account is taken from them
+            - proxy: str | dict | None = None
+
+            Returns seconds you should wait before sending request.
+        '''
+        kind = self.bucket_kind(method)
+        key = (
+            self.account_key(headers),
+            str(proxy) if self.per_proxy and proxy else None,
+            kind
+        )
+        if kind == "read":
+            return get_bucket(key, self.read_rate, self.read_burst).reserve()
+        return get_bucket(key, self.write_rate, self.write_burst).reserve()
+
+_buckets: dict[tuple, TokenBucket] = {}
+_buckets_lock = Lock()
+
+def get_bucket(key: tuple, rate: float, burst: int) -> TokenBucket:
+    '''
+        Get process-wide bucket by key, make it if needed.
+    '''
+    bucket = _buckets.get(key)
+    if bucket is not None:
+        return bucket
+
+    with _buckets_lock:
+        bucket = _buckets.get(key)
+        if bucket is None:
+            if len(_buckets) >= MAX_IDLE_BUCKETS:
+                for old_key in [k for k, b in _buckets.items() if b.is_idle()]:
+                    del _buckets[old_key]
+            bucket = _buckets[key] = TokenBucket(rate, burst)
+    return bucket
@@ -0,0 +1,184 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from random import uniform
+from time import monotonic
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS")
+
+class RetryPolicy:
+    '''
+        Retry policy for facades.
+
+        Used instead of infinite re-sending on 429.
+        Waits with exponential backoff (with jitter) between attempts,
+        respects `Retry-After` header and gives up after `max_attempts`
+        or when next attempt would start after `deadline`.
+        Attempts themselves are limited only by deadline you set
+        (`Client.deadline()` or `timeout` of request), not by this one.
+
+        Transport errors (connect resets, read timeouts, etc.) are retried too:
+        - errors before request was sent (connect phase) are retried for any method
+        - other errors are retried only for idempotent methods (GET),
+          so we will not send your message twice
+    '''
+    def __init__(
+            self,
+            max_attempts: int = 5,
+            backoff_factor: float = 0.5,
+            max_backoff: float = 30,
+            deadline: float | None = None,
+            jitter: bool = True,
+            retry_statuses: tuple[int, ...] = (429,),
+            respect_retry_after: bool = True,
+            retry_transport_errors: bool = True
+        ):
+        '''
+            Init of retry policy.
+
+            Args:
+            - max_attempts: int = 5
+                - how much attempts (first one included) will be made
+                - 1 means no retries at all
+            - backoff_factor: float = 0.5
+                - base delay in seconds, doubled every attempt
+            - max_backoff: float = 30
+                - max delay between attempts in seconds
+            - deadline: float | None = None
+                - time in seconds after which no more retries are scheduled
+                - attempt that already runs is not cut, so long uploads still work
+                - None for no limit
+            - jitter: bool = True
+                - randomize delays, so many clients will not retry at the same moment
+            - retry_statuses: tuple[int, ...] = (429,)
+                - status codes that should be retried
+            - respect_retry_after: bool = True
+                - wait at least as long as server asked in `Retry-After`
+            - retry_transport_errors: bool = True
+                - retry connect resets, timeouts, etc.
+        '''
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.jitter = jitter
+        self.retry_statuses = tuple(retry_statuses)
+        self.respect_retry_after = respect_retry_after
+        self.retry_transport_errors = retry_transport_errors
+
+    @classmethod
+    def disabled(cls) -> RetryPolicy:
+        '''
+            Policy that never retries.
+        '''
+        return cls(max_attempts=1, retry_transport_errors=False)
+
+    def start(self, deadline: float | None = None) -> RetryState:
+        '''
+            Start new request. Returns object `RetryState`, that counts attempts.
+
+            Args:
+            - deadline: float | None = None
+                - deadline for this request that caller set, every attempt fits in it
+        '''
+        return RetryState(self, deadline)
+
+    def should_retry_status(self, status_code: int) -> bool:
+        return status_code in self.retry_statuses
+
+    def should_retry_error(self, method: str, connect_phase: bool = False) -> bool:
+        '''
+            Check if transport error can be retried.
+
+            Args:
+            - method: str
+            - connect_phase: bool = False
+                - True if error happened before request reached server
+        '''
+        if not self.retry_transport_errors:
+            return False
+        return connect_phase or method.upper() in IDEMPOTENT_METHODS
+
+    def backoff(self, attempt: int) -> float:
+        '''
+            Delay before next attempt (without `Retry-After`).
+
+            Args:
+            - attempt: int
+                - number of failed attempt, starting from 1
+        '''
+        delay = min(self.max_backoff, self.backoff_factor * (2 ** (attempt - 1)))
+        if self.jitter:
+            # "equal jitter": never less than half of delay
+            delay = uniform(delay / 2, delay)
+        return delay
+
+def parse_retry_after(value: str | None) -> float | None:
+    '''
+        Parse `Retry-After` header. It can be seconds or HTTP date.
+
+        Returns seconds or None if header is missing or broken.
+    '''
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError, IndexError, OverflowError):
+        return None
+
+class RetryState:
+    '''
+        State of retries for one request. Made by `RetryPolicy.start()`.
+    '''
+    def __init__(self, policy: RetryPolicy, deadline: float | None):
+        self.policy = policy
+        self.attempt = 1
+        now = monotonic()
+        # deadline of caller: attempts are cut by it
+        self.expires_at = None if deadline is None else now + deadline
+        # deadline of policy: only new retries are not scheduled after it
+        self.retry_until = None if policy.deadline is None else now + policy.deadline
+
+    def remaining(self) -> float | None:
+        '''
+            Seconds left until deadline of caller, None if there is no deadline.
+        '''
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - monotonic())
+
+    def next_delay(self, retry_after: str | None = None) -> float | None:
+        '''
+            Register failed attempt and get delay before next one.
+
+            Args:
+            - retry_after: str | None = None
+                - value of `Retry-After` header if server sent it
+
+            Returns:
+            - float (seconds to wait)
+            - None if we should give up
+        '''
+        if self.attempt >= self.policy.max_attempts:
+            return None
+
+        delay = self.policy.backoff(self.attempt)
+        if self.policy.respect_retry_after:
+            asked = parse_retry_after(retry_after)
+            if asked is not None:
+                delay = max(delay, asked)
+
+        remaining = self.remaining()
+        if remaining is not None and delay >= remaining:
+            return None
+        if self.retry_until is not None and monotonic() + delay >= self.retry_until:
+            return None
+
+        self.attempt += 1
+        return delay
@@ -0,0 +1,565 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from sys import intern
+from functools import wraps
+from typing import Any, Callable, Iterable, Iterator
+from contextvars import ContextVar
+from inspect import isfunction, iscoroutinefunction
+
+from .exceptions import WrongType, RawNotRetained
+from .identity_map import current_identity_map
+
+# what can go wrong while walking through JSON of Amino
+MISSING = (KeyError, TypeError, IndexError)
+
+# should objects keep JSON they were made from, see `set_retain_raw`
+RETAIN_RAW = True
+# setting of client that made current request (in this thread or task), None for `RETAIN_RAW`
+retain_raw_override: ContextVar[bool | None] = ContextVar("retain_raw", default=None)
+
+def set_retain_raw(enabled: bool):
+    '''
+        Keep JSON in objects after parsing (default) or drop it to save memory.
+
+        Without JSON objects are parsed right away (not lazily), `raw()` and `json` are not available.
+        Clients can override it with `retain_raw` argument.
+    '''
+    global RETAIN_RAW
+    RETAIN_RAW = enabled
+
+def retains_raw() -> bool:
+    override = retain_raw_override.get()
+    return RETAIN_RAW if override is None else override
+
+def current_settings() -> tuple | None:
+    '''
+        Settings of client that objects are made for now (see `parse_settings`), None if there are no ones.
+    '''
+    settings = (retain_raw_override.get(), current_identity_map.get())
+    return None if settings == (None, None) else settings
+
+class parse_settings:
+    '''
+        Objects made inside `with` block follow these settings of client, after it - previous ones.
+    '''
+    __slots__ = ("retain_raw", "identity_map", "tokens")
+
+    def __init__(self, retain_raw: bool | None = None, identity_map=None):
+        self.retain_raw = retain_raw
+        self.identity_map = identity_map
+
+    def __enter__(self):
+        self.tokens = (retain_raw_override.set(self.retain_raw), current_identity_map.set(self.identity_map))
+
+    def __exit__(self, *exc):
+        retain_raw, identity_map = self.tokens
+        current_identity_map.reset(identity_map)
+        retain_raw_override.reset(retain_raw)
+
+def client_settings(client) -> tuple:
+    return (client.retain_raw, client.identity_map)
+
+def follow_client_settings(cls: type) -> type:
+    '''
+        Class decorator for clients: objects made inside public methods of client
+        follow its settings (`retain_raw`, `identity_map`), and only them - not objects of other clients or your code.
+    '''
+    def scoped(function: Callable) -> Callable:
+        if iscoroutinefunction(function):
+            @wraps(function)
+            async def method(self, *args, **kwargs):
+                with parse_settings(*client_settings(self)):
+                    return await function(self, *args, **kwargs)
+        else:
+            @wraps(function)
+            def method(self, *args, **kwargs):
+                with parse_settings(*client_settings(self)):
+                    return function(self, *args, **kwargs)
+        return method
+
+    for name, function in list(vars(cls).items()):
+        if isfunction(function) and not name.startswith("_"):
+            setattr(cls, name, scoped(function))
+    return cls
+
+# should list objects intern strings of their `INTERNED` columns, see `set_intern_strings`
+INTERN_STRINGS = False
+
+def set_intern_strings(enabled: bool):
+    '''
+        Intern strings of columns that repeat a lot (`INTERNED` of list objects: chat IDs, bubble IDs, frames...).
+
+        Same value in thousands of rows is kept in memory once, for one pass over every page.
+        Strings are replaced in JSON itself, so it works with kept JSON too. Off by default.
+    '''
+    global INTERN_STRINGS
+    INTERN_STRINGS = enabled
+
+def split_path(path: str) -> tuple:
+    '''
+        "extensions.style.backgroundMediaList.1" -> ("extensions", "style", "backgroundMediaList", 1)
+    '''
+    return tuple(int(key) if key.isdigit() else key for key in path.split("."))
+
+def access(path: str) -> str:
+    '''
+        "extensions.bm.1" -> "['extensions']['bm'][1]" (for generated code)
+    '''
+    return "".join(f"[{key!r}]" for key in split_path(path))
+
+class Nested:
+    '''
+        Field that is another object, made from value at `path`.
+
+        Args:
+        - path: str
+            - path of value in JSON
+        - make: Callable[[Any], Any]
+            - object from value (one object)
+        - empty: Callable[[], Any] = lambda: None
+            - object if there is no value (one object)
+        - column: Callable[[list], Any] | None = None
+            - object from values of all items (list of objects), `None` in place of missing ones
+            - if not set, list of objects has list of `make(value)` (or `None`)
+    '''
+    __slots__ = ("path", "make", "empty", "column")
+
+    def __init__(
+            self,
+            path: str,
+            make: Callable[[Any], Any],
+            empty: Callable[[], Any] = lambda: None,
+            column: Callable[[list], Any] | None = None
+        ):
+        self.path = path
+        self.make = make
+        self.empty = empty
+        self.column = column
+
+class Record:
+    '''
+        Base of rows made by `LazyList.rows()`: one object of list with only its values.
+
+        Rows have `__slots__` (no `__dict__` per row), so they are small.
+    '''
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({values})"
+
+    def __eq__(self, other) -> bool:
+        return type(self) is type(other) and self.as_tuple() == other.as_tuple()
+
+    def as_tuple(self) -> tuple:
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+class Schema:
+    '''
+        Compiled `FIELDS` of object: {attribute: "path.in.json" or `Nested`}.
+
+        For every field there are two functions, generated as Python source
+        and compiled once (when class with these `FIELDS` is created):
+        - `getters[name](data)` - value of field from one object
+        - `columns[name](items)` - list of values from list of objects
+
+        So objects and their lists are parsed by same code from same table.
+        Row types (`record`) are generated the same way, when they are needed first time.
+    '''
+    __compiled: dict[int, Schema] = {}
+
+    def __init__(self, fields: dict[str, str | Nested], owner: str = "schema"):
+        self.fields = fields
+        self.owner = owner
+        self.getters: dict[str, Callable[[Any], Any]] = {}
+        self.columns: dict[str, Callable[[Any], Any]] = {}
+        # value at path of field as it is in JSON (for `Nested` - before making object)
+        self.raws: dict[str, Callable[[Any], Any]] = {}
+        self.nested: frozenset[str] = frozenset(name for name, spec in fields.items() if isinstance(spec, Nested))
+        self.__records: dict[tuple[str, ...], type[Record]] = {}
+        self.__interners: dict[tuple[str, ...], Callable[[list], None]] = {}
+
+        namespace: dict[str, Any] = {"MISSING": MISSING}
+        source = [self.__source(index, spec, namespace) for index, spec in enumerate(fields.values())]
+        exec(compile("\n".join(source), f"<{owner} fields>", "exec"), namespace)
+
+        for index, name in enumerate(fields):
+            self.getters[name] = namespace[f"get_{index}"]
+            self.columns[name] = namespace[f"column_{index}"]
+            self.raws[name] = namespace.get(f"raw_{index}", self.getters[name])
+
+    @classmethod
+    def of(cls, fields: dict[str, str | Nested], owner: str = "schema") -> Schema:
+        '''
+            Schema of `FIELDS`, compiled only once even if many classes share it.
+        '''
+        schema = cls.__compiled.get(id(fields))
+        if schema is None or schema.fields is not fields:
+            schema = cls.__compiled[id(fields)] = cls(fields, owner)
+        return schema
+
+    def check(self, names: Iterable[str]) -> tuple[str, ...]:
+        '''
+            Names of fields in order, raises `WrongType` if some of them are unknown.
+        '''
+        names = tuple(dict.fromkeys(names))
+        unknown = [name for name in names if name not in self.fields]
+        if unknown:
+            raise WrongType(f"{self.owner} has no fields: {', '.join(sorted(unknown))}")
+        return names
+
+    def record(self, names: tuple[str, ...]) -> type[Record]:
+        '''
+            Row type with these fields, made from JSON of one object: `Row(data)`.
+        '''
+        record = self.__records.get(names)
+        if record is not None:
+            return record
+
+        namespace: dict[str, Any] = {"MISSING": MISSING}
+        source = ["def __init__(self, x):"]
+        for index, name in enumerate(names):
+            spec = self.fields[name]
+            if isinstance(spec, Nested):
+                namespace[f"get_{index}"] = self.getters[name]
+                source.append(f"    self.{name} = get_{index}(x)")
+            else:
+                source.append(f"    try: self.{name} = x{access(spec)}")
+                source.append(f"    except MISSING: self.{name} = None")
+        if not names:
+            source.append("    pass")
+        exec(compile("\n".join(source), f"<{self.owner} row>", "exec"), namespace)
+
+        record = self.__records[names] = type(
+            f"{self.owner.removesuffix('List')}Row", (Record,),
+            {"__slots__": names, "__init__": namespace["__init__"]}
+        )
+        return record
+
+    def interner(self, names: tuple[str, ...]) -> Callable[[list], None]:
+        '''
+            Function that interns strings at paths of these fields in JSON of list (in place).
+        '''
+        interner = self.__interners.get(names)
+        if interner is not None:
+            return interner
+
+        source = ["def intern_items(items):", "    for x in items:"]
+        for name in self.check(names):
+            spec = self.fields[name]
+            if isinstance(spec, Nested):
+                raise WrongType(f"nested field {name} of {self.owner} can't be interned")
+            value = f"x{access(spec)}"
+            source.append("        try:")
+            source.append(f"            if type({value}) is str: {value} = intern({value})")
+            source.append("        except MISSING: pass")
+        if not names:
+            source.append("        pass")
+        namespace: dict[str, Any] = {"MISSING": MISSING, "intern": intern}
+        exec(compile("\n".join(source), f"<{self.owner} interner>", "exec"), namespace)
+
+        interner = self.__interners[names] = namespace["intern_items"]
+        return interner
+
+    @staticmethod
+    def __source(index: int, spec: str | Nested, namespace: dict[str, Any]) -> str:
+        if not isinstance(spec, Nested):
+            value = f"x{access(spec)}"
+            return (
+                f"def get_{index}(x):\n"
+                f"    try: return {value}\n"
+                f"    except MISSING: return None\n"
+                f"def column_{index}(items):\n"
+                f"    values = []\n"
+                f"    append = values.append\n"
+                f"    for x in items or ():\n"
+                f"        try: append({value})\n"
+                f"        except MISSING: append(None)\n"
+                f"    return values\n"
+            )
+
+        namespace[f"make_{index}"] = spec.make
+        namespace[f"empty_{index}"] = spec.empty
+        value = f"x{access(spec.path)}"
+        getter = (
+            f"def get_{index}(x):\n"
+            f"    try: return make_{index}({value})\n"
+            f"    except MISSING: return empty_{index}()\n"
+            f"def raw_{index}(x):\n"
+            f"    try: return {value}\n"
+            f"    except MISSING: return None\n"
+        )
+        if spec.column is None:
+            return getter + (
+                f"def column_{index}(items):\n"
+                f"    values = []\n"
+                f"    append = values.append\n"
+                f"    for x in items or ():\n"
+                f"        try: append(make_{index}({value}))\n"
+                f"        except MISSING: append(None)\n"
+                f"    return values\n"
+            )
+
+        namespace[f"many_{index}"] = spec.column
+        return getter + (
+            f"def column_{index}(items):\n"
+            f"    values = []\n"
+            f"    append = values.append\n"
+            f"    for x in items or ():\n"
+            f"        try: append({value})\n"
+            f"        except MISSING: append(None)\n"
+            f"    return many_{index}(values)\n"
+        )
+
+class LazyObject:
+    '''
+        Base of objects that parse fields from JSON only when you read them.
+
+        Subclasses define `FIELDS`: {attribute: "path.in.json" or `Nested`}.
+        First read of attribute resolves it and saves it in object,
+        so every field is parsed at most once and unread fields cost nothing.
+
+        If JSON is not kept (see `set_retain_raw`), all fields are parsed right away
+        and JSON is dropped.
+    '''
+    FIELDS: dict[str, str | Nested] = {}
+    __schema: Schema
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__schema = Schema.of(cls.FIELDS, cls.__name__)
+
+    def __init__(self, data):
+        values = self.__dict__
+        values["json"] = data
+        settings = current_settings()
+        if settings is not None:
+            # nested objects that are made on read follow same settings
+            values["_settings"] = settings
+        if not retains_raw():
+            self.__drop_raw(values)
+
+    def __drop_raw(self, values: dict):
+        # fields that are missing would be same without JSON, so they are left
+        # to be resolved on read (from nothing) and don't take memory now
+        data = values.pop("json")
+        if not data:
+            return
+        schema = type(self).__schema
+        for name, getter in schema.getters.items():
+            if name not in values and schema.raws[name](data) is not None:
+                values[name] = getter(data)
+
+    def __getattr__(self, name: str) -> Any:
+        # called only if attribute was not read (or set) before
+        if name == "json":
+            raise RawNotRetained(f"JSON of {type(self).__name__} was dropped after parsing (retain_raw=False)")
+        schema = type(self).__schema
+        getter = schema.getters.get(name)
+        if getter is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+
+        values = self.__dict__
+        settings = values.get("_settings")
+        if settings is None or name not in schema.nested:
+            value = values[name] = getter(values.get("json"))
+            return value
+        with parse_settings(*settings):
+            value = values[name] = getter(values.get("json"))
+        return value
+
+    def raw(self) -> Any:
+        '''
+            JSON object was made from, raises `RawNotRetained` if it was dropped (`retain_raw=False`).
+        '''
+        return self.json
+
+    def update(self, data):
+        '''
+            Refresh object with newer JSON of same thing (used by `IdentityMap`).
+
+            Keys of `data` replace old ones, other keys stay. Fields are resolved again on next read.
+        '''
+        values = self.__dict__
+        if "json" in values:
+            known = values["json"]
+            if isinstance(known, dict) and isinstance(data, dict):
+                data = known | data
+            state = {"_settings": values["_settings"]} if "_settings" in values else {}
+        else:
+            # JSON was dropped, so parsed values are all object has: replace only ones that came in `data`
+            raws = type(self).__schema.raws
+            state = {name: value for name, value in values.items() if not (name in raws and raws[name](data) is not None)}
+        state["json"] = data
+        if not retains_raw():
+            self.__drop_raw(state)
+        # new state is swapped in at once, so other threads (handlers in `HandlerPool`) never see it half-updated
+        self.__dict__ = state
+
+    def parse_all(self):
+        '''
+            Resolve all fields now (like objects did before they became lazy).
+        '''
+        values = self.__dict__
+        data = values.get("json")
+        for name, getter in type(self).__schema.getters.items():
+            if name not in values:
+                values[name] = getter(data)
+        return self
+
+class LazyList:
+    '''
+        Base of lists of objects, every field is list with value of every object.
+
+        Subclasses define `FIELDS` (usually same dict as their object has).
+        Like in `LazyObject`, column is made on first read of attribute
+        (or right away, if JSON is not kept, see `set_retain_raw`).
+
+        With `fields` only these columns are made (right away), reading other fields
+        raises AttributeError. Good for bulk crawls that need few fields of many users.
+    '''
+    FIELDS: dict[str, str | Nested] = {}
+    # {field: "int", "float", "bool" or "datetime"} for `to_numpy`, `to_pandas` and `to_arrow`
+    TYPES: dict[str, str] = {}
+    # columns with few different strings, interned if `set_intern_strings(True)`
+    INTERNED: tuple[str, ...] = ()
+    __schema: Schema
+    __fields: frozenset[str] | None = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.__schema = Schema.of(cls.FIELDS, cls.__name__)
+
+    def __init__(self, data, fields: Iterable[str] | None = None):
+        self.json = data
+        settings = current_settings()
+        if settings is not None:
+            # nested objects of columns that are made on read follow same settings
+            self._settings = settings
+        if INTERN_STRINGS and self.INTERNED and data:
+            type(self).__schema.interner(self.INTERNED)(data)
+        if fields is not None:
+            self.project(fields)
+        if not retains_raw():
+            # columns of empty list are empty without JSON too
+            if data:
+                self.parse_all()
+            del self.json
+
+    def __getattr__(self, name: str) -> Any:
+        if name == "json":
+            raise RawNotRetained(f"JSON of {type(self).__name__} was dropped after parsing (retain_raw=False)")
+        column = type(self).__schema.columns.get(name)
+        if column is None:
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        if self.__fields is not None and name not in self.__fields:
+            raise AttributeError(f"'{name}' of {type(self).__name__} was not requested in `fields`")
+
+        values = self.__dict__
+        settings = values.get("_settings")
+        if settings is None or name not in type(self).__schema.nested:
+            value = values[name] = column(values.get("json"))
+            return value
+        with parse_settings(*settings):
+            value = values[name] = column(values.get("json"))
+        return value
+
+    def project(self, fields: Iterable[str]):
+        '''
+            Make only `fields` columns, other fields can't be read after that.
+        '''
+        columns = type(self).__schema.columns
+        fields = frozenset(type(self).__schema.check(fields))
+
+        data = self.__dict__.get("json")
+        values = self.__dict__
+        for name in fields:
+            if name not in values:
+                values[name] = columns[name](data)
+        self.__fields = fields
+        return self
+
+    @classmethod
+    def schema(cls) -> Schema:
+        return cls.__schema
+
+    def available_fields(self) -> tuple[str, ...]:
+        '''
+            Fields that can be read: all, or requested ones if list has `fields`.
+        '''
+        return tuple(name for name in self.__schema.fields if self.__fields is None or name in self.__fields)
+
+    def to_numpy(self, fields: Iterable[str] | None = None) -> dict[str, Any]:
+        '''
+            Columns as NumPy arrays: {field: array}. Needs `numpy`.
+
+            Fields from `TYPES` get their dtypes (int64, float64, bool, datetime64[s]),
+            int columns with missing values are float64 with NaN. Other fields are object arrays.
+            By default all fields except nested objects.
+        '''
+        from .columnar import to_numpy
+        return to_numpy(self, fields)
+
+    def to_pandas(self, fields: Iterable[str] | None = None) -> Any:
+        '''
+            Columns as `pandas.DataFrame`, one row per object. Needs `pandas`.
+
+            Fields from `TYPES` get nullable dtypes (Int64, boolean) and datetime64 in UTC.
+        '''
+        from .columnar import to_pandas
+        return to_pandas(self, fields)
+
+    def to_arrow(self, fields: Iterable[str] | None = None) -> Any:
+        '''
+            Columns as `pyarrow.Table`. Needs `pyarrow`.
+
+            Fields from `TYPES` get arrow types (int64, float64, bool, timestamp in UTC),
+            dicts and lists that arrow can't infer are saved as JSON text.
+        '''
+        from .columnar import to_arrow
+        return to_arrow(self, fields)
+
+    def rows(self, fields: Iterable[str] | None = None) -> Iterator[Record]:
+        '''
+            Iterate over objects of list as rows, instead of zipping columns by hand:
+
+            `for user in users.rows(["userId", "nickname"]): print(user.userId, user.nickname)`
+
+            Args:
+            - fields: Iterable[str] | None = None
+                - fields of rows, by default all fields (or all requested ones, if list has `fields`)
+
+            Rows are made from JSON directly (columns are not made), row of
+            `UserProfileList` has `author`-like nested fields as single objects (`UserProfile`).
+            Needs JSON, so it raises `RawNotRetained` if JSON was dropped (`retain_raw=False`).
+        '''
+        schema = type(self).__schema
+        if fields is None:
+            names = self.available_fields()
+        else:
+            names = schema.check(fields)
+            if self.__fields is not None and not self.__fields.issuperset(names):
+                extra = ", ".join(sorted(set(names) - self.__fields))
+                raise AttributeError(f"{extra} of {type(self).__name__} was not requested in `fields`")
+        return map(schema.record(names), self.json or ())
+
+    def raw(self) -> Any:
+        '''
+            JSON list was made from, raises `RawNotRetained` if it was dropped (`retain_raw=False`).
+        '''
+        return self.json
+
+    def parse_all(self):
+        '''
+            Make all columns now (all requested ones, if list has `fields`).
+        '''
+        data = self.__dict__.get("json")
+        values = self.__dict__
+        for name, column in type(self).__schema.columns.items():
+            if name not in values and (self.__fields is None or name in self.__fields):
+                values[name] = column(data)
+        return self
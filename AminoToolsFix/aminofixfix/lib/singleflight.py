@@ -0,0 +1,130 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from typing import Any, Callable, Awaitable
+from threading import Lock, Event
+from asyncio import Task, get_running_loop, shield
+
+def request_key(url: str, headers: dict) -> tuple:
+    '''
+        Key of GET request: same URL, sent by same account.
+    '''
+    return (url, headers.get("NDCAUTH"), headers.get("AUID"), headers.get("NDCDEVICEID"))
+
+def share_json(response: Any) -> Any:
+    '''
+        Make `response.json()` parse body only once, so everyone who waited
+        for same request gets same parsed result.
+    '''
+    original = getattr(response, "json", None)
+    if original is None:
+        return response
+
+    parsed = []
+    def json(**kwargs):
+        if not parsed:
+            parsed.append(original(**kwargs))
+        return parsed[0]
+
+    response.json = json
+    return response
+
+class _Call:
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self):
+        self.done = Event()
+        self.result = None
+        self.error = None
+        self.followers = 0
+
+class Singleflight:
+    '''
+        Coalescing of identical concurrent GET requests.
+
+        If request with same key is already in flight, caller waits for it
+        and gets same response (and same parsed JSON) instead of sending own request.
+        Works for threads (`do`) and asyncio tasks (`do_async`).
+        Response and its JSON are shared by all waiters, so they should not be changed in place.
+
+        Counters:
+        - requests: int
+            - how much calls went through
+        - deduplicated: int
+            - how much of them didn't send own request
+    '''
+    def __init__(self):
+        self.requests = 0
+        self.deduplicated = 0
+        self.__lock = Lock()
+        self.__calls: dict[tuple, _Call] = {}
+        self.__tasks: dict[tuple, Task] = {}
+        self.__task_followers: dict[tuple, int] = {}
+
+    def stats(self) -> dict[str, int]:
+        return {
+            "requests": self.requests,
+            "deduplicated": self.deduplicated,
+            "in_flight": len(self.__calls) + len(self.__tasks)
+        }
+
+    def do(self, key: tuple, send: Callable[[], Any]) -> Any:
+        '''
+            Call `send()`, or wait for result of same call made by another thread.
+        '''
+        with self.__lock:
+            self.requests += 1
+            call = self.__calls.get(key)
+            leader = call is None
+            if leader:
+                call = self.__calls[key] = _Call()
+            else:
+                call.followers += 1
+                self.deduplicated += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = send()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self.__lock:
+                del self.__calls[key]
+                if call.followers and call.error is None:
+                    share_json(call.result)
+            call.done.set()
+        return call.result
+
+    async def do_async(self, key: tuple, send: Callable[[], Awaitable[Any]]) -> Any:
+        '''
+            Await `send()`, or wait for result of same call made by another task.
+
+            Request runs in its own task, so if the first caller is cancelled,
+            others still get their response.
+        '''
+        key = (id(get_running_loop()),) + key
+        self.requests += 1
+        task = self.__tasks.get(key)
+        if task is not None:
+            self.deduplicated += 1
+            self.__task_followers[key] += 1
+        else:
+            self.__task_followers[key] = 0
+            task = self.__tasks[key] = get_running_loop().create_task(self.__run(key, send))
+        return await shield(task)
+
+    async def __run(self, key: tuple, send: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            result = await send()
+        finally:
+            del self.__tasks[key]
+            followers = self.__task_followers.pop(key)
+        if followers:
+            share_json(result)
+        return result
@@ -0,0 +1,80 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+from time import monotonic
+from contextvars import ContextVar
+from contextlib import contextmanager
+
+from .exceptions import DeadlineExceeded
+
+# moment (time.monotonic) when requests of current thread/task should be finished
+_deadline: ContextVar[float | None] = ContextVar("aminofixfix_deadline", default=None)
+
+@contextmanager
+def deadline(seconds: float | None):
+    '''
+        Set deadline for all requests made inside `with` block
+        (retries and waiting for rate limit included).
+
+        Works for threads and asyncio tasks, nested deadlines can only make it shorter.
+
+        Args:
+        - seconds: float | None
+            - None for no deadline
+    '''
+    if seconds is None:
+        yield
+        return
+
+    expires_at = monotonic() + seconds
+    current = _deadline.get()
+    token = _deadline.set(expires_at if current is None else min(current, expires_at))
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+def remaining(timeout: float | None = None) -> float | None:
+    '''
+        Seconds left for request.
+
+        Args:
+        - timeout: float | None = None
+            - per-call timeout, if it was passed as number
+
+        Returns:
+        - float
+        - None if there is no deadline
+        - raises `DeadlineExceeded` if time is over
+    '''
+    expires_at = _deadline.get()
+    left = None if expires_at is None else expires_at - monotonic()
+    if isinstance(timeout, (int, float)):
+        left = timeout if left is None else min(left, timeout)
+    if left is not None and left <= 0:
+        raise DeadlineExceeded()
+    return left
+
+def timeout_values(timeout) -> tuple[float | None, float | None, float | None, float | None]:
+    '''
+        Get (connect, read, write, pool) from `httpx.Timeout`, number or None.
+    '''
+    if timeout is None:
+        return (None, None, None, None)
+    if isinstance(timeout, (int, float)):
+        return (timeout, timeout, timeout, timeout)
+    return (
+        getattr(timeout, "connect", None),
+        getattr(timeout, "read", None),
+        getattr(timeout, "write", None),
+        getattr(timeout, "pool", None)
+    )
+
+def capped_timeout_values(timeout, limit: float | None) -> tuple[float | None, float | None, float | None, float | None]:
+    '''
+        Same as `timeout_values`, but no value is bigger than `limit`.
+    '''
+    values = timeout_values(timeout)
+    if limit is None:
+        return values
+    return tuple(limit if value is None else min(value, limit) for value in values)
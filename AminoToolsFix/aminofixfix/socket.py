@@ -3,18 +3,29 @@ from __future__ import annotations
 
 import ssl
 import websocket
-from time import sleep
-from random import randint
-from json import loads, dumps
+from time import sleep, monotonic
+from random import randint, random
+from .lib.jsonlib import loads, dumps
 from datetime import datetime as dt
 
-from threading import Thread
-from sys import _getframe as getframe
+from threading import Thread, Lock, Event as ThreadEvent
 
 from .lib import objects, helpers
 from .lib.helpers import gen_deviceId, inttime
+from .lib.schema import parse_settings, client_settings
 
 class SocketHandler:
+	'''
+		Socket of Amino (websocket-client in threads).
+
+		Connection is supervised: every `reconnectTime` seconds or when connection is lost,
+		new connection is opened first, sending is switched to it once it is live,
+		and only after `drainTime` old one is closed.
+		Messages that came by both connections in this time are handled once, other frames are taken from new one.
+		Failed connects are retried with exponential backoff (up to `backoffMax` seconds).
+		Set `pongTimeout` (seconds) to reconnect also when pong wasn't received for so long,
+		it is off by default, as not every server (or proxy) answers pings.
+	'''
 	def __init__(self, client, socket_trace: bool = False, debug: bool = False):
 		self.socket_url = f"wss://ws{randint(1,4)}.aminoapps.com"
 		self.debug = debug
@@ -24,10 +35,26 @@ class SocketHandler:
 		self.proxies = None
 		self.client = client
 		self.reconnectTime = 600
+		self.pongTimeout: float | None = None
+		self.connectTimeout = 10
+		self.drainTime = 2
+		self.backoffMax = 60
 		self.socket_thread = None
 		self.pingTime = 10
 		self.ping_thread = None
 		self.ping_payload = dumps({"t": 116, "o": {"threadChannelUserInfoList": []}})
+		self.event_thread = None
+		self.reconnect_thread = None
+		self.connected_at = 0.0
+		self.last_pong = 0.0
+		self.failures = 0
+		# while old and new connections are both open: IDs of messages that were already handled
+		# and connection that is replaced
+		self.handover = False
+		self.handover_seen = {}
+		self.handover_from = None
+		self.handover_lock = Lock()
+		self.reconnect_lock = Lock()
 
 		if self.socket_enabled:
 			self.reconnect_thread = Thread(target=self.reconnect_handler)
@@ -53,27 +80,118 @@ class SocketHandler:
 				except:
 					pass
 
+	def reconnect_reason(self) -> str | None:
+		if self.socket_thread is None or not self.socket_thread.is_alive():
+			return "connection is lost"
+		now = monotonic()
+		if self.pongTimeout and now - self.last_pong > self.pongTimeout:
+			return f"no pong for {self.pongTimeout}s"
+		if now - self.connected_at > self.reconnectTime:
+			return "reconnect time"
+		return None
+
 	def reconnect_handler(self):
 		while True:
-			sleep(self.reconnectTime)
-
-			if self.active:
-				self.close()
-				self.socket_log("Reconnecting...")
-				
-				self.run_amino_socket()
-
-	def ws_run_forever(self):
-		self.socket.run_forever(
+			sleep(1)
+			if not self.active:
+				continue
+			reason = self.reconnect_reason()
+			if reason is None:
+				continue
+
+			self.socket_log(f"Reconnecting ({reason})...")
+			if not self.reconnect(only_if_needed=True):
+				# 1, 2, 4... seconds, with jitter so clients don't reconnect all at once
+				delay = min(self.backoffMax, 2 ** min(self.failures - 1, 16)) * (0.5 + random() / 2)
+				self.socket_log(f"Reconnect failed {self.failures} times, next try in {delay:.1f}s", "WARNING")
+				sleep(delay)
+
+	def reconnect(self, only_if_needed: bool = False) -> bool:
+		'''
+			Make-before-break: open new connection, switch to it, then drain and close old one.
+
+			Args:
+			- only_if_needed: bool = False
+				- do nothing (and return True) if connection is healthy once lock is taken
+				- used by `reconnect_handler`, when other reconnect already replaced connection it saw
+		'''
+		with self.reconnect_lock:
+			# socket was closed (`close`) or other reconnect already replaced connection
+			if not self.active or only_if_needed and self.reconnect_reason() is None:
+				return True
+			old_socket, old_thread = self.socket, self.socket_thread
+			with self.handover_lock:
+				self.handover = True
+				self.handover_seen = {}
+				self.handover_from = old_socket
+			try:
+				if not self.connect():
+					return False
+				if old_socket is not None and old_socket.keep_running and old_thread.is_alive():
+					# old connection still delivers frames that were sent before new one was open
+					sleep(self.drainTime)
+				self.close_socket(old_socket)
+				return True
+			finally:
+				with self.handover_lock:
+					self.handover = False
+					self.handover_seen = {}
+					self.handover_from = None
+
+	def ws_run_forever(self, socket):
+		socket.run_forever(
 			sslopt={"cert_reqs": ssl.CERT_NONE},
 			skip_utf8_validation=True,
 			ping_interval=self.pingTime,
 			ping_payload=self.ping_payload
 		)
 
+	def event_handler(self):
+		# handlers of frames from `client.event_queue`, socket thread only fills it
+		queue = self.client.event_queue
+		while True:
+			frame = queue.get()
+			if frame is None:
+				return
+			try:
+				self.client.resolve_frame(frame)
+			except Exception as e:
+				self.handle_error(None, e)
+
 	def handle_message(self, ws, data):
-		self.client.handle_socket_message(data)
-		return
+		queue = self.client.event_queue
+		if self.handover:
+			frame = loads(data)
+			if self.handled_before(ws, frame):
+				return
+			if queue is None:
+				self.client.resolve_frame(frame)
+			else:
+				queue.put(frame)
+			return
+
+		if queue is None:
+			self.client.handle_socket_message(data)
+			return
+		queue.put(loads(data))
+
+	def handled_before(self, ws, frame: dict) -> bool:
+		# same message from old and new connection
+		message = frame["o"].get("chatMessage") if frame.get("t") == 1000 else None
+		key = message.get("messageId") if isinstance(message, dict) else None
+		if key is None:
+			# frames without ID can really repeat (typing and other actions), so they are not compared:
+			# once new connection is live, they are taken only from it
+			return ws is self.handover_from and ws is not self.socket
+		with self.handover_lock:
+			if key in self.handover_seen:
+				return True
+			self.handover_seen[key] = True
+			return False
+
+	def handle_pong(self, ws, data):
+		if ws is self.socket:
+			self.last_pong = monotonic()
 
 	def send(self, data):
 		self.socket_log(f"Sending data: {data}")
@@ -98,149 +216,240 @@ class SocketHandler:
 			"WARNING"
 		)
 
+	def connect(self) -> bool:
+		'''
+			Open new connection and switch to it once it is live. Old one (if any) is not closed.
+		'''
+		if self.client.sid is None:
+			return False
+
+		device = gen_deviceId() if self.client.autoDevice else self.client.device_id
+
+		final = f"{device}|{inttime()}"
+
+		self.headers = {
+			"Accept-Encoding": "gzip, deflate, br",
+			"Connection": "Upgrade",
+			"AUID": self.client.userId,
+			"NDCAUTH": f"sid={self.client.sid}",
+			"NDCLANG": "en",
+			"NDCDEVICEID": device,
+			"NDC-MSG-SIG": helpers.signature(final)
+		}
+
+		self.new_socket_url()
+		opened = ThreadEvent()
+		socket = websocket.WebSocketApp(
+			f"{self.socket_url}/?signbody={final.replace('|', '%7C')}",
+			on_open = lambda ws: opened.set(),
+			on_message = self.handle_message,
+			on_pong = self.handle_pong,
+			header = self.headers,
+			on_error = self.handle_error,
+			on_close = self.handle_close
+		)
+		socket_thread = Thread(target=self.ws_run_forever, args=(socket,))
+		socket_thread.start()
+
+		# wait until it is live, or failed
+		deadline = monotonic() + self.connectTimeout
+		while not opened.wait(0.1):
+			if not socket_thread.is_alive() or monotonic() > deadline:
+				self.failures += 1
+				self.close_socket(socket)
+				return False
+
+		self.socket, self.socket_thread = socket, socket_thread
+		self.connected_at = self.last_pong = monotonic()
+		self.failures = 0
+		self.socket_log(f"Connected to {self.socket_url}")
+		return True
+
 	def run_amino_socket(self):
 		try:
 			if self.client.sid is None:
 				return
 
-			device = gen_deviceId() if self.client.autoDevice else self.client.device_id
-
-			final = f"{device}|{inttime()}"
-
-			self.headers = {
-				"Accept-Encoding": "gzip, deflate, br",
-				"Connection": "Upgrade",
-				"AUID": self.client.userId,
-				"NDCAUTH": f"sid={self.client.sid}",
-				"NDCLANG": "en",
-				"NDCDEVICEID": device,
-				"NDC-MSG-SIG": helpers.signature(final)
-			}
-
-			self.new_socket_url()
-			self.socket = websocket.WebSocketApp(
-				f"{self.socket_url}/?signbody={final.replace('|', '%7C')}",
-				on_message = self.handle_message,
-				header = self.headers,
-				on_error = self.handle_error,
-				on_close = self.handle_close
-			)
-
-			self.active = True
-			self.socket_thread = Thread(target=self.ws_run_forever)
-			self.socket_thread.start()
+			if self.client.event_queue is not None and self.event_thread is None:
+				self.event_thread = Thread(target=self.event_handler, daemon=True)
+				self.event_thread.start()
 
 			if self.reconnect_thread is None:
 				self.reconnect_thread = Thread(target=self.reconnect_handler)
 				self.reconnect_thread.start()
-			
-			self.socket_log(f"Connected to {self.socket_url}")
+
+			# if it fails, `reconnect_handler` tries again
+			self.active = True
+			self.reconnect()
 		except Exception as e:
 			print(e)
 
-	def close(self):
-		self.active = False
+	def close_socket(self, socket):
+		if socket is None:
+			return
 		try:
-			self.socket.close()
-			self.socket_log(f"Closed {self.socket_url}")
+			# its thread stops by itself and doesn't handle frames anymore
+			socket.close()
+			self.socket_log(f"Closed {socket.url.split('/?')[0]}")
 		except Exception as closeError:
 			self.socket_log(
 				"Can't close connection to {}: {}".format( self.socket_url, str(closeError).replace("\n", " ") ),
 				"ERROR"
 			)
 
+	def close(self):
+		self.active = False
+		# after reconnect that is in progress, so connection it opens is closed too
+		with self.reconnect_lock:
+			self.close_socket(self.socket)
+
 		return
 
+def make_event(data: dict) -> objects.Event:
+	# `message` and its author are parsed only when handler reads them
+	return objects.Event(data).Event
+
+def chat_of(data: dict) -> str | None:
+	# ID of chat of frame, for `HandlerPool`
+	o = data.get("o")
+	if not isinstance(o, dict):
+		return None
+	message = o.get("chatMessage")
+	if isinstance(message, dict):
+		return message.get("threadId")
+	return o.get("threadId")
+
+# key of frame -> event: (t, type, mediaType) for chat messages, (t, actions) for chat actions
+EVENTS = {
+	(1000, 0, 0): "on_text_message",
+	(1000, 0, 100): "on_image_message",
+	(1000, 0, 103): "on_youtube_message",
+	(1000, 1, 0): "on_strike_message",
+	(1000, 2, 110): "on_voice_message",
+	(1000, 3, 113): "on_sticker_message",
+	(1000, 52, 0): "on_voice_chat_not_answered",
+	(1000, 53, 0): "on_voice_chat_not_cancelled",
+	(1000, 54, 0): "on_voice_chat_not_declined",
+	(1000, 55, 0): "on_video_chat_not_answered",
+	(1000, 56, 0): "on_video_chat_not_cancelled",
+	(1000, 57, 0): "on_video_chat_not_declined",
+	(1000, 58, 0): "on_avatar_chat_not_answered",
+	(1000, 59, 0): "on_avatar_chat_not_cancelled",
+	(1000, 60, 0): "on_avatar_chat_not_declined",
+	(1000, 100, 0): "on_delete_message",
+	(1000, 101, 0): "on_group_member_join",
+	(1000, 102, 0): "on_group_member_leave",
+	(1000, 103, 0): "on_chat_invite",
+	(1000, 104, 0): "on_chat_background_changed",
+	(1000, 105, 0): "on_chat_title_changed",
+	(1000, 106, 0): "on_chat_icon_changed",
+	(1000, 107, 0): "on_voice_chat_start",
+	(1000, 108, 0): "on_video_chat_start",
+	(1000, 109, 0): "on_avatar_chat_start",
+	(1000, 110, 0): "on_voice_chat_end",
+	(1000, 111, 0): "on_video_chat_end",
+	(1000, 112, 0): "on_avatar_chat_end",
+	(1000, 113, 0): "on_chat_content_changed",
+	(1000, 114, 0): "on_screen_room_start",
+	(1000, 115, 0): "on_screen_room_end",
+	(1000, 116, 0): "on_chat_host_transfered",
+	(1000, 117, 0): "on_text_message_force_removed",
+	(1000, 118, 0): "on_chat_removed_message",
+	(1000, 119, 0): "on_text_message_removed_by_admin",
+	(1000, 120, 0): "on_chat_tip",
+	(1000, 121, 0): "on_chat_pin_announcement",
+	(1000, 122, 0): "on_voice_chat_permission_open_to_everyone",
+	(1000, 123, 0): "on_voice_chat_permission_invited_and_requested",
+	(1000, 124, 0): "on_voice_chat_permission_invite_only",
+	(1000, 125, 0): "on_chat_view_only_enabled",
+	(1000, 126, 0): "on_chat_view_only_disabled",
+	(1000, 127, 0): "on_chat_unpin_announcement",
+	(1000, 128, 0): "on_chat_tipping_enabled",
+	(1000, 129, 0): "on_chat_tipping_disabled",
+	(1000, 65281, 0): "on_timestamp_message",
+	(1000, 65282, 0): "on_welcome_message",
+	(1000, 65283, 0): "on_invite_message",
+	(304, "Typing"): "on_user_typing_start",
+	(306, "Typing"): "on_user_typing_end"
+}
+
 class Callbacks:
 	def __init__(self, client):
 		self.client = client
 		self.handlers = {}
-
-		self.methods = {
-			304: self._resolve_chat_action_start,
-			306: self._resolve_chat_action_end,
-			1000: self._resolve_chat_message
-		}
-
-		self.chat_methods = {
-			"0:0": self.on_text_message,
-			"0:100": self.on_image_message,
-			"0:103": self.on_youtube_message,
-			"1:0": self.on_strike_message,
-			"2:110": self.on_voice_message,
-			"3:113": self.on_sticker_message,
-			"52:0": self.on_voice_chat_not_answered,
-			"53:0": self.on_voice_chat_not_cancelled,
-			"54:0": self.on_voice_chat_not_declined,
-			"55:0": self.on_video_chat_not_answered,
-			"56:0": self.on_video_chat_not_cancelled,
-			"57:0": self.on_video_chat_not_declined,
-			"58:0": self.on_avatar_chat_not_answered,
-			"59:0": self.on_avatar_chat_not_cancelled,
-			"60:0": self.on_avatar_chat_not_declined,
-			"100:0": self.on_delete_message,
-			"101:0": self.on_group_member_join,
-			"102:0": self.on_group_member_leave,
-			"103:0": self.on_chat_invite,
-			"104:0": self.on_chat_background_changed,
-			"105:0": self.on_chat_title_changed,
-			"106:0": self.on_chat_icon_changed,
-			"107:0": self.on_voice_chat_start,
-			"108:0": self.on_video_chat_start,
-			"109:0": self.on_avatar_chat_start,
-			"110:0": self.on_voice_chat_end,
-			"111:0": self.on_video_chat_end,
-			"112:0": self.on_avatar_chat_end,
-			"113:0": self.on_chat_content_changed,
-			"114:0": self.on_screen_room_start,
-			"115:0": self.on_screen_room_end,
-			"116:0": self.on_chat_host_transfered,
-			"117:0": self.on_text_message_force_removed,
-			"118:0": self.on_chat_removed_message,
-			"119:0": self.on_text_message_removed_by_admin,
-			"120:0": self.on_chat_tip,
-			"121:0": self.on_chat_pin_announcement,
-			"122:0": self.on_voice_chat_permission_open_to_everyone,
-			"123:0": self.on_voice_chat_permission_invited_and_requested,
-			"124:0": self.on_voice_chat_permission_invite_only,
-			"125:0": self.on_chat_view_only_enabled,
-			"126:0": self.on_chat_view_only_disabled,
-			"127:0": self.on_chat_unpin_announcement,
-			"128:0": self.on_chat_tipping_enabled,
-			"129:0": self.on_chat_tipping_disabled,
-			"65281:0": self.on_timestamp_message,
-			"65282:0": self.on_welcome_message,
-			"65283:0": self.on_invite_message
-		}
-
-		self.chat_actions_start = {
-			"Typing": self.on_user_typing_start,
-		}
-
-		self.chat_actions_end = {
-			"Typing": self.on_user_typing_end,
-		}
-
-	def _resolve_chat_message(self, data):
-		key = f"{data['o']['chatMessage']['type']}:{data['o']['chatMessage'].get('mediaType', 0)}"
-		return self.chat_methods.get(key, self.default)(data)
-
-	def _resolve_chat_action_start(self, data):
-		key = data['o'].get('actions', 0)
-		return self.chat_actions_start.get(key, self.default)(data)
-
-	def _resolve_chat_action_end(self, data):
-		key = data['o'].get('actions', 0)
-		return self.chat_actions_end.get(key, self.default)(data)
+		# key of frame -> (make, handlers), only for events that have handlers
+		self.dispatch = {}
+		self.default_handlers = ()
+		self.rebuild_dispatch()
+
+	def rebuild_dispatch(self):
+		'''
+			Make table of events that have handlers. It is done on registration, not on every frame.
+			Call it if you changed `handlers` by hand.
+		'''
+		dispatch = {}
+		for key, name in EVENTS.items():
+			if getattr(type(self), name) is not getattr(Callbacks, name):
+				# on_* of subclass gets whole frame, like before
+				dispatch[key] = (None, (getattr(self, name),))
+			elif self.handlers.get(name):
+				dispatch[key] = (make_event, tuple(self.handlers[name]))
+		self.dispatch = dispatch
+
+		if type(self).default is not Callbacks.default:
+			self.default_handlers = (self.default,)
+		else:
+			self.default_handlers = tuple(self.handlers.get("default", ()))
 
 	def resolve(self, data):
-		data = loads(data)
-		return self.methods.get(data["t"], self.default)(data)
-
-	def call(self, type, data):
-		if type in self.handlers:
-			for handler in self.handlers[type]:
-				handler(data)
+		self.resolve_frame(loads(data))
+
+	def resolve_frame(self, data: dict):
+		t = data["t"]
+		if t == 1000:
+			message = data["o"]["chatMessage"]
+			key = (1000, message["type"], message.get("mediaType", 0))
+		elif t == 304 or t == 306:
+			key = (t, data["o"].get("actions", 0))
+		else:
+			key = None
+
+		entry = self.dispatch.get(key)
+		if entry is not None:
+			make, handlers = entry
+		elif key not in EVENTS and self.default_handlers:
+			make, handlers = None, self.default_handlers
+		else:
+			return
+
+		pool = self.client.handler_pool
+		if pool is None:
+			self.handle_event(make, handlers, data)
+		else:
+			# events of one chat stay in order, different chats are handled in parallel
+			pool.submit(chat_of(data), self.handle_event, make, handlers, data, on_error=self.handler_error)
+
+	def handler_error(self, error: Exception):
+		# error of handler in `HandlerPool` is reported like one in socket thread
+		self.client.handle_error(None, error)
+
+	def handle_event(self, make, handlers, data):
+		# events (and objects that handlers make) follow settings of client
+		with parse_settings(*client_settings(self.client)):
+			# event is made only if someone listens for it
+			self.run_handlers(handlers, data if make is None else make(data["o"]))
+
+	def run_handlers(self, handlers, data):
+		for handler in handlers:
+			handler(data)
+
+	def call(self, type, data, make=None):
+		handlers = self.handlers.get(type)
+		if not handlers:
+			return
+		if make is not None:
+			data = make(data)
+		self.run_handlers(handlers, data)
 
 	def event(self, type):
 		def registerHandler(handler):
@@ -248,60 +457,61 @@ class Callbacks:
 				self.handlers[type].append(handler)
 			else:
 				self.handlers[type] = [handler]
+			self.rebuild_dispatch()
 			return handler
 
 		return registerHandler
 
-	def on_text_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_image_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_youtube_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_strike_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_sticker_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_video_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_video_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_video_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_avatar_chat_not_answered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_avatar_chat_not_cancelled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_avatar_chat_not_declined(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_delete_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_group_member_join(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_group_member_leave(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_invite(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_background_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_title_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_icon_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_video_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_avatar_chat_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_video_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_avatar_chat_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_content_changed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_screen_room_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_screen_room_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_host_transfered(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_text_message_force_removed(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_removed_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_text_message_removed_by_admin(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_tip(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_pin_announcement(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_permission_open_to_everyone(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_permission_invited_and_requested(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_voice_chat_permission_invite_only(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_view_only_enabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_view_only_disabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_unpin_announcement(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_tipping_enabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_chat_tipping_disabled(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_timestamp_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_welcome_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_invite_message(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-
-	def on_user_typing_start(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-	def on_user_typing_end(self, data): self.call(getframe(0).f_code.co_name, objects.Event(data["o"]).Event)
-
-	def default(self, data): self.call(getframe(0).f_code.co_name, data)
+	def on_text_message(self, data): self.call("on_text_message", data["o"], make_event)
+	def on_image_message(self, data): self.call("on_image_message", data["o"], make_event)
+	def on_youtube_message(self, data): self.call("on_youtube_message", data["o"], make_event)
+	def on_strike_message(self, data): self.call("on_strike_message", data["o"], make_event)
+	def on_voice_message(self, data): self.call("on_voice_message", data["o"], make_event)
+	def on_sticker_message(self, data): self.call("on_sticker_message", data["o"], make_event)
+	def on_voice_chat_not_answered(self, data): self.call("on_voice_chat_not_answered", data["o"], make_event)
+	def on_voice_chat_not_cancelled(self, data): self.call("on_voice_chat_not_cancelled", data["o"], make_event)
+	def on_voice_chat_not_declined(self, data): self.call("on_voice_chat_not_declined", data["o"], make_event)
+	def on_video_chat_not_answered(self, data): self.call("on_video_chat_not_answered", data["o"], make_event)
+	def on_video_chat_not_cancelled(self, data): self.call("on_video_chat_not_cancelled", data["o"], make_event)
+	def on_video_chat_not_declined(self, data): self.call("on_video_chat_not_declined", data["o"], make_event)
+	def on_avatar_chat_not_answered(self, data): self.call("on_avatar_chat_not_answered", data["o"], make_event)
+	def on_avatar_chat_not_cancelled(self, data): self.call("on_avatar_chat_not_cancelled", data["o"], make_event)
+	def on_avatar_chat_not_declined(self, data): self.call("on_avatar_chat_not_declined", data["o"], make_event)
+	def on_delete_message(self, data): self.call("on_delete_message", data["o"], make_event)
+	def on_group_member_join(self, data): self.call("on_group_member_join", data["o"], make_event)
+	def on_group_member_leave(self, data): self.call("on_group_member_leave", data["o"], make_event)
+	def on_chat_invite(self, data): self.call("on_chat_invite", data["o"], make_event)
+	def on_chat_background_changed(self, data): self.call("on_chat_background_changed", data["o"], make_event)
+	def on_chat_title_changed(self, data): self.call("on_chat_title_changed", data["o"], make_event)
+	def on_chat_icon_changed(self, data): self.call("on_chat_icon_changed", data["o"], make_event)
+	def on_voice_chat_start(self, data): self.call("on_voice_chat_start", data["o"], make_event)
+	def on_video_chat_start(self, data): self.call("on_video_chat_start", data["o"], make_event)
+	def on_avatar_chat_start(self, data): self.call("on_avatar_chat_start", data["o"], make_event)
+	def on_voice_chat_end(self, data): self.call("on_voice_chat_end", data["o"], make_event)
+	def on_video_chat_end(self, data): self.call("on_video_chat_end", data["o"], make_event)
+	def on_avatar_chat_end(self, data): self.call("on_avatar_chat_end", data["o"], make_event)
+	def on_chat_content_changed(self, data): self.call("on_chat_content_changed", data["o"], make_event)
+	def on_screen_room_start(self, data): self.call("on_screen_room_start", data["o"], make_event)
+	def on_screen_room_end(self, data): self.call("on_screen_room_end", data["o"], make_event)
+	def on_chat_host_transfered(self, data): self.call("on_chat_host_transfered", data["o"], make_event)
+	def on_text_message_force_removed(self, data): self.call("on_text_message_force_removed", data["o"], make_event)
+	def on_chat_removed_message(self, data): self.call("on_chat_removed_message", data["o"], make_event)
+	def on_text_message_removed_by_admin(self, data): self.call("on_text_message_removed_by_admin", data["o"], make_event)
+	def on_chat_tip(self, data): self.call("on_chat_tip", data["o"], make_event)
+	def on_chat_pin_announcement(self, data): self.call("on_chat_pin_announcement", data["o"], make_event)
+	def on_voice_chat_permission_open_to_everyone(self, data): self.call("on_voice_chat_permission_open_to_everyone", data["o"], make_event)
+	def on_voice_chat_permission_invited_and_requested(self, data): self.call("on_voice_chat_permission_invited_and_requested", data["o"], make_event)
+	def on_voice_chat_permission_invite_only(self, data): self.call("on_voice_chat_permission_invite_only", data["o"], make_event)
+	def on_chat_view_only_enabled(self, data): self.call("on_chat_view_only_enabled", data["o"], make_event)
+	def on_chat_view_only_disabled(self, data): self.call("on_chat_view_only_disabled", data["o"], make_event)
+	def on_chat_unpin_announcement(self, data): self.call("on_chat_unpin_announcement", data["o"], make_event)
+	def on_chat_tipping_enabled(self, data): self.call("on_chat_tipping_enabled", data["o"], make_event)
+	def on_chat_tipping_disabled(self, data): self.call("on_chat_tipping_disabled", data["o"], make_event)
+	def on_timestamp_message(self, data): self.call("on_timestamp_message", data["o"], make_event)
+	def on_welcome_message(self, data): self.call("on_welcome_message", data["o"], make_event)
+	def on_invite_message(self, data): self.call("on_invite_message", data["o"], make_event)
+
+	def on_user_typing_start(self, data): self.call("on_user_typing_start", data["o"], make_event)
+	def on_user_typing_end(self, data): self.call("on_user_typing_end", data["o"], make_event)
+
+	def default(self, data): self.call("default", data)
@@ -0,0 +1,85 @@
+'''
+    Events per second through `Callbacks.resolve` (socket frame -> handlers).
+
+    Frames are mix of busy public chat: typing, text messages, joins, tips and
+    frames with unknown `t`, or frames recorded from socket (one JSON frame per line).
+    Handlers do nothing, so only dispatch (and making events) is measured.
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.dispatch [--frames 100000] [--recorded frames.jsonl]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import json
+import argparse
+from time import perf_counter
+
+from aminofixfix.socket import Callbacks
+from benchmarks.mock_api import fake_message
+
+class StandInClient:
+    retain_raw = None
+    identity_map = None
+    handler_pool = None
+    event_queue = None
+
+def chat_frame(type: int, mediaType: int, i: int) -> str:
+    message = fake_message("chat", f"message-{i}", 20)
+    message["type"] = type
+    message["mediaType"] = mediaType
+    return json.dumps({"t": 1000, "o": {"ndcId": 1, "chatMessage": message}})
+
+def mock_frames(count: int) -> list[str]:
+    # typing is most of traffic of public chat
+    pattern = (
+        [json.dumps({"t": 304, "o": {"actions": "Typing", "ndcId": 1, "threadId": "chat"}})] * 4
+        + [json.dumps({"t": 306, "o": {"actions": "Typing", "ndcId": 1, "threadId": "chat"}})] * 4
+        + [chat_frame(0, 0, 0), chat_frame(0, 0, 1), chat_frame(101, 0, 2), chat_frame(120, 0, 3)]
+        + [json.dumps({"t": 201, "o": {"ndcId": 1}})]
+    )
+    return [pattern[i % len(pattern)] for i in range(count)]
+
+SUBSCRIPTIONS = {
+    "no handlers": (),
+    "on_text_message": ("on_text_message",),
+    "text, join, typing": ("on_text_message", "on_group_member_join", "on_user_typing_start", "on_user_typing_end"),
+    "default only": ("default",)
+}
+
+def measure(frames: list[str], events: tuple[str, ...], rounds: int) -> float:
+    '''
+        Frames per second, best of `rounds`.
+    '''
+    callbacks = Callbacks(StandInClient())
+    for name in events:
+        callbacks.event(name)(lambda data: None)
+
+    best = float("inf")
+    for _ in range(rounds):
+        started = perf_counter()
+        for frame in frames:
+            callbacks.resolve(frame)
+        best = min(best, perf_counter() - started)
+    return len(frames) / best
+
+def main():
+    parser = argparse.ArgumentParser(description="Dispatch speed of socket callbacks.")
+    parser.add_argument("--frames", type=int, default=100_000, help="mock frames per round")
+    parser.add_argument("--rounds", type=int, default=5, help="rounds, best one is shown")
+    parser.add_argument("--recorded", help="file with recorded frames (one JSON per line) instead of mock")
+    args = parser.parse_args()
+
+    if args.recorded:
+        with open(args.recorded) as file:
+            frames = [line.strip() for line in file if line.strip()]
+    else:
+        frames = mock_frames(args.frames)
+
+    print(f"{len(frames)} frames")
+    print("{:<20} | {:>14}".format("subscribed", "events/sec"))
+    for name, events in SUBSCRIPTIONS.items():
+        print("{:<20} | {:>14,.0f}".format(name, measure(frames, events, args.rounds)))
+
+if __name__ == "__main__":
+    main()
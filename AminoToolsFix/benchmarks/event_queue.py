@@ -0,0 +1,75 @@
+'''
+    Raid-level burst through `EventQueue` with every policy.
+
+    Socket side puts `--rate` frames per second for `--seconds` (mostly typing, like
+    raid in public chat), handler of text messages takes `--handler` seconds, so
+    handlers can't keep up. Shown: frames dropped (all and text messages), frames that
+    had to wait for room and longest time frame spent in queue (how far bot is behind).
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.event_queue [--rate 3000] [--seconds 2] [--maxsize 500] [--handler 0.005]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import argparse
+from threading import Thread
+from time import perf_counter, sleep
+
+from aminofixfix.socket import Callbacks
+from aminofixfix.lib import EventQueue, jsonlib
+from aminofixfix.lib.event_queue import POLICIES
+from benchmarks.dispatch import StandInClient, mock_frames
+
+def measure(frames: list[dict], rate: float, maxsize: int, policy: str, handler: float) -> tuple[dict, int, float]:
+    '''
+        Stats of queue, text messages that were dropped, time to handle whole burst.
+    '''
+    queue = EventQueue(maxsize, policy)
+    callbacks = Callbacks(StandInClient())
+    texts = 0
+
+    @callbacks.event("on_text_message")
+    def on_text_message(event):
+        nonlocal texts
+        texts += 1
+        sleep(handler)
+
+    def handle():
+        while (frame := queue.get()) is not None:
+            callbacks.resolve_frame(frame)
+
+    thread = Thread(target=handle)
+    thread.start()
+    started = perf_counter()
+    for i, frame in enumerate(frames):
+        wait = started + i / rate - perf_counter()
+        if wait > 0:
+            sleep(wait)
+        queue.put(frame)
+    queue.close()
+    thread.join()
+    sent = sum(1 for frame in frames if frame["t"] == 1000 and frame["o"]["chatMessage"]["type"] == 0)
+    return queue.stats(), sent - texts, perf_counter() - started
+
+def main():
+    parser = argparse.ArgumentParser(description="Burst of frames through EventQueue policies.")
+    parser.add_argument("--rate", type=float, default=3000, help="frames per second from socket")
+    parser.add_argument("--seconds", type=float, default=2, help="length of burst")
+    parser.add_argument("--maxsize", type=int, default=500, help="size of queue")
+    parser.add_argument("--handler", type=float, default=0.005, help="seconds of handler of text message")
+    args = parser.parse_args()
+
+    frames = [jsonlib.loads(frame) for frame in mock_frames(int(args.rate * args.seconds))]
+    print(f"{len(frames)} frames in {args.seconds}s, queue of {args.maxsize}, text handler takes {args.handler}s")
+    print("{:<12} | {:>8} | {:>10} | {:>8} | {:>11} | {:>8}".format(
+        "policy", "dropped", "texts lost", "delayed", "max wait ms", "total s"
+    ))
+    for policy in POLICIES:
+        stats, lost, total = measure(frames, args.rate, args.maxsize, policy, args.handler)
+        print("{:<12} | {:>8} | {:>10} | {:>8} | {:>11.1f} | {:>8.2f}".format(
+            policy, stats["dropped"], lost, stats["delayed"], stats["max_wait"] * 1000, total
+        ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+'''
+    Delay of handlers of socket events when one chat has slow handler
+    (for example, bot that downloads something for every message in that chat).
+
+    Frames of many chats go through `Callbacks.resolve`, messages of first chat take
+    `--slow` seconds to handle, other ones are instant. Frames come with `--rate`
+    per second; delay is time from arrival of frame to start of its handler,
+    shown for chats without slow handler.
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.handler_pool [--frames 2000] [--rate 1000] [--chats 20] [--slow 0.01]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import argparse
+from time import perf_counter, sleep
+
+from aminofixfix.socket import Callbacks
+from aminofixfix.lib import HandlerPool
+from aminofixfix.lib import jsonlib
+from benchmarks.dispatch import StandInClient
+from benchmarks.mock_api import fake_message
+
+def mock_frames(count: int, chats: int) -> list[tuple[str, str]]:
+    '''
+        (messageId, frame) of text messages, chats take turns.
+    '''
+    frames = []
+    for i in range(count):
+        message = fake_message(f"chat-{i % chats}", f"message-{i}", 20)
+        message["type"] = message["mediaType"] = 0
+        frames.append((message["messageId"], jsonlib.dumps({"t": 1000, "o": {"ndcId": 1, "chatMessage": message}})))
+    return frames
+
+def measure(frames: list[tuple[str, str]], rate: float, slow: float, workers: int | None) -> tuple[float, float, float, dict]:
+    '''
+        Wall time of stream, average and max delay of fast chats, stats of pool.
+    '''
+    client = StandInClient()
+    client.handler_pool = HandlerPool(workers) if workers else None
+    callbacks = Callbacks(client)
+    sent = {}
+    delays = []
+
+    @callbacks.event("on_text_message")
+    def on_text_message(event):
+        if event.message.chatId == "chat-0":
+            sleep(slow)
+        else:
+            delays.append(perf_counter() - sent[event.message.messageId])
+
+    started = perf_counter()
+    for i, (messageId, frame) in enumerate(frames):
+        # frame is read from socket when it came, or later if socket thread is busy
+        arrival = started + i / rate
+        wait = arrival - perf_counter()
+        if wait > 0:
+            sleep(wait)
+        sent[messageId] = arrival
+        callbacks.resolve(frame)
+    stats = {}
+    if client.handler_pool:
+        client.handler_pool.close()
+        stats = client.handler_pool.stats()
+    wall = perf_counter() - started
+    return wall, sum(delays) / len(delays), max(delays), stats
+
+def main():
+    parser = argparse.ArgumentParser(description="Delay of handlers with and without HandlerPool.")
+    parser.add_argument("--frames", type=int, default=2000, help="message frames in stream")
+    parser.add_argument("--rate", type=float, default=1000, help="frames per second")
+    parser.add_argument("--chats", type=int, default=20, help="chats in stream")
+    parser.add_argument("--slow", type=float, default=0.01, help="seconds of handler in slow chat")
+    args = parser.parse_args()
+
+    frames = mock_frames(args.frames, args.chats)
+    print(f"{len(frames)} frames from {args.chats} chats ({args.rate:.0f}/s), handler of chat-0 takes {args.slow}s")
+    print("{:<8} | {:>8} | {:>13} | {:>13} | {:>9} | {:>14}".format(
+        "workers", "wall s", "avg delay ms", "max delay ms", "max depth", "p99 handler ms"
+    ))
+    for workers in (None, 2, 4, 8):
+        wall, average, longest, stats = measure(frames, args.rate, args.slow, workers)
+        print("{:<8} | {:>8.2f} | {:>13.2f} | {:>13.2f} | {:>9} | {:>14.3f}".format(
+            str(workers or "socket"), wall, average * 1000, longest * 1000,
+            stats.get("max_depth", "-"), stats.get("latency_p99", 0.0) * 1000
+        ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+'''
+    Many concurrent `get_user_info` calls: one HTTP/2 connection vs HTTP/1.1 keep-alive pool.
+
+    Run from AminoToolsFix folder (needs `h2`):
+        python -m benchmarks.http2 [requests] [server latency in ms]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import sys
+import asyncio
+from time import perf_counter
+
+from benchmarks.stand_in import StandInServer, H2StandInServer
+
+async def run(server: StandInServer | H2StandInServer, http2: bool, total: int) -> float:
+    from aminofixfix.asyncfixfix import Client
+
+    server.trust()
+    client = Client(socket_enabled=False, api=server.url, http2_enabled=http2)
+    client.sid, client.userId = "stand-in", "stand-in"
+    await client.get_user_info("warm-up")
+    server.reset_counters()
+
+    started = perf_counter()
+    await asyncio.gather(*[client.get_user_info(f"user-{i}") for i in range(total)])
+    return perf_counter() - started
+
+def main():
+    total = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    latency = (float(sys.argv[2]) if len(sys.argv) > 2 else 20) / 1000
+
+    print(f"{total} concurrent get_user_info, {latency * 1000:.0f} ms server latency")
+    for http2, server in ((False, StandInServer(tls=True, latency=latency)), (True, H2StandInServer(latency=latency))):
+        server.start()
+        try:
+            elapsed = asyncio.run(run(server, http2, total))
+            print(
+                "{:<8} | {:>3} new connections | {:.3f}s | {:.0f} req/s".format(
+                    "HTTP/2" if http2 else "HTTP/1.1", server.connections, elapsed, total / elapsed
+                )
+            )
+        finally:
+            server.stop()
+
+if __name__ == "__main__":
+    main()
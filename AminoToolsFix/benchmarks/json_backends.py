@@ -0,0 +1,77 @@
+'''
+    Decode and encode time of big answers with every installed JSON backend
+    vs standart library with default settings (how it was before `jsonlib`).
+
+    Payloads are pages of mock `MessageList` and `UserProfileList` answers,
+    decoded from bytes (as they come from network) and encoded back (as request bodies).
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.json_backends [--page 1000] [--rounds 20]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import json
+import argparse
+from time import perf_counter
+
+from aminofixfix.lib import jsonlib
+from benchmarks.mock_api import fake_profile, fake_message
+
+def payloads(size: int, content_size: int) -> dict[str, bytes]:
+    return {
+        "messageList": json.dumps({
+            "messageList": [fake_message("chat", f"message-{i}", content_size) for i in range(size)]
+        }).encode("utf-8"),
+        "userProfileList": json.dumps({
+            "userProfileList": [fake_profile(f"user-{i}", content_size) for i in range(size)]
+        }).encode("utf-8")
+    }
+
+def measure(function, data, rounds: int) -> float:
+    '''
+        Seconds per call, best of `rounds`.
+    '''
+    best = float("inf")
+    for _ in range(rounds):
+        started = perf_counter()
+        function(data)
+        best = min(best, perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Decode and encode time of JSON backends.")
+    parser.add_argument("--page", type=int, default=1000, help="objects per answer")
+    parser.add_argument("--content-size", type=int, default=100, help="length of texts in mock answers")
+    parser.add_argument("--rounds", type=int, default=20, help="calls per case, best one is shown")
+    args = parser.parse_args()
+
+    backends = [("json (old)", json.loads, json.dumps)]
+    for name in jsonlib.BACKENDS:
+        try:
+            dumps, loads = jsonlib.MAKERS[name]()
+        except ImportError:
+            continue
+        backends.append((name, loads, dumps))
+
+    # warm up, first calls are slower
+    for name, loads, dumps in backends:
+        dumps(loads(b'{"a": [1, 2.5, "b"]}'))
+
+    print("{:<15} | {:<10} | {:>9} | {:>9} | {:>9} | {:>7}".format(
+        "payload", "backend", "decode ms", "encode ms", "body KB", "speedup"
+    ))
+    for key, raw in payloads(args.page, args.content_size).items():
+        data = json.loads(raw)
+        baseline = None
+        for name, loads, dumps in backends:
+            decode = measure(loads, raw, args.rounds)
+            encode = measure(dumps, data, args.rounds)
+            baseline = baseline or decode + encode
+            print("{:<15} | {:<10} | {:>9.2f} | {:>9.2f} | {:>9.1f} | {:>6.1f}x".format(
+                key, name, decode * 1000, encode * 1000,
+                len(dumps(data).encode("utf-8")) / 1024, baseline / (decode + encode)
+            ))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+'''
+    Memory of crawled messages kept in memory with and without interning of
+    low-cardinality columns (`set_intern_strings`).
+
+    Crawl is simulated with pages of mock messages from few chats, with few bubbles
+    and avatar frames (like real community). Every case runs in new process, so
+    resident size (max RSS) of one case is not affected by others.
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.memory_interning [--messages 100000] [--page 100]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import gc
+import json
+import argparse
+import resource
+import tracemalloc
+from concurrent.futures import ProcessPoolExecutor
+
+from aminofixfix.lib import set_intern_strings, jsonlib
+from aminofixfix.lib.objects import MessageList
+from benchmarks.mock_api import fake_message
+
+def pages(messages: int, page: int, content_size: int):
+    for start in range(0, messages, page):
+        items = []
+        for i in range(start, min(start + page, messages)):
+            message = fake_message(f"chat-{i // 1000 % 20}", f"message-{i}", content_size)
+            message["chatBubbleId"] = f"bubble-{i % 7}"
+            message["author"] = dict(message["author"], uid=f"user-{i % 500}")
+            message["author"]["avatarFrameId"] = f"frame-{i % 11}"
+            message["author"]["extensions"] = {"defaultBubbleId": f"bubble-{i % 7}", "style": {}}
+            items.append(message)
+        yield json.dumps(items)
+
+def measure(messages: int, page: int, content_size: int, intern: bool) -> tuple[int, int]:
+    '''
+        Bytes that stay allocated after crawl and max RSS of process (KB).
+    '''
+    set_intern_strings(intern)
+    tracemalloc.start()
+    kept = []
+    for text in pages(messages, page, content_size):
+        messages_page = MessageList(jsonlib.loads(text)).MessageList
+        # what usual archiver reads
+        messages_page.chatId, messages_page.chatBubbleId, messages_page.author.avatarFrameId
+        kept.append(messages_page)
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of crawled messages with and without interning.")
+    parser.add_argument("--messages", type=int, default=100_000, help="messages in crawl")
+    parser.add_argument("--page", type=int, default=100, help="messages per page")
+    parser.add_argument("--content-size", type=int, default=20, help="length of texts of messages")
+    args = parser.parse_args()
+
+    print(f"{args.messages} messages kept, pages of {args.page}, JSON backend: {jsonlib.json_backend()}")
+    print("{:<6} | {:>9} | {:>11} | {:>10}".format("intern", "total MB", "bytes/row", "max RSS MB"))
+    for intern in (False, True):
+        # new process for every case
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            size, rss = pool.submit(measure, args.messages, args.page, args.content_size, intern).result()
+        print("{:<6} | {:>9.1f} | {:>11.0f} | {:>10.1f}".format(
+            str(intern), size / 1024 / 1024, size / args.messages, rss / 1024
+        ))
+
+if __name__ == "__main__":
+    main()
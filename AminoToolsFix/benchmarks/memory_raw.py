@@ -0,0 +1,63 @@
+'''
+    Memory of bot that keeps events from socket: objects with JSON vs without (`retain_raw=False`).
+
+    Stream of synthetic chat messages (as socket sends them) is parsed into `Event`
+    objects, every one is kept, handler reads few fields of every event.
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.memory_raw [--messages 100000] [--content-size 50]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import gc
+import json
+import argparse
+import tracemalloc
+from time import perf_counter
+
+from aminofixfix.lib import set_retain_raw
+from aminofixfix.lib.objects import Event
+from benchmarks.mock_api import fake_message
+
+def stream(messages: int, content_size: int):
+    for i in range(messages):
+        message = fake_message(f"chat-{i % 10}", f"message-{i}", content_size)
+        yield json.dumps({"t": 1000, "o": {"ndcId": 1, "alertOption": 1, "membershipStatus": 1, "chatMessage": message}})
+
+def measure(messages: int, content_size: int, retain_raw: bool) -> tuple[int, float]:
+    '''
+        Bytes that stay allocated and seconds of parsing.
+    '''
+    set_retain_raw(retain_raw)
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+    started = perf_counter()
+    for text in stream(messages, content_size):
+        event = Event(json.loads(text)["o"]).Event
+        # what usual handler reads
+        event.message.content, event.message.author.nickname, event.comId
+        kept.append(event)
+    elapsed = perf_counter() - started
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    set_retain_raw(True)
+    return size, elapsed
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of kept events with and without JSON.")
+    parser.add_argument("--messages", type=int, default=100_000, help="messages in stream")
+    parser.add_argument("--content-size", type=int, default=50, help="length of texts of messages")
+    args = parser.parse_args()
+
+    print(f"{args.messages} messages kept")
+    print("{:<18} | {:>9} | {:>17} | {:>7}".format("retain_raw", "total MB", "bytes per message", "seconds"))
+    for retain_raw in (True, False):
+        size, elapsed = measure(args.messages, args.content_size, retain_raw)
+        print("{:<18} | {:>9.1f} | {:>17.0f} | {:>7.2f}".format(str(retain_raw), size / 1024 / 1024, size / args.messages, elapsed))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+'''
+    Memory of crawled users kept in memory: columns of list objects vs rows.
+
+    Crawl is simulated with pages of mock users (decoded JSON of every page is
+    counted too, because list objects keep it in `json`).
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.memory_rows [--users 10000] [--page 100]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import gc
+import json
+import argparse
+import tracemalloc
+
+from aminofixfix.lib.objects import UserProfileList
+from benchmarks.mock_api import fake_profile
+
+# what utils/Users.py saves
+FIELDS = ["userId", "nickname", "level", "reputation", "followersCount", "followingCount"]
+
+LAYOUTS = {
+    "columns, all fields": lambda page: [UserProfileList(page).UserProfileList.parse_all()],
+    "columns, 6 fields": lambda page: [UserProfileList(page, FIELDS).UserProfileList],
+    "rows, all fields": lambda page: list(UserProfileList(page).UserProfileList.rows()),
+    "rows, 6 fields": lambda page: list(UserProfileList(page).UserProfileList.rows(FIELDS))
+}
+
+def measure(pages: list[str], keep) -> int:
+    '''
+        Bytes that stay allocated after crawl.
+    '''
+    gc.collect()
+    tracemalloc.start()
+    kept = []
+    for page in pages:
+        kept.extend(keep(json.loads(page)))
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return size
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of crawled users: columns vs rows.")
+    parser.add_argument("--users", type=int, default=10_000, help="users in crawl")
+    parser.add_argument("--page", type=int, default=100, help="users per page")
+    parser.add_argument("--content-size", type=int, default=100, help="length of bio of users")
+    args = parser.parse_args()
+
+    pages = [
+        json.dumps([fake_profile(f"user-{start + i}", args.content_size) for i in range(min(args.page, args.users - start))])
+        for start in range(0, args.users, args.page)
+    ]
+    print(f"{args.users} users, pages of {args.page}")
+    print("{:<20} | {:>9} | {:>14}".format("layout", "total MB", "bytes per user"))
+    for name, keep in LAYOUTS.items():
+        size = measure(pages, keep)
+        print("{:<20} | {:>9.1f} | {:>14.0f}".format(name, size / 1024 / 1024, size / args.users))
+
+if __name__ == "__main__":
+    main()
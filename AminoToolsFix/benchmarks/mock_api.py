@@ -0,0 +1,174 @@
+'''
+    Fake answers of Amino API for stand-in servers.
+
+    Only hot endpoints are real enough to be parsed by `Client`/`SubClient`,
+    everything else gets `{"api:statuscode": 0}`.
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import re
+import random
+from threading import Lock
+from urllib.parse import urlsplit, parse_qs
+
+OK = {"api:statuscode": 0, "api:message": "OK"}
+TOO_MANY_REQUESTS = {"api:statuscode": 219, "api:message": "Too many requests."}
+
+def fake_profile(uid: str, content_size: int = 100) -> dict:
+    return {
+        "uid": uid,
+        "status": 0,
+        "nickname": f"stand-in {uid}",
+        "icon": f"http://pa1.narvii.com/{uid}.jpg",
+        "content": "x" * content_size,
+        "level": 10,
+        "reputation": 1000,
+        "role": 0,
+        "membersCount": 10,
+        "followingStatus": 0,
+        "onlineStatus": 1,
+        "accountMembershipStatus": 0,
+        "isGlobal": True,
+        "createdTime": "2020-01-01T00:00:00Z",
+        "modifiedTime": "2024-01-01T00:00:00Z",
+        "extensions": {"style": {}, "customTitles": []}
+    }
+
+def fake_message(chatId: str, messageId: str, content_size: int = 100) -> dict:
+    return {
+        "messageId": messageId,
+        "threadId": chatId,
+        "type": 0,
+        "mediaType": 0,
+        "content": "x" * content_size,
+        "clientRefId": 1,
+        "createdTime": "2024-01-01T00:00:00Z",
+        "uid": "author",
+        "author": fake_profile("author", content_size=0),
+        "extensions": {}
+    }
+
+class MockAmino:
+    '''
+        Router with fake data.
+
+        Endpoints:
+        - POST /g/s/auth/login
+        - GET /g/s/user-profile/{uid}, /x{comId}/s/user-profile/{uid}
+        - GET /x{comId}/s/live-layer (online members)
+        - GET/POST .../chat/thread/{chatId}/message
+        - GET /g/s/link-resolution
+    '''
+    def __init__(
+            self,
+            list_size: int = 25,
+            content_size: int = 100,
+            rate_429: float = 0.0,
+            retry_after: float | None = 0,
+            seed: int | None = None
+        ):
+        '''
+            Args:
+            - list_size: int = 25
+                - items in lists (messages, online members), `size` of request can make it smaller
+            - content_size: int = 100
+                - length of texts (bio, messages), to make payloads bigger or smaller
+            - rate_429: float = 0.0
+                - part of requests (0..1) that get 429
+            - retry_after: float | None = 0
+                - `Retry-After` header of 429, None for no header
+        '''
+        self.list_size = list_size
+        self.content_size = content_size
+        self.rate_429 = rate_429
+        self.retry_after = retry_after
+        self.rejected = 0
+        self.__random = random.Random(seed)
+        self.__lock = Lock()
+        self.__routes = [
+            ("POST", re.compile(r"^/g/s/auth/login$"), self.login),
+            ("GET", re.compile(r"/s/user-profile/(?P<uid>[^/]+)$"), self.user_profile),
+            ("GET", re.compile(r"^/x(?P<comId>\d+)/s/live-layer$"), self.online_members),
+            ("GET", re.compile(r"/chat/thread/(?P<chatId>[^/]+)/message$"), self.messages),
+            ("POST", re.compile(r"/chat/thread/(?P<chatId>[^/]+)/message$"), self.send_message),
+            ("GET", re.compile(r"^/g/s/link-resolution$"), self.link_resolution),
+        ]
+
+    def answer(self, method: str, url: str) -> tuple[int, dict, dict]:
+        '''
+            (status, payload, headers) for request.
+        '''
+        if self.rate_429:
+            with self.__lock:
+                rejected = self.__random.random() < self.rate_429
+                if rejected:
+                    self.rejected += 1
+            if rejected:
+                headers = {} if self.retry_after is None else {"Retry-After": str(self.retry_after)}
+                return 429, TOO_MANY_REQUESTS, headers
+
+        parts = urlsplit(url)
+        path = parts.path.split("/api/v1", 1)[-1]
+        query = {name: values[0] for name, values in parse_qs(parts.query).items()}
+        for route_method, pattern, handler in self.__routes:
+            if route_method != method:
+                continue
+            match = pattern.search(path)
+            if match:
+                return 200, OK | handler(query, **match.groupdict()), {}
+        return 200, OK, {}
+
+    def size(self, query: dict) -> int:
+        try:
+            return min(self.list_size, int(query.get("size", self.list_size)))
+        except ValueError:
+            return self.list_size
+
+    def login(self, query: dict) -> dict:
+        profile = fake_profile("stand-in-user", self.content_size)
+        return {
+            "sid": "stand-in-sid",
+            "auid": "stand-in-user",
+            "secret": "0 stand-in",
+            "account": profile,
+            "userProfile": profile
+        }
+
+    def user_profile(self, query: dict, uid: str) -> dict:
+        return {"userProfile": fake_profile(uid, self.content_size)}
+
+    def online_members(self, query: dict, comId: str) -> dict:
+        size = self.size(query)
+        return {
+            "userProfileCount": size,
+            "userProfileList": [fake_profile(f"online-{i}", self.content_size) for i in range(size)]
+        }
+
+    def messages(self, query: dict, chatId: str) -> dict:
+        size = self.size(query)
+        return {
+            "messageList": [fake_message(chatId, f"message-{i}", self.content_size) for i in range(size)],
+            "paging": {"nextPageToken": "next", "prevPageToken": None}
+        }
+
+    def send_message(self, query: dict, chatId: str) -> dict:
+        return {"message": fake_message(chatId, "sent", self.content_size)}
+
+    def link_resolution(self, query: dict) -> dict:
+        code = query.get("q", "")
+        return {
+            "linkInfoV2": {
+                "path": f"x1/user/{code}",
+                "extensions": {
+                    "linkInfo": {
+                        "objectId": f"object-{code}",
+                        "targetCode": 1,
+                        "ndcId": 1,
+                        "fullPath": None,
+                        "shortCode": code,
+                        "objectType": 0
+                    }
+                }
+            }
+        }
@@ -0,0 +1,107 @@
+'''
+    Parse time of one page of objects: every field parsed (like before lazy objects)
+    vs only fields that scripts usually read.
+    Page is parsed as separate objects (`UserProfile`, ...) and as one list object (`UserProfileList`, ...).
+
+    Payloads come from mock of Amino API, or from file with recorded answer of API
+    (JSON with "userProfileList", "threadList", "communityList" and/or "messageList").
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.parse_objects [--page 100] [--rounds 200] [--payload recorded.json]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import json
+import argparse
+from time import perf_counter
+
+from aminofixfix.lib.objects import UserProfile, UserProfileList, Thread, ThreadList, Community, CommunityList, MessageList
+from benchmarks.mock_api import fake_profile, fake_message
+
+# (key of list in API answer, object, fields that are read in "few fields" case)
+KINDS = (
+    ("userProfileList", UserProfile, ("userId", "nickname")),
+    ("threadList", Thread, ("chatId", "title")),
+    ("communityList", Community, ("comId", "name"))
+)
+
+# same, but whole page is one list object
+LISTS = (
+    ("userProfileList", UserProfileList, ("userId", "nickname")),
+    ("threadList", ThreadList, ("chatId", "title")),
+    ("communityList", CommunityList, ("comId", "name")),
+    ("messageList", MessageList, ("messageId", "content"))
+)
+
+def fake_page(size: int, content_size: int) -> dict:
+    profiles = [fake_profile(f"user-{i}", content_size) for i in range(size)]
+    return {
+        "userProfileList": profiles,
+        "threadList": [
+            {
+                "threadId": f"chat-{i}", "title": f"chat {i}", "content": "x" * content_size,
+                "author": profiles[i], "membersSummary": profiles[:5], "membersCount": 5,
+                "extensions": {"bm": [100, "http://pa1.narvii.com/bg.jpg"], "fansOnly": False}
+            } for i in range(size)
+        ],
+        "communityList": [
+            {
+                "ndcId": i, "name": f"community {i}", "content": "x" * content_size,
+                "agent": profiles[i], "membersCount": 1000,
+                "advancedSettings": {"rankingTable": [{"level": 1, "reputation": 0, "id": "1"}]},
+                "themePack": {"themeColor": "#000000"}
+            } for i in range(size)
+        ],
+        "messageList": [fake_message("chat", f"message-{i}", content_size) for i in range(size)]
+    }
+
+def read(obj, fields: tuple | None):
+    if fields is None:
+        obj.parse_all()
+    else:
+        for field in fields:
+            getattr(obj, field)
+
+def measure(items: list, make, fields: tuple | None, rounds: int, one_object: bool = False) -> float:
+    '''
+        Seconds per page, best of `rounds`.
+    '''
+    best = float("inf")
+    for _ in range(rounds):
+        started = perf_counter()
+        if one_object:
+            read(make(items), fields)
+        else:
+            for item in items:
+                read(make(item), fields)
+        best = min(best, perf_counter() - started)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Parse time of aminofixfix objects.")
+    parser.add_argument("--page", type=int, default=100, help="objects per page (mock payloads)")
+    parser.add_argument("--content-size", type=int, default=100, help="length of texts in mock payloads")
+    parser.add_argument("--rounds", type=int, default=200, help="pages parsed, best one is shown")
+    parser.add_argument("--payload", help="recorded answer of API instead of mock")
+    args = parser.parse_args()
+
+    if args.payload:
+        with open(args.payload) as file:
+            page = json.load(file)
+    else:
+        page = fake_page(args.page, args.content_size)
+
+    print("{:<15} | {:>5} | {:>14} | {:>14} | {:>7}".format("object", "items", "all fields ms", "few fields ms", "speedup"))
+    for (key, kind, fields), one_object in [(kind, False) for kind in KINDS] + [(kind, True) for kind in LISTS]:
+        items = page.get(key)
+        if not items:
+            continue
+        eager = measure(items, kind, None, args.rounds, one_object)
+        lazy = measure(items, kind, fields, args.rounds, one_object)
+        print("{:<15} | {:>5} | {:>14.3f} | {:>14.3f} | {:>6.1f}x".format(
+            kind.__name__, len(items), eager * 1000, lazy * 1000, eager / lazy
+        ))
+
+if __name__ == "__main__":
+    main()
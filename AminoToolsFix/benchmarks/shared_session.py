@@ -0,0 +1,50 @@
+'''
+    How much TLS handshakes SubClients make with and without shared connection pool.
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.shared_session [communities] [requests per community]
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import sys
+from time import perf_counter
+
+from benchmarks.stand_in import StandInServer
+
+def run(server: StandInServer, share_session: bool, communities: int, per_community: int) -> tuple[float, int]:
+    from aminofixfix import Client, SubClient
+
+    client = Client(socket_enabled=False, api=server.url)
+    client.sid, client.userId = "stand-in", "stand-in"
+    # one request from main client, like `sub_clients()` in utils/scripts.py
+    client.get_user_info("main")
+    server.reset_counters()
+
+    started = perf_counter()
+    for comId in range(communities):
+        sub = SubClient(mainClient=client, comId=comId, share_session=share_session)
+        for i in range(per_community):
+            sub.get_user_info(f"user-{i}")
+    return perf_counter() - started, server.connections
+
+def main():
+    communities = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    per_community = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    server = StandInServer(tls=True).start()
+    server.trust()
+    try:
+        print(f"{communities} communities, {per_community} requests each, HTTPS stand-in at {server.url}")
+        for share_session in (False, True):
+            elapsed, handshakes = run(server, share_session, communities, per_community)
+            print(
+                "share_session={:<5} | {:>3} TLS handshakes | {:.3f}s | {:.2f} ms/request".format(
+                    str(share_session), handshakes, elapsed, elapsed * 1000 / (communities * per_community)
+                )
+            )
+    finally:
+        server.stop()
+
+if __name__ == "__main__":
+    main()
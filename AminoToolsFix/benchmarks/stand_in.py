@@ -0,0 +1,259 @@
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import os
+import ssl
+import json
+import asyncio
+import subprocess
+from time import sleep
+from shutil import which
+from tempfile import mkdtemp
+from threading import Thread, Lock, Event
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+
+from benchmarks.mock_api import MockAmino
+
+try:
+    from h2.config import H2Configuration
+    from h2.connection import H2Connection
+    from h2.events import RequestReceived, DataReceived, StreamEnded
+except ImportError:
+    H2Connection = None
+
+def make_certificate(folder: str) -> tuple[str, str]:
+    '''
+        Make self-signed certificate for 127.0.0.1 with openssl.
+
+        Returns paths of (certificate, key).
+    '''
+    if which("openssl") is None:
+        raise RuntimeError("You need openssl in PATH to run HTTPS stand-in.")
+
+    cert, key = os.path.join(folder, "cert.pem"), os.path.join(folder, "key.pem")
+    subprocess.run(
+        [
+            "openssl", "req", "-x509", "-newkey", "rsa:2048", "-nodes",
+            "-keyout", key, "-out", cert, "-days", "1",
+            "-subj", "/CN=127.0.0.1", "-addext", "subjectAltName=IP:127.0.0.1"
+        ],
+        check=True, capture_output=True
+    )
+    return cert, key
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def answer(self, status: int, payload: dict, headers: dict | None = None):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.headers.get("Content-Length"):
+            self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.count_request()
+        if self.server.latency:
+            sleep(self.server.latency)
+        self.answer(*self.server.route(self.command, self.path))
+
+    do_POST = do_GET
+    do_DELETE = do_GET
+
+class StandInServer(ThreadingHTTPServer):
+    '''
+        Local HTTP(S) server that pretends to be Amino API.
+
+        Counts accepted connections, so every connection is one TCP (and TLS) handshake.
+    '''
+    daemon_threads = True
+    request_queue_size = 1024
+
+    def __init__(self, tls: bool = True, latency: float = 0.0, handler: type = StandInHandler, api: MockAmino | None = None):
+        ThreadingHTTPServer.__init__(self, ("127.0.0.1", 0), handler)
+        self.tls = tls
+        self.latency = latency
+        self.api = api or MockAmino()
+        self.cert_file = None
+        self.connections = 0
+        self.requests = 0
+        self.__lock = Lock()
+        self.__thread = None
+
+        if tls:
+            self.cert_file, key_file = make_certificate(mkdtemp(prefix="amino-stand-in-"))
+            self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+            self.context.load_cert_chain(self.cert_file, key_file)
+
+    @property
+    def url(self) -> str:
+        return "{}://127.0.0.1:{}/api/v1".format("https" if self.tls else "http", self.server_address[1])
+
+    def process_request(self, request, client_address):
+        with self.__lock:
+            self.connections += 1
+        ThreadingHTTPServer.process_request(self, request, client_address)
+
+    def finish_request(self, request, client_address):
+        # TLS handshake is made in thread of connection, not in thread that accepts them
+        if self.tls:
+            try:
+                request = self.context.wrap_socket(request, server_side=True)
+            except (ssl.SSLError, OSError):
+                return
+        ThreadingHTTPServer.finish_request(self, request, client_address)
+
+    def count_request(self):
+        with self.__lock:
+            self.requests += 1
+
+    def reset_counters(self):
+        with self.__lock:
+            self.connections = 0
+            self.requests = 0
+
+    def route(self, method: str, path: str) -> tuple[int, dict, dict]:
+        '''
+            Answer for request: (status, payload, headers).
+        '''
+        return self.api.answer(method, path)
+
+    def start(self) -> StandInServer:
+        self.__thread = Thread(target=self.serve_forever, daemon=True)
+        self.__thread.start()
+        return self
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+    def trust(self):
+        '''
+            Make HTTPX and requests trust our self-signed certificate (only in this process).
+        '''
+        if self.cert_file:
+            os.environ["SSL_CERT_FILE"] = self.cert_file
+            os.environ["REQUESTS_CA_BUNDLE"] = self.cert_file
+
+class H2StandInServer:
+    '''
+        Local HTTPS server that speaks only HTTP/2 (ALPN "h2"). Needs `h2` library.
+
+        Runs asyncio loop in background thread, every stream is answered concurrently,
+        so latency of many requests in one connection overlaps.
+    '''
+    def __init__(self, latency: float = 0.0, api: MockAmino | None = None):
+        if H2Connection is None:
+            raise RuntimeError("You need `h2` library to run HTTP/2 stand-in: pip install h2")
+
+        self.latency = latency
+        self.api = api or MockAmino()
+        self.connections = 0
+        self.requests = 0
+        self.port = None
+        self.cert_file, key_file = make_certificate(mkdtemp(prefix="amino-stand-in-"))
+        self.context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        self.context.load_cert_chain(self.cert_file, key_file)
+        self.context.set_alpn_protocols(["h2"])
+        self.__loop = asyncio.new_event_loop()
+        self.__server = None
+        self.__thread = None
+        self.__writers: set[asyncio.StreamWriter] = set()
+
+    @property
+    def url(self) -> str:
+        return f"https://127.0.0.1:{self.port}/api/v1"
+
+    def reset_counters(self):
+        self.connections = 0
+        self.requests = 0
+
+    def route(self, method: str, path: str) -> tuple[int, dict, dict]:
+        return self.api.answer(method, path)
+
+    async def __respond(self, connection: H2Connection, writer: asyncio.StreamWriter, stream_id: int, method: str, path: str):
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        status, payload, headers = self.route(method, path)
+        body = json.dumps(payload).encode()
+        connection.send_headers(stream_id, [
+            (":status", str(status)),
+            ("content-type", "application/json"),
+            ("content-length", str(len(body)))
+        ] + [(name.lower(), value) for name, value in headers.items()])
+        connection.send_data(stream_id, body, end_stream=True)
+        writer.write(connection.data_to_send())
+
+    async def __serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        connection = H2Connection(H2Configuration(client_side=False, header_encoding="utf-8"))
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+
+        streams = {}
+        self.__writers.add(writer)
+        try:
+            while True:
+                data = await reader.read(65535)
+                if not data:
+                    break
+                for event in connection.receive_data(data):
+                    if isinstance(event, RequestReceived):
+                        headers = dict(event.headers)
+                        streams[event.stream_id] = (headers[":method"], headers[":path"])
+                    elif isinstance(event, DataReceived):
+                        connection.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                    elif isinstance(event, StreamEnded):
+                        method, path = streams.pop(event.stream_id)
+                        self.__loop.create_task(self.__respond(connection, writer, event.stream_id, method, path))
+                writer.write(connection.data_to_send())
+                await writer.drain()
+        finally:
+            self.__writers.discard(writer)
+            writer.close()
+
+    def start(self) -> H2StandInServer:
+        ready = Event()
+
+        def work():
+            asyncio.set_event_loop(self.__loop)
+            self.__server = self.__loop.run_until_complete(
+                asyncio.start_server(self.__serve, "127.0.0.1", 0, ssl=self.context)
+            )
+            self.port = self.__server.sockets[0].getsockname()[1]
+            ready.set()
+            self.__loop.run_forever()
+            self.__loop.close()
+
+        self.__thread = Thread(target=work, daemon=True)
+        self.__thread.start()
+        ready.wait()
+        return self
+
+    async def __shutdown(self):
+        # connections that client left open are served by tasks: they end once connection is dropped
+        # (aborted, as client that left them won't answer to TLS shutdown)
+        self.__server.close()
+        for writer in list(self.__writers):
+            writer.transport.abort()
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        await asyncio.gather(*tasks, return_exceptions=True)
+        await self.__server.wait_closed()
+
+    def stop(self):
+        asyncio.run_coroutine_threadsafe(self.__shutdown(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+
+    def trust(self):
+        os.environ["SSL_CERT_FILE"] = self.cert_file
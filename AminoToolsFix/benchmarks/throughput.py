@@ -0,0 +1,222 @@
+'''
+    Throughput of every facade against local mock of Amino API:
+    requests per second, p50/p99 latency of one call and memory of process.
+
+    Every facade runs in its own process (clean memory numbers, server doesn't share GIL with client).
+    Workload is mix of hot calls: get_user_info (global and community), get_online_users,
+    get_chat_messages, send_message and get_from_code.
+
+    Run from AminoToolsFix folder:
+        python -m benchmarks.throughput [--requests 2000] [--concurrency 32] [--latency 5] [--rate-429 0.01]
+        python -m benchmarks.throughput --save baseline.json
+        python -m benchmarks.throughput --baseline baseline.json  (exit code 1 on regression)
+'''
+from __future__ import annotations
+# ^ this thing should fix problem for python3.9 and lower(?)
+
+import sys
+import json
+import asyncio
+import argparse
+import subprocess
+from time import perf_counter
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    # windows
+    resource = None
+
+from benchmarks.stand_in import StandInServer
+from benchmarks.mock_api import MockAmino
+
+FACADES = ("httpx-sync", "requests", "httpx-async", "aiohttp")
+COMMUNITY = 1
+CHAT = "stand-in-chat"
+
+def peak_memory_mb() -> float | None:
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on linux, bytes on macos
+    return peak / (1024 * 1024 if sys.platform == "darwin" else 1024)
+
+def percentile(values: list[float], part: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * part))]
+
+def sync_calls(client, sub) -> list:
+    return [
+        lambda i: client.get_user_info(f"user-{i}"),
+        lambda i: sub.get_user_info(f"user-{i}"),
+        lambda i: sub.get_online_users(size=25),
+        lambda i: sub.get_chat_messages(CHAT, size=25),
+        lambda i: sub.send_message(CHAT, message=f"message {i}"),
+        lambda i: client.get_from_code(f"code-{i}")
+    ]
+
+def run_sync(facade: str, url: str, total: int, concurrency: int) -> tuple[list[float], int, float]:
+    from aminofixfix import Client, SubClient
+    from aminofixfix.lib.objects import APILibraries
+
+    client = Client(
+        socket_enabled=False, api=url,
+        api_library=APILibraries.REQUESTS if facade == "requests" else APILibraries.HTTPX
+    )
+    client.login("stand-in@example.com", "password")
+    sub = SubClient(mainClient=client, comId=COMMUNITY)
+    calls = sync_calls(client, sub)
+
+    def one(i: int) -> float | None:
+        started = perf_counter()
+        try:
+            calls[i % len(calls)](i)
+        except Exception:
+            return None
+        return perf_counter() - started
+
+    started = perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        results = list(pool.map(one, range(total)))
+    elapsed = perf_counter() - started
+
+    latencies = [r for r in results if r is not None]
+    errors = len(results) - len(latencies)
+    return latencies, errors, elapsed
+
+async def run_async(facade: str, url: str, total: int, concurrency: int) -> tuple[list[float], int, float]:
+    from aminofixfix.asyncfixfix import Client, SubClient
+    from aminofixfix.lib.objects import APILibraries
+
+    client = Client(
+        socket_enabled=False, api=url,
+        api_library=APILibraries.AIOHTTP if facade == "aiohttp" else APILibraries.HTTPX
+    )
+    await client.login("stand-in@example.com", "password")
+    sub = SubClient(mainClient=client, comId=COMMUNITY)
+    calls = sync_calls(client, sub)
+    slots = asyncio.Semaphore(concurrency)
+
+    async def one(i: int) -> float | None:
+        async with slots:
+            started = perf_counter()
+            try:
+                await calls[i % len(calls)](i)
+            except Exception:
+                return None
+            return perf_counter() - started
+
+    started = perf_counter()
+    results = await asyncio.gather(*[one(i) for i in range(total)])
+    elapsed = perf_counter() - started
+
+    latencies = [r for r in results if r is not None]
+    return latencies, len(results) - len(latencies), elapsed
+
+def worker(facade: str, url: str, total: int, concurrency: int) -> dict:
+    '''
+        Run one facade in this process and return its results.
+    '''
+    if facade in ("httpx-async", "aiohttp"):
+        latencies, errors, elapsed = asyncio.run(run_async(facade, url, total, concurrency))
+    else:
+        latencies, errors, elapsed = run_sync(facade, url, total, concurrency)
+
+    return {
+        "facade": facade,
+        "requests": total,
+        "errors": errors,
+        "rps": len(latencies) / elapsed,
+        "p50_ms": percentile(latencies, 0.5) * 1000 if latencies else None,
+        "p99_ms": percentile(latencies, 0.99) * 1000 if latencies else None,
+        "peak_memory_mb": peak_memory_mb()
+    }
+
+def spawn(facade: str, url: str, args: argparse.Namespace) -> dict:
+    process = subprocess.run(
+        [
+            sys.executable, "-m", "benchmarks.throughput", "--worker", facade, "--url", url,
+            "--requests", str(args.requests), "--concurrency", str(args.concurrency)
+        ],
+        capture_output=True, text=True
+    )
+    if process.returncode != 0:
+        return {"facade": facade, "failed": process.stderr.strip().splitlines()[-1:] or ["unknown error"]}
+    return json.loads(process.stdout.strip().splitlines()[-1])
+
+def report(results: list[dict], baseline: dict[str, dict] | None, tolerance: float) -> bool:
+    '''
+        Print table, returns False if some facade got slower than baseline.
+    '''
+    ok = True
+    print("{:<12} | {:>9} | {:>8} | {:>8} | {:>9} | {:>6}".format("facade", "req/s", "p50 ms", "p99 ms", "memory MB", "errors"))
+    for result in results:
+        if "failed" in result:
+            print("{:<12} | failed: {}".format(result["facade"], result["failed"][0]))
+            continue
+
+        line = "{:<12} | {:>9.0f} | {:>8.2f} | {:>8.2f} | {:>9} | {:>6}".format(
+            result["facade"], result["rps"], result["p50_ms"] or 0, result["p99_ms"] or 0,
+            "n/a" if result["peak_memory_mb"] is None else f"{result['peak_memory_mb']:.1f}",
+            result["errors"]
+        )
+        old = (baseline or {}).get(result["facade"])
+        if old and "rps" in old:
+            change = result["rps"] / old["rps"] - 1
+            line += f" | {change:+.1%} req/s vs baseline"
+            if change < -tolerance:
+                line += " REGRESSION"
+                ok = False
+        print(line)
+    return ok
+
+def main():
+    parser = argparse.ArgumentParser(description="Throughput of aminofixfix facades against local mock of Amino API.")
+    parser.add_argument("--requests", type=int, default=2000, help="calls per facade")
+    parser.add_argument("--concurrency", type=int, default=32, help="calls in flight at once")
+    parser.add_argument("--latency", type=float, default=5, help="latency of server in ms")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="part of requests (0..1) that get 429")
+    parser.add_argument("--list-size", type=int, default=25, help="items in lists (messages, online members)")
+    parser.add_argument("--content-size", type=int, default=100, help="length of texts in payloads")
+    parser.add_argument("--tls", action="store_true", help="use HTTPS stand-in (needs openssl)")
+    parser.add_argument("--facades", default=",".join(FACADES), help="comma separated: " + ", ".join(FACADES))
+    parser.add_argument("--save", help="save results as JSON")
+    parser.add_argument("--baseline", help="compare with saved results")
+    parser.add_argument("--tolerance", type=float, default=0.1, help="allowed drop of req/s vs baseline")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        print(json.dumps(worker(args.worker, args.url, args.requests, args.concurrency)))
+        return
+
+    api = MockAmino(list_size=args.list_size, content_size=args.content_size, rate_429=args.rate_429)
+    server = StandInServer(tls=args.tls, latency=args.latency / 1000, api=api).start()
+    server.trust()
+    try:
+        print(
+            f"{args.requests} calls per facade, {args.concurrency} in flight, {args.latency:.0f} ms latency, "
+            f"{args.rate_429:.0%} of 429, lists of {args.list_size}"
+        )
+        results = [spawn(facade, server.url, args) for facade in args.facades.split(",")]
+    finally:
+        server.stop()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = {result["facade"]: result for result in json.load(file)}
+    ok = report(results, baseline, args.tolerance)
+    if args.rate_429:
+        print(f"server answered 429 to {api.rejected} requests")
+
+    if args.save:
+        with open(args.save, "w") as file:
+            json.dump(results, file, indent=4)
+    if not ok:
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
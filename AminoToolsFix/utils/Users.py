@@ -1,6 +1,9 @@
 from utils.BD import Controller
 from aminofixfix import SubClient as Sclient
 
+# only these fields of users are saved and printed
+USER_FIELDS = ["userId", "nickname", "level", "reputation", "followersCount", "followingCount"]
+
 class Users:
 	def __init__(self, mainClient):
 		self.client = mainClient
@@ -12,14 +15,14 @@ class Users:
 		end = 100
 		request = 1
 		SubClient = Sclient(mainClient=self.client, comId=ComID)
-		Users = SubClient.get_all_users(start=start, size=end)
+		Users = SubClient.get_all_users(start=start, size=end, fields=USER_FIELDS)
 		total_users = Users.userProfileCount
 		CommunityInfo = self.client.get_community_info(ComID)
 		ComName = CommunityInfo.name
 		with Controller() as DataBase:
 			DataBase.createBDForAllUsers()
 			while start < total_users:
-				Users = SubClient.get_all_users(start=start, size=end)
+				Users = SubClient.get_all_users(start=start, size=end, fields=USER_FIELDS)
 				userId = Users.profile.userId
 				nickname = Users.profile.nickname
 				level = Users.profile.level
@@ -60,14 +63,14 @@ following: {followng}
 		end = 100
 		request = 1
 		SubClient = Sclient(mainClient=self.client, comId=ComID)
-		Users = SubClient.get_online_users(start=start, size=end)
+		Users = SubClient.get_online_users(start=start, size=end, fields=USER_FIELDS)
 		total_users = Users.userProfileCount
 		CommunityInfo = self.client.get_community_info(ComID)
 		ComName = CommunityInfo.name
 		with Controller() as DataBase:
 			DataBase.createBDForOnlineUsers()
 			while start < total_users:
-				Users = SubClient.get_online_users(start=start, size=end)
+				Users = SubClient.get_online_users(start=start, size=end, fields=USER_FIELDS)
 				userId = Users.profile.userId
 				nickname = Users.profile.nickname
 				level = Users.profile.level
@@ -110,7 +113,7 @@ following: {followng}
 		UserInfo = SubClient.get_user_info(UserID)
 		total_users = UserInfo.followersCount
 		while start < total_users:
-			Users = SubClient.get_user_followers(UserID, start=start, size=end)
+			Users = SubClient.get_user_followers(UserID, start=start, size=end, fields=USER_FIELDS)
 			userId = Users.userId
 			nickname = Users.nickname
 			level = Users.level
@@ -143,7 +146,7 @@ following: {followng}
 		UserInfo = SubClient.get_user_info(UserID)
 		total_users = UserInfo.followingCount
 		while start < total_users:
-			Users = SubClient.get_user_following(UserID, start=start, size=end)
+			Users = SubClient.get_user_following(UserID, start=start, size=end, fields=USER_FIELDS)
 			userId = Users.userId
 			nickname = Users.nickname
 			level = Users.level
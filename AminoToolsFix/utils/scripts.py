@@ -1,5 +1,6 @@
 import aminofixfix
 from utils.BD import Controller
+from utils.Users import USER_FIELDS
 from utils.logger import Logger
 import time
 class Parse:
@@ -21,7 +22,7 @@ class Parse:
 				CommunityInfo = self.client.get_community_info(ID)
 				ComName = CommunityInfo.name
 				while start < 10_000:
-					Users = subclient.get_all_users(start=start, size=end)
+					Users = subclient.get_all_users(start=start, size=end, fields=USER_FIELDS)
 					userId = Users.profile.userId
 					nickname = Users.profile.nickname
 					level = Users.profile.level